@@ -40,3 +40,16 @@ def ensure_accepts_kwargs(f: Callable, kwarg_name: str):
             concretized_func = partial(concretized_func, *f.args, **f.keywords)
 
         return concretized_func
+
+
+def _call_solver(solver_fn: Callable, A, b, **kwargs):
+    x = solver_fn(A, b, **kwargs)
+
+    # Some solvers return a tuple, some others do not.
+    if isinstance(x, tuple):
+        x, info = x
+        if info is None:
+            info = {}
+    else:
+        info = {}
+    return x, info
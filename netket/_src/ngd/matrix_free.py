@@ -0,0 +1,61 @@
+from collections.abc import Callable
+from functools import partial
+
+import jax.numpy as jnp
+
+from netket.utils.types import Array, DType
+from netket.jax._math import matmul_mixed_precision
+
+
+class GramOperator:
+    """
+    Lazy representation of the Gram matrix :math:`O O^T` of a jacobian, optionally
+    including the projector regularization :math:`\\frac{r}{n}\\mathbf{1}\\mathbf{1}^T`
+    used by the neural tangent kernel, which is only accessed through its products.
+
+    The diagonal shift is not included, and should be handled exactly by the solver.
+    """
+
+    def __init__(self, O: Array, *, proj_reg=None, dtype: DType = None):
+        self.O = O
+        self.proj_reg = proj_reg
+        self.dtype = dtype if dtype is not None else O.dtype
+
+    @property
+    def shape(self):
+        return (self.O.shape[0], self.O.shape[0])
+
+    def __matmul__(self, v: Array) -> Array:
+        w = matmul_mixed_precision(self.O.T, v, dtype=self.dtype)
+        res = matmul_mixed_precision(self.O, w, dtype=self.dtype)
+        if self.proj_reg is not None:
+            n = self.shape[0]
+            res = res + (self.proj_reg / n) * jnp.sum(v, axis=0, keepdims=True)
+        return res
+
+    def to_dense(self) -> Array:
+        matrix = matmul_mixed_precision(self.O, self.O.T, dtype=self.dtype)
+        if self.proj_reg is not None:
+            matrix = matrix + self.proj_reg / matrix.shape[0]
+        return matrix
+
+
+def is_matrix_free_solver(solver_fn: Callable) -> bool:
+    """
+    Returns True if the linear solver only accesses the matrix through its
+    products and treats the diagonal shift exactly, in which case the Gram
+    matrix of the jacobian does not need to be constructed.
+
+    Such solvers, like :func:`~netket.optimizer.solver.nystrom`, declare it with the
+    attribute `matrix_free = True`, which is looked up through partials and
+    wrappers created with :func:`functools.wraps`.
+    """
+    while True:
+        if getattr(solver_fn, "matrix_free", False):
+            return True
+        if isinstance(solver_fn, partial):
+            solver_fn = solver_fn.func
+        elif hasattr(solver_fn, "__wrapped__"):
+            solver_fn = solver_fn.__wrapped__
+        else:
+            return False
@@ -5,10 +5,11 @@ import jax
 import jax.numpy as jnp
 from jax.sharding import PositionalSharding
 
-from netket import jax as nkjax
 from netket.utils.types import Array
 
-from netket._src.ngd.kwargs import ensure_accepts_kwargs
+from netket.jax._math import matmul_mixed_precision
+from netket._src.ngd.kwargs import ensure_accepts_kwargs, _call_solver
+from netket._src.ngd.matrix_free import GramOperator, is_matrix_free_solver
 
 
 @partial(
@@ -16,6 +17,7 @@ from netket._src.ngd.kwargs import ensure_accepts_kwargs
     static_argnames=(
         "solver_fn",
         "mode",
+        "complex_params",
     ),
 )
 def _compute_sr_update(
@@ -28,8 +30,10 @@ def _compute_sr_update(
     proj_reg: float | Array | None = None,
     momentum: float | Array | None = None,
     old_updates: Array | None = None,
-    params_structure,
+    complex_params: bool,
 ):
+    matrix_free = is_matrix_free_solver(solver_fn)
+
     # We concretize the solver function to ensure it accepts the additional argument `dv`.
     # Typically solvers only accept the matrix and the right-hand side.
     solver_fn = ensure_accepts_kwargs(solver_fn, "dv")
@@ -38,28 +42,31 @@ def _compute_sr_update(
         raise ValueError("Not implemented")
 
     # (np, #ns) x (#ns) -> (np) - where the sum over #ns is done automatically
-    F = O_L.T @ dv
-
-    # This does the contraction (np, #ns) x (#ns, np) -> (np, np).
-    matrix = O_L.T @ O_L
-    matrix_side = matrix.shape[-1]  # * it can be ns or 2*ns, depending on mode
+    F = matmul_mixed_precision(O_L.T, dv, dtype=dv.dtype)
 
-    shifted_matrix = jax.lax.add(
-        matrix, diag_shift * jnp.eye(matrix_side, dtype=matrix.dtype)
-    )
-    updates = solver_fn(shifted_matrix, F, dv=dv)
-
-    # Some solvers return a tuple, some others do not.
-    if isinstance(updates, tuple):
-        updates, info = updates
-        if info is None:
-            info = {}
+    if matrix_free:
+        # The solver only needs products with the quantum geometric tensor and
+        # treats the diagonal shift exactly, so the (np, np) matrix is never built.
+        updates, info = _call_solver(
+            solver_fn,
+            GramOperator(O_L.T, dtype=dv.dtype),
+            F,
+            diag_shift=diag_shift,
+            dv=dv,
+        )
     else:
-        info = {}
+        # This does the contraction (np, #ns) x (#ns, np) -> (np, np).
+        matrix = matmul_mixed_precision(O_L.T, O_L, dtype=dv.dtype)
+        matrix_side = matrix.shape[-1]  # * it can be ns or 2*ns, depending on mode
+
+        shifted_matrix = jax.lax.add(
+            matrix, diag_shift * jnp.eye(matrix_side, dtype=matrix.dtype)
+        )
+        updates, info = _call_solver(solver_fn, shifted_matrix, F, dv=dv)
 
     # If complex mode and we have complex parameters, we need
     # To repack the real coefficients in order to get complex updates
-    if mode == "complex" and nkjax.tree_leaf_iscomplex(params_structure):
+    if mode == "complex" and complex_params:
         num_p = updates.shape[-1] // 2
         updates = updates[:num_p] + 1j * updates[num_p:]
 
@@ -7,7 +7,7 @@ from jax.flatten_util import ravel_pytree
 
 import netket.jax as nkjax
 from netket.utils import timing
-from netket.utils.types import Array, PyTree
+from netket.utils.types import Array, DType, PyTree
 
 from netket._src.ngd.sr import _compute_sr_update
 from netket._src.ngd.srt import _compute_srt_update
@@ -42,7 +42,7 @@ def _prepare_input(
     local_grad = local_grad.flatten()
     de = local_grad - jnp.mean(local_grad)
 
-    O_L = O_L / jnp.sqrt(N_mc)
+    O_L = O_L / jnp.sqrt(N_mc).astype(O_L.dtype)
     dv = 2.0 * de / jnp.sqrt(N_mc)
 
     if mode == "complex":
@@ -69,6 +69,7 @@ def _prepare_input(
         "mode",
         "chunk_size",
         "use_ntk",
+        "jacobian_dtype",
     ),
 )
 def _sr_srt_common(
@@ -86,6 +87,7 @@ def _sr_srt_common(
     old_updates: PyTree | None = None,
     chunk_size: int | None = None,
     use_ntk: bool = False,
+    jacobian_dtype: DType | None = None,
 ):
     r"""
     Compute the SR/Natural gradient update for the model specified by
@@ -103,14 +105,14 @@ def _sr_srt_common(
         momentum: Momentum used to accumulate updates in SPRING.
         linear_solver_fn: Callable to solve the linear problem associated to the updates of the parameters.
         mode: The mode used to compute the jacobian of the variational state. Can be `'real'` or `'complex'` (defaults to the dtype of the output of the model).
+        jacobian_dtype: If specified, the jacobian is computed and stored in this (lower) precision, while
+            the products with it are accumulated and the linear system is solved in the precision of the
+            local energies.
 
     Returns:
         The new parameters, the old updates, and the info dictionary.
     """
     _, unravel_params_fn = ravel_pytree(parameters)
-    _params_structure = jax.tree_util.tree_map(
-        lambda x: jax.ShapeDtypeStruct(x.shape, x.dtype), parameters
-    )
 
     jacobians = nkjax.jacobian(
         log_psi,
@@ -121,12 +123,13 @@ def _sr_srt_common(
         dense=True,
         center=True,
         chunk_size=chunk_size,
+        dtype=jacobian_dtype,
     )  # jacobian is centered
 
     O_L, dv = _prepare_input(jacobians, local_grad, mode=mode)
 
     if old_updates is None and momentum is not None:
-        old_updates = jnp.zeros(jacobians.shape[-1], dtype=jacobians.dtype)
+        old_updates = jnp.zeros(jacobians.shape[-1], dtype=dv.dtype)
 
     compute_update = _compute_srt_update if use_ntk else _compute_sr_update
 
@@ -142,7 +145,7 @@ def _sr_srt_common(
         proj_reg=proj_reg,
         momentum=momentum,
         old_updates=old_updates,
-        params_structure=_params_structure,
+        complex_params=nkjax.tree_leaf_iscomplex(parameters),
     )
 
     return unravel_params_fn(updates), old_updates, info
@@ -9,6 +9,9 @@ from netket import jax as nkjax
 from netket import config
 from netket.utils import timing
 from netket.utils.types import Array
+from netket.jax._math import matmul_mixed_precision
+from netket._src.ngd.kwargs import _call_solver
+from netket._src.ngd.matrix_free import GramOperator, is_matrix_free_solver
 
 
 @timing.timed
@@ -17,6 +20,7 @@ from netket.utils.types import Array
     static_argnames=(
         "solver_fn",
         "mode",
+        "complex_params",
     ),
 )
 def _compute_srt_update(
@@ -29,10 +33,10 @@ def _compute_srt_update(
     proj_reg: float | Array | None = None,
     momentum: float | Array | None = None,
     old_updates: Array | None = None,
-    params_structure,
+    complex_params: bool,
 ):
     if momentum is not None:
-        dv -= momentum * (O_L @ old_updates)
+        dv -= momentum * matmul_mixed_precision(O_L, old_updates, dtype=dv.dtype)
 
     # (#ns, np) -> (ns, #np)
     O_LT = O_L
@@ -46,41 +50,43 @@ def _compute_srt_update(
             dv, PositionalSharding(jax.devices()).replicate()
         )
 
-    # This does the contraction (ns, #np) x (#np, ns) -> (ns, ns).
-    # When using sharding the sum over #ns is done automatically.
-    # When using MPI we need to do it manually with an allreduce_sum.
-    matrix = O_LT @ O_LT.T
-    matrix_side = matrix.shape[-1]  # * it can be ns or 2*ns, depending on mode
-
-    shifted_matrix = jax.lax.add(
-        matrix, diag_shift * jnp.eye(matrix_side, dtype=matrix.dtype)
-    )
-    # replicate
+    if is_matrix_free_solver(solver_fn):
+        # The solver only needs products with the neural tangent kernel and
+        # treats the diagonal shift exactly, so the (ns, ns) matrix is never built.
+        aus_vector, info = _call_solver(
+            solver_fn,
+            GramOperator(O_LT, proj_reg=proj_reg, dtype=dv.dtype),
+            dv,
+            diag_shift=diag_shift,
+        )
+    else:
+        # This does the contraction (ns, #np) x (#np, ns) -> (ns, ns).
+        # When using sharding the sum over #ns is done automatically.
+        # When using MPI we need to do it manually with an allreduce_sum.
+        matrix = matmul_mixed_precision(O_LT, O_LT.T, dtype=dv.dtype)
+        matrix_side = matrix.shape[-1]  # * it can be ns or 2*ns, depending on mode
 
-    if proj_reg is not None:
         shifted_matrix = jax.lax.add(
-            shifted_matrix, jnp.full_like(shifted_matrix, proj_reg / matrix_side)
+            matrix, diag_shift * jnp.eye(matrix_side, dtype=matrix.dtype)
         )
+        # replicate
 
-    aus_vector = solver_fn(shifted_matrix, dv)
+        if proj_reg is not None:
+            shifted_matrix = jax.lax.add(
+                shifted_matrix, jnp.full_like(shifted_matrix, proj_reg / matrix_side)
+            )
 
-    # Some solvers return a tuple, some others do not.
-    if isinstance(aus_vector, tuple):
-        aus_vector, info = aus_vector
-        if info is None:
-            info = {}
-    else:
-        info = {}
+        aus_vector, info = _call_solver(solver_fn, shifted_matrix, dv)
 
     # (np, #ns) x (#ns) -> (np).
-    updates = O_L.T @ aus_vector
+    updates = matmul_mixed_precision(O_L.T, aus_vector, dtype=dv.dtype)
     if momentum is not None:
         updates += momentum * old_updates
         old_updates = updates
 
     # If complex mode and we have complex parameters, we need
     # To repack the real coefficients in order to get complex updates
-    if mode == "complex" and nkjax.tree_leaf_iscomplex(params_structure):
+    if mode == "complex" and complex_params:
         num_p = updates.shape[-1] // 2
         updates = updates[:num_p] + 1j * updates[num_p:]
 
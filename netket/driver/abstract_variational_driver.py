@@ -405,6 +405,16 @@ class AbstractVariationalDriver(abc.ABC):
             for the corresponding operators as leaves.
         """
 
+        # If the driver does not customize the estimation of a single observable,
+        # let the variational state estimate all of them at once, sharing the
+        # evaluation of the connected configurations among them.
+        if type(
+            self
+        )._estimate_stats is AbstractVariationalDriver._estimate_stats and hasattr(
+            self.state, "expect_multiple"
+        ):
+            return self.state.expect_multiple(observables)
+
         # Do not unpack operators, even if they are pytrees!
         # this is necessary to support jax operators.
         return jax.tree_util.tree_map(
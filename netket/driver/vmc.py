@@ -15,15 +15,20 @@
 
 from textwrap import dedent
 
+import jax
+import jax.numpy as jnp
+
 from netket.utils import timing
 from netket.utils.types import PyTree, Optimizer
 from netket.operator import AbstractOperator
-from netket.stats import Stats
+from netket.stats import Stats, statistics
 from netket.optimizer import (
     identity_preconditioner,
     PreconditionerT,
 )
-from netket.vqs import VariationalState
+from netket.optimizer.preconditioner import AbstractLinearPreconditioner
+from netket.optimizer.qgt.qgt_jacobian_dense import QGTJacobianDenseT
+from netket.vqs import VariationalState, MCState, MCMixedState
 from netket.jax import tree_cast
 
 from .abstract_variational_driver import AbstractVariationalDriver
@@ -82,6 +87,7 @@ class VMC(AbstractVariationalDriver):
 
         self._dp: PyTree = None
         self._S = None
+        self._output_is_real: bool | None = None
 
     @property
     def preconditioner(self):
@@ -124,6 +130,25 @@ class VMC(AbstractVariationalDriver):
 
         self.state.reset()
 
+        if self._use_qgt_jacobian_for_grad():
+            # Build the QGT first, and reuse its jacobian to compute the gradient
+            # from the local energies, so that the model is differentiated once.
+            lhs = self.preconditioner.lhs_constructor(self.state, self.step_count)
+            if isinstance(lhs, QGTJacobianDenseT) and (
+                lhs.mode in ("complex", "holomorphic")
+                or (lhs.mode == "real" and self._model_output_is_real())
+            ):
+                local_energies = self.state.local_estimators(self._ham)
+                self._loss_stats = statistics(local_energies)
+                self._loss_grad = lhs.gradient(local_energies)
+            else:
+                self._loss_stats, self._loss_grad = self.state.expect_and_grad(
+                    self._ham
+                )
+            self._dp = self.preconditioner.solve_with_lhs(lhs, self._loss_grad)
+            self._dp = tree_cast(self._dp, self.state.parameters)
+            return self._dp
+
         # Compute the local energy estimator and average Energy
         self._loss_stats, self._loss_grad = self.state.expect_and_grad(self._ham)
 
@@ -136,6 +161,24 @@ class VMC(AbstractVariationalDriver):
 
         return self._dp
 
+    def _use_qgt_jacobian_for_grad(self) -> bool:
+        # The gradient can be computed from the jacobian of the QGT only for
+        # hermitian hamiltonians, Monte Carlo states and linear preconditioners
+        # whose left hand side can be constructed before the gradient.
+        return (
+            isinstance(self.preconditioner, AbstractLinearPreconditioner)
+            and isinstance(self.state, MCState)
+            and not isinstance(self.state, MCMixedState)
+            and self._ham.is_hermitian
+        )
+
+    def _model_output_is_real(self) -> bool:
+        if self._output_is_real is None:
+            samples = self.state.hilbert.random_state(jax.random.key(0), 1)
+            out = jax.eval_shape(self.state._apply_fun, self.state.variables, samples)
+            self._output_is_real = not jnp.issubdtype(out.dtype, jnp.complexfloating)
+        return self._output_is_real
+
     @property
     def energy(self) -> Stats:
         """
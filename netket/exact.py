@@ -13,11 +13,21 @@
 # limitations under the License.
 
 
+from functools import partial as _partial
+
 import numpy as _np
+import jax as _jax
+from jax import numpy as _jnp
 from scipy.sparse.linalg import bicgstab as _bicgstab
 from scipy.sparse.linalg import LinearOperator as _LinearOperator
+from jax.scipy.sparse.linalg import bicgstab as _jax_bicgstab
+from jax.scipy.sparse.linalg import gmres as _jax_gmres
 
 from .operator import AbstractOperator as _AbstractOperator
+from .utils.group import PermutationGroup as _PermutationGroup
+from .utils import config as _config
+from .utils.types import Array as _Array
+from .jax import sharding as _sharding
 from jax.experimental.sparse import JAXSparse as _JAXSparse
 
 
@@ -97,6 +107,578 @@ def lanczos_ed(
         return result
 
 
+def lanczos_ed_jax(
+    operator: _AbstractOperator,
+    *,
+    k: int = 1,
+    compute_eigenvectors: bool = False,
+    n_krylov: int | None = None,
+    tol: float = 1e-10,
+    max_restarts: int = 100,
+    chunk_size: int | None = None,
+    seed: int = 0,
+):
+    r"""Computes the `k` smallest eigenvalues and, optionally, eigenvectors of a
+    Hermitian operator with a thick-restart Lanczos algorithm implemented in Jax.
+
+    Contrary to :func:`~netket.exact.lanczos_ed` with `matrix_free=True`, which
+    calls back into Python for every matrix-vector product, the whole algorithm
+    runs in a single jitted function on the default device. The matrix-vector
+    products are computed on the fly from
+    :meth:`~netket.operator.DiscreteJaxOperator.get_conn_padded` and
+    :meth:`~netket.hilbert.DiscreteHilbert.states_to_numbers`, processing
+    `chunk_size` basis states at a time, so the sparse matrix is never
+    constructed. When running with `NETKET_EXPERIMENTAL_SHARDING=1`, the Krylov
+    vectors are sharded over all the available devices.
+
+    The Krylov basis is fully reorthogonalized at every step, and the memory
+    required is thus about `n_krylov + 1` vectors with the size of the Hilbert
+    space.
+
+    Args:
+        operator: NetKet operator to diagonalize. It must be a
+            :class:`~netket.operator.DiscreteJaxOperator` or be convertible to one
+            with :meth:`~netket.operator.DiscreteOperator.to_jax_operator`.
+        k: The number of eigenvalues to compute.
+        compute_eigenvectors: Whether or not to return the eigenvectors of the
+            operator.
+        n_krylov: The dimension of the Krylov subspace built before every restart.
+            Defaults to `max(2k + 1, 20)`.
+        tol: The relative tolerance on the residual norm of the Ritz pairs used to
+            assess convergence.
+        max_restarts: The maximum number of restarts. If the Ritz pairs have not
+            converged after them, a warning is raised and the current
+            approximations are returned.
+        chunk_size: The number of basis states processed at once in the
+            matrix-vector products. Defaults to the size of the Hilbert space
+            divided by the maximum number of connected elements of the operator,
+            so that the memory required is about that of a Krylov vector.
+        seed: The seed used to generate the random starting vector.
+
+    Returns:
+        Either `w` or the tuple `(w, v)` depending on whether `compute_eigenvectors`
+        is True.
+
+        - w: Array containing the lowest `k` eigenvalues.
+        - v: Array containing the eigenvectors as columns, such that `v[:, i]`
+          corresponds to `w[i]`.
+
+    Example:
+        Test for 1D Ising chain with 8 sites.
+
+        >>> import netket as nk
+        >>> hi = nk.hilbert.Spin(s=1/2)**8
+        >>> hamiltonian = nk.operator.IsingJax(hi, h=1.0, graph=nk.graph.Chain(8))
+        >>> w = nk.exact.lanczos_ed_jax(hamiltonian, k=3)
+        >>> w
+        Array([-10.25166179, -10.05467898,  -8.69093921], dtype=float64)
+    """
+    operator = operator.to_jax_operator()
+    n_states = operator.hilbert.n_states
+
+    if n_krylov is None:
+        n_krylov = max(2 * k + 1, 20)
+    n_krylov = min(n_krylov, n_states)
+    if not k < n_krylov:
+        raise ValueError(
+            f"The dimension of the Krylov subspace (n_krylov={n_krylov}) must be "
+            f"larger than the number of eigenvalues (k={k})."
+        )
+    if chunk_size is None:
+        chunk_size = _default_matvec_chunk_size(n_states, [operator])
+    # pad the vectors so that they can be split in chunks and among devices
+    n_devices = _jax.device_count() if _config.netket_experimental_sharding else 1
+    block = chunk_size * n_devices
+    n_padded = -(-n_states // block) * block
+
+    w, v, converged = _lanczos_ed_jax(
+        operator,
+        _jax.random.PRNGKey(seed),
+        tol,
+        k=k,
+        n_krylov=n_krylov,
+        max_restarts=max_restarts,
+        n_states=n_states,
+        n_padded=n_padded,
+        chunk_size=chunk_size,
+    )
+    if not converged:
+        from warnings import warn
+
+        warn(
+            f"The Lanczos algorithm did not converge to tol={tol} within "
+            f"max_restarts={max_restarts} restarts. The returned eigenvalues and "
+            "eigenvectors are not accurate: consider increasing `max_restarts` or "
+            "`n_krylov`.",
+            stacklevel=2,
+        )
+
+    if not compute_eigenvectors:
+        return w
+    return w, v[:n_states]
+
+
+def _default_matvec_chunk_size(n_states, operators):
+    """
+    Returns a chunk size for :func:`_jax_matvec` such that the connected elements
+    gathered at once are not more than the elements of a vector of the Hilbert
+    space.
+    """
+    max_conn_size = max(op.max_conn_size for op in operators)
+    return max(1, n_states // max(max_conn_size, 1))
+
+
+def _jax_matvec(operator, v, n_states, chunk_size):
+    """
+    Computes `operator @ v` processing `chunk_size` basis states at a time.
+
+    `v` can have additional trailing dimensions, in which case the operator is
+    applied to every column.
+    """
+    hilbert = operator.hilbert
+    trailing = (1,) * (v.ndim - 1)
+
+    def _matvec_chunk(v, i):
+        numbers = i * chunk_size + _jnp.arange(chunk_size, dtype=_jnp.int32)
+        valid = numbers < n_states
+        x = hilbert.numbers_to_states(_jnp.where(valid, numbers, 0))
+        xp, mels = operator.get_conn_padded(x)
+        idx = hilbert.states_to_numbers(xp)
+        Hv_chunk = _jnp.sum(mels.reshape(mels.shape + trailing) * v[idx], axis=1)
+        Hv_chunk = _jnp.where(valid.reshape(valid.shape + trailing), Hv_chunk, 0)
+        return v, Hv_chunk.astype(v.dtype)
+
+    # The jax linear solvers transpose the matvec with `jax.lax.custom_linear_solve`,
+    # so the number of chunks must be static and `v` is carried through the loop
+    # rather than being closed over. With an int64 loop counter, XLA fails to
+    # partition the sharded chunks.
+    n_chunks = v.shape[0] // chunk_size
+    _, Hv = _jax.lax.scan(_matvec_chunk, v, _jnp.arange(n_chunks, dtype=_jnp.int32))
+    Hv = Hv.reshape(v.shape)
+    return _sharding.shard_along_axis(Hv, axis=0)
+
+
+@_partial(
+    _jax.jit,
+    static_argnames=(
+        "k",
+        "n_krylov",
+        "max_restarts",
+        "n_states",
+        "n_padded",
+        "chunk_size",
+    ),
+)
+def _lanczos_ed_jax(
+    operator, key, tol, *, k, n_krylov, max_restarts, n_states, n_padded, chunk_size
+):
+    m = n_krylov
+    # number of Ritz vectors kept at every restart
+    n_keep = min(max(k, (m + k) // 2), m - 1)
+    dtype = _jnp.result_type(operator.dtype, float)
+    mask = _jnp.arange(n_padded) < n_states
+
+    def matvec(v):
+        return _jax_matvec(operator, v, n_states, chunk_size)
+
+    def normalize(v):
+        return v / _jnp.linalg.norm(v)
+
+    # V has m rows for the Krylov basis and a last one for the residual vector
+    v0 = _jax.random.normal(key, (n_padded,), dtype=dtype)
+    v0 = normalize(_jnp.where(mask, v0, 0))
+    V = _jnp.zeros((m + 1, n_padded), dtype=dtype).at[0].set(v0)
+    V = _sharding.shard_along_axis(V, axis=1)
+    T = _jnp.zeros((m, m), dtype=dtype)
+
+    def lanczos_step(j, carry):
+        V, T, _ = carry
+        w = matvec(V[j])
+        # full reorthogonalization against the basis (twice is enough)
+        row_mask = _jnp.arange(m + 1) <= j
+        h = _jnp.where(row_mask, V.conj() @ w, 0)
+        w = w - h @ V
+        h2 = _jnp.where(row_mask, V.conj() @ w, 0)
+        w = w - h2 @ V
+        T = T.at[:, j].set((h + h2)[:m])
+        beta = _jnp.linalg.norm(w)
+        V = V.at[j + 1].set(w / _jnp.where(beta > 0, beta, 1))
+        return V, T, beta
+
+    def ritz(T):
+        # only the upper triangle of the projected matrix is computed
+        T = _jnp.triu(T) + _jnp.triu(T, 1).conj().T
+        return _jnp.linalg.eigh(T)
+
+    def cycle(carry):
+        V, T, j_start, _, n_restarts = carry
+        beta = _jnp.zeros((), dtype=_jnp.finfo(dtype).dtype)
+        V, T, beta = _jax.lax.fori_loop(j_start, m, lanczos_step, (V, T, beta))
+        theta, S = ritz(T)
+        residuals = _jnp.abs(beta * S[m - 1, :k])
+        converged = _jnp.all(residuals <= tol * _jnp.maximum(1, _jnp.abs(theta[:k])))
+
+        # restart from the lowest Ritz vectors and the residual vector
+        Y = S[:, :n_keep].T @ V[:m]
+        V = _jnp.zeros_like(V).at[:n_keep].set(Y).at[n_keep].set(V[m])
+        V = _sharding.shard_along_axis(V, axis=1)
+        T = _jnp.zeros_like(T).at[:n_keep, :n_keep].set(_jnp.diag(theta[:n_keep]))
+        return V, T, n_keep, converged, n_restarts + 1
+
+    def not_done(carry):
+        *_, converged, n_restarts = carry
+        return ~converged & (n_restarts <= max_restarts)
+
+    V, T, _, converged, _ = _jax.lax.while_loop(not_done, cycle, (V, T, 0, False, 0))
+    # after the last cycle the Ritz vectors are the first rows of V
+    w = _jnp.diag(T).real[:k]
+    return w, V[:k].T, converged
+
+
+def symmetric_lanczos_ed(
+    operator: _AbstractOperator,
+    symmetry_group: _PermutationGroup,
+    character: _Array | None = None,
+    *,
+    k: int = 1,
+    compute_eigenvectors: bool = False,
+    initial_state: _Array | None = None,
+    chunk_size: int | None = None,
+    scipy_args: dict | None = None,
+):
+    r"""Computes the `k` smallest eigenvalues and, optionally, eigenvectors of a
+    Hermitian operator within a symmetry sector, using
+    :meth:`scipy.sparse.linalg.eigsh`.
+
+    The sector is specified by a group of permutations of the sites (for example,
+    the one returned by :meth:`netket.graph.Lattice.space_group`) and by a
+    one-dimensional character :math:`\chi` of the group. The operator is
+    diagonalized in the basis of the symmetrized states
+
+    .. math::
+
+        |\tilde{r}\rangle \propto \sum_{g\in G} \chi(g)^* \, |g r\rangle,
+
+    where :math:`r` runs over the representatives of the orbits of the computational
+    basis states (the state with the smallest local indices in every orbit) that
+    have a non-vanishing projection onto the sector. The dimension of the matrix is
+    thus reduced by about a factor :math:`|G|` with respect to
+    :func:`~netket.exact.lanczos_ed`.
+
+    By default, the representatives are found by sweeping all the states of the
+    Hilbert space, which must then be indexable. If `initial_state` is given, they
+    are instead enumerated by applying the operator repeatedly to the orbit of
+    `initial_state`, without sweeping the whole Hilbert space, which therefore
+    does not need to be indexable. In this case only the block of the operator
+    connected to `initial_state` is diagonalized: if the operator conserves a
+    quantity that is not fixed by the Hilbert space (for instance the
+    magnetization of the Heisenberg model on a :class:`~netket.hilbert.Spin` space
+    without `total_sz`), the `initial_state` selects the corresponding sector.
+
+    The operator must commute with all the permutations in the group and the
+    Hilbert space must be invariant under the permutations. Signs arising from the
+    permutation of fermions are not taken into account.
+
+    Args:
+        operator: NetKet operator to diagonalize.
+        symmetry_group: The group of permutations of the sites of the Hilbert
+            space.
+        character: The characters :math:`\chi(g)` of all the elements of the
+            group, which must be those of a one-dimensional irreducible
+            representation, such as a row of
+            :meth:`~netket.utils.group.FiniteGroup.character_table` corresponding
+            to a one-dimensional irrep. Defaults to the fully symmetric sector.
+        k: The number of eigenvalues to compute.
+        compute_eigenvectors: Whether or not to return the eigenvectors of the
+            operator, expanded in the computational basis of the full Hilbert
+            space, which must be indexable.
+        initial_state: Optional state of the Hilbert space from which the
+            symmetrized basis is generated, restricting the diagonalization to the
+            block of the operator connected to it. Required if the Hilbert space
+            is not indexable.
+        chunk_size: The number of basis states processed at once while
+            constructing the symmetrized basis and matrix. Reduce it to lower the
+            memory usage.
+        scipy_args: Additional keyword arguments passed to
+            :meth:`scipy.sparse.linalg.eigsh`.
+
+    Returns:
+        Either `w` or the tuple `(w, v)` depending on whether `compute_eigenvectors`
+        is True.
+
+        - w: Array containing the lowest `k` eigenvalues in the sector.
+        - v: Array containing the eigenvectors as columns, such that `v[:, i]`
+          corresponds to `w[i]`.
+
+    Example:
+        Ground state of the Heisenberg chain with 12 sites in the sector with zero
+        momentum.
+
+        >>> import netket as nk
+        >>> g = nk.graph.Chain(12)
+        >>> hi = nk.hilbert.Spin(s=1/2, N=12, total_sz=0)
+        >>> ha = nk.operator.Heisenberg(hi, graph=g)
+        >>> w = nk.exact.symmetric_lanczos_ed(ha, g.translation_group())
+        >>> w
+        array([-21.54956367])
+    """
+    from scipy.sparse.linalg import eigsh
+
+    perms = _np.asarray(symmetry_group.to_array())
+    hilbert = operator.hilbert
+    if perms.shape[1] != hilbert.size:
+        raise ValueError(
+            f"The symmetry group acts on {perms.shape[1]} sites, but the Hilbert "
+            f"space has {hilbert.size} sites."
+        )
+    if character is None:
+        character = _np.ones(len(perms))
+    character = _np.asarray(character)
+    if character.shape != (len(perms),):
+        raise ValueError(
+            f"Expected {len(perms)} characters, one for every element of the "
+            f"group, got an array with shape {character.shape}."
+        )
+    idx = _np.arange(len(perms))
+    if not _np.allclose(
+        character[symmetry_group.product_table_entries(idx[:, None], idx[None, :])],
+        character.conj()[:, None] * character[None, :],
+    ):
+        raise ValueError(
+            "The characters must be those of a one-dimensional representation of "
+            "the symmetry group."
+        )
+    if _np.allclose(character.imag, 0):
+        character = character.real
+
+    if compute_eigenvectors and not hilbert.is_indexable:
+        raise ValueError(
+            "The eigenvectors can only be computed for indexable Hilbert spaces."
+        )
+    if initial_state is None and not hilbert.is_indexable:
+        raise ValueError(
+            "The Hilbert space is not indexable, so an `initial_state` must be "
+            "given to generate the symmetrized basis."
+        )
+
+    if chunk_size is None:
+        # the connected states of every basis state are mapped onto the orbits
+        chunk_size = max(1, _SYMMETRIC_ED_CHUNK_SIZE // (len(perms) * hilbert.size))
+
+    representatives, stabilizer_sizes, A = _symmetric_sparse(
+        operator, perms, character, initial_state, chunk_size
+    )
+    n = A.shape[0]
+    if n == 0:
+        if initial_state is None:
+            raise ValueError("The symmetry sector is empty.")
+        raise ValueError(
+            "The sector connected to the initial state is empty: the initial state "
+            "only reaches orbits with a vanishing projection onto the sector."
+        )
+
+    if k >= n - 1:
+        # the sector is too small for ARPACK
+        from numpy.linalg import eigh
+
+        w, v = eigh(A.toarray())
+        w, v = w[:k], v[:, :k]
+    else:
+        actual_scipy_args = {}
+        if scipy_args:
+            actual_scipy_args.update(scipy_args)
+        actual_scipy_args["which"] = "SA"
+        actual_scipy_args["k"] = k
+        actual_scipy_args["return_eigenvectors"] = True
+
+        w, v = eigsh(A, **actual_scipy_args)
+        order = _np.argsort(w)
+        w, v = w[order], v[:, order]
+
+    if not compute_eigenvectors:
+        return w
+
+    return w, _symmetric_to_full(
+        hilbert, perms, character, representatives, stabilizer_sizes, v
+    )
+
+
+_SYMMETRIC_ED_CHUNK_SIZE = 2**22
+
+
+def _key_strides(hilbert):
+    """
+    Strides used to encode the local indices of the states of `hilbert` into
+    64-bit integer keys, which do not require the Hilbert space to be indexable.
+    """
+    shape = tuple(int(s) for s in hilbert.shape)
+    if _np.prod(shape, dtype=object) >= 2**63:
+        raise ValueError(
+            "The states of the Hilbert space cannot be encoded into 64-bit integers."
+        )
+    strides = _np.ones(len(shape), dtype=_np.int64)
+    strides[:-1] = _np.cumprod(shape[:0:-1])[::-1]
+    return strides
+
+
+def _states_to_keys(hilbert, strides, x):
+    return _np.asarray(hilbert.states_to_local_indices(x), dtype=_np.int64) @ strides
+
+
+def _keys_to_states(hilbert, strides, keys):
+    local_indices = (keys[:, None] // strides) % _np.asarray(hilbert.shape)
+    return _np.asarray(hilbert.local_indices_to_states(local_indices))
+
+
+def _orbit_keys(hilbert, strides, perms, x):
+    """Keys of the images of the states `x` under all the permutations."""
+    local_indices = _np.asarray(hilbert.states_to_local_indices(x), dtype=_np.int64)
+    keys = _np.empty((len(x), len(perms)), dtype=_np.int64)
+    # loop over the group to avoid materializing all the images at once
+    for i, perm in enumerate(perms):
+        keys[:, i] = local_indices[:, perm] @ strides
+    return keys
+
+
+def _canonicalize(hilbert, strides, perms, character, x):
+    """
+    Maps the states `x` = g s onto the representatives s of their orbits (the image
+    with the smallest key), and returns their keys, the indices of the
+    permutations g and the projections of the orbits onto the sector.
+    """
+    images = _orbit_keys(hilbert, strides, perms, x)
+    g = images.argmin(axis=1)
+    s = images[_np.arange(len(images)), g]
+    # the sum of the characters over the stabilizer is either its size or zero,
+    # and it is the same for all the states in the orbit
+    stabilizer = images == _states_to_keys(hilbert, strides, x)[:, None]
+    projection = (stabilizer * character.conj()).sum(axis=1).real
+    return s, g, projection
+
+
+def _all_orbits(hilbert, strides, perms, character, chunk_size):
+    """
+    Returns the keys of the representatives of all the orbits of the states of an
+    indexable Hilbert space and their projections onto the sector.
+    """
+    representatives, projections = [], []
+    for start in range(0, hilbert.n_states, chunk_size):
+        stop = min(start + chunk_size, hilbert.n_states)
+        x = _np.asarray(hilbert.numbers_to_states(_np.arange(start, stop)))
+        s, _, projection = _canonicalize(hilbert, strides, perms, character, x)
+        s, index = _np.unique(s, return_index=True)
+        representatives.append(s)
+        projections.append(projection[index])
+
+    s, index = _np.unique(_np.concatenate(representatives), return_index=True)
+    return s, _np.concatenate(projections)[index]
+
+
+def _symmetric_sparse(operator, perms, character, initial_state, chunk_size):
+    """
+    Returns the keys of the representatives of the orbits connected by the operator
+    to `initial_state` with a non-vanishing projection onto the sector, the sizes of
+    their stabilizers and the matrix of the operator in the basis of the
+    symmetrized states.
+
+    The orbits are enumerated by a breadth-first search, so that only the states
+    of the sector are visited. If `initial_state` is None, the search starts from
+    all the orbits of the (indexable) Hilbert space.
+    """
+    from scipy.sparse import coo_matrix
+
+    hilbert = operator.hilbert
+    strides = _key_strides(hilbert)
+    dtype = _np.result_type(operator.dtype, character.dtype)
+
+    if initial_state is None:
+        s, projection = _all_orbits(hilbert, strides, perms, character, chunk_size)
+    else:
+        s, _, projection = _canonicalize(
+            hilbert, strides, perms, character, _np.asarray(initial_state)[None]
+        )
+    # orbits with a vanishing projection are not part of the basis, but they are
+    # still visited as they might connect orbits in the sector
+    visited = s
+    frontier, frontier_projection = s, projection
+
+    representatives, stabilizer_sizes = [], []
+    n = 0
+    rows, cols, data = [], [], []
+    while len(frontier) > 0:
+        in_basis = frontier_projection > 0.5
+        basis_index = _np.full(len(frontier), -1)
+        basis_index[in_basis] = n + _np.arange(in_basis.sum())
+        n += in_basis.sum()
+        representatives.append(frontier[in_basis])
+        stabilizer_sizes.append(_np.rint(frontier_projection[in_basis]))
+
+        candidates = []
+        for start in range(0, len(frontier), chunk_size):
+            stop = min(start + chunk_size, len(frontier))
+            x = _keys_to_states(hilbert, strides, frontier[start:stop])
+            sections = _np.empty(stop - start, dtype=_np.int32)
+            xp, mels = operator.get_conn_flattened(x, sections)
+            xp, mels = _np.asarray(xp), _np.asarray(mels)
+            col = basis_index[
+                start
+                + _np.repeat(_np.arange(stop - start), _np.diff(sections, prepend=0))
+            ]
+
+            # map every connected state σ' = g s onto its representative s
+            nonzero = mels != 0
+            xp, mels, col = xp[nonzero], mels[nonzero], col[nonzero]
+            s, g, projection = _canonicalize(hilbert, strides, perms, character, xp)
+            candidates.append((s, projection))
+
+            # P |σ'⟩ = P T_g^{-1} |s⟩ = χ(g)^* P |s⟩
+            # the rows are converted to indices once all the basis is known
+            in_sector = (col >= 0) & (projection > 0.5)
+            rows.append(s[in_sector])
+            cols.append(col[in_sector])
+            data.append(mels[in_sector] * character.conj()[g[in_sector]])
+
+        s = _np.concatenate([c[0] for c in candidates])
+        projection = _np.concatenate([c[1] for c in candidates])
+        s, index = _np.unique(s, return_index=True)
+        new = ~_np.isin(s, visited, assume_unique=True)
+        frontier, frontier_projection = s[new], projection[index[new]]
+        visited = _np.union1d(visited, frontier)
+
+    representatives = _np.concatenate(representatives)
+    stabilizer_sizes = _np.concatenate(stabilizer_sizes)
+
+    order = _np.argsort(representatives)
+    rows = order[_np.searchsorted(representatives, _np.concatenate(rows), sorter=order)]
+    cols = _np.concatenate(cols)
+    data = _np.concatenate(data) * _np.sqrt(
+        stabilizer_sizes[rows] / stabilizer_sizes[cols]
+    )
+    data = data.astype(dtype, copy=False)
+    A = coo_matrix((data, (rows, cols)), shape=(n, n)).tocsr()
+    return representatives, stabilizer_sizes, A
+
+
+def _symmetric_to_full(hilbert, perms, character, representatives, stabilizer_sizes, v):
+    """
+    Expands vectors in the basis of the symmetrized states onto the computational
+    basis.
+    """
+    strides = _key_strides(hilbert)
+    x = _keys_to_states(hilbert, strides, representatives)
+    images = _np.asarray(hilbert.states_to_numbers(x[:, perms]))
+
+    # |r̃⟩ = 1/sqrt(|S_r| |G|) Σ_g χ(g)^* |g r⟩
+    weights = (
+        character.conj()[None, :] / _np.sqrt(stabilizer_sizes * len(perms))[:, None]
+    )
+    dtype = _np.result_type(v.dtype, weights.dtype)
+    v_full = _np.zeros((hilbert.n_states, v.shape[1]), dtype=dtype)
+    for i in range(v.shape[1]):
+        _np.add.at(v_full[:, i], images, weights * v[:, i, None])
+    return v_full
+
+
 def full_ed(operator: _AbstractOperator, *, compute_eigenvectors: bool = False):
     """Computes all eigenvalues and, optionally, eigenvectors
     of a Hermitian operator by full diagonalization.
@@ -131,7 +713,16 @@ def full_ed(operator: _AbstractOperator, *, compute_eigenvectors: bool = False):
         return eigvalsh(dense_op)
 
 
-def steady_state(lindblad, *, sparse=True, method="ed", rho0=None, **kwargs):
+def steady_state(
+    lindblad,
+    *,
+    sparse=True,
+    method="ed",
+    rho0=None,
+    solver="gmres",
+    chunk_size=None,
+    **kwargs,
+):
     r"""Computes the numerically exact steady-state of a lindblad master equation.
     The computation is performed either through the exact diagonalization of the
     hermitian :math:`L^\dagger L` matrix, or by means of an iterative solver (bicgstabl)
@@ -141,6 +732,18 @@ def steady_state(lindblad, *, sparse=True, method="ed", rho0=None, **kwargs):
     Note that for systems with 7 or more sites it is usually computationally impossible
     to build the full lindblad operator and therefore only `iterative` will work.
 
+    With `method="iterative_jax"`, the Lindbladian is never constructed, not even
+    the sparse matrices of the hamiltonian and jump operators: it is applied to
+    the :math:`M\times M` density matrix as
+    :math:`-i H_{nh}\rho + i\rho H_{nh}^\dagger + \sum_k L_k\rho L_k^\dagger`,
+    with the matrix-vector products of the operators computed on the fly from their
+    jax connected elements, and the linear system is solved with the jax
+    implementation of GMRES or BiCGStab in a single jitted function. When running
+    with `NETKET_EXPERIMENTAL_SHARDING=1`, the rows of the density matrix are
+    sharded over all the available devices. The memory required is a few
+    density matrices (about `restart` of them for GMRES), which allows to treat
+    larger systems than the other methods.
+
     Note that for systems with hilbert spaces with dimensions above 40k, tol
     should be set to a lower value if the steady state has non-trivial correlations.
 
@@ -148,9 +751,18 @@ def steady_state(lindblad, *, sparse=True, method="ed", rho0=None, **kwargs):
         lindblad: The lindbladian encoding the master equation.
         sparse: Whether to use sparse matrices (default: False for ed, True for
             iterative)
-        method: 'ed' (exact diagonalization) or 'iterative' (iterative bicgstabl)
+        method: 'ed' (exact diagonalization), 'iterative' (iterative bicgstabl)
+            or 'iterative_jax' (matrix-free iterative solver in jax)
         rho0: starting density matrix for the iterative diagonalization (default: None)
-        kwargs...: additional kwargs passed to bicgstabl
+        solver: 'gmres' or 'bicgstab', the jax solver used by 'iterative_jax'
+            (default: 'gmres')
+        chunk_size: The number of rows of the density matrix processed at once by
+            'iterative_jax' (default: the number of rows divided by the maximum
+            number of connected elements of the operators, so that the memory
+            required is about that of a density matrix)
+        kwargs...: additional kwargs passed to bicgstabl, or to
+            :func:`jax.scipy.sparse.linalg.gmres` or
+            :func:`jax.scipy.sparse.linalg.bicgstab` for 'iterative_jax'
 
     For full docs please consult SciPy documentation at
     https://docs.scipy.org/doc/scipy/reference/generated/scipy.sparse.linalg.bicgstab.html
@@ -230,7 +842,88 @@ def steady_state(lindblad, *, sparse=True, method="ed", rho0=None, **kwargs):
         elif info < 0:
             print("An error occurred: ", info)
 
+    elif method == "iterative_jax":
+        if solver not in ("gmres", "bicgstab"):
+            raise ValueError("solver must be 'gmres' or 'bicgstab'")
+        hamiltonian_nh = lindblad.hamiltonian_nh.to_jax_operator()
+        jump_ops = [op.to_jax_operator() for op in lindblad.jump_operators]
+        if chunk_size is None:
+            chunk_size = _default_matvec_chunk_size(M, [hamiltonian_nh, *jump_ops])
+        # pad the density matrix so that its rows can be split in chunks and
+        # among devices
+        n_devices = _jax.device_count() if _config.netket_experimental_sharding else 1
+        block = chunk_size * n_devices
+        n_padded = -(-M // block) * block
+
+        if rho0 is None:
+            rho0 = _np.eye(M) / M
+        rho0_padded = _jnp.zeros((n_padded, n_padded), dtype=lindblad.dtype)
+        rho0 = rho0_padded.at[:M, :M].set(rho0)
+
+        print("Starting iterative solver...")
+        rho, residual = _steady_state_jax(
+            hamiltonian_nh,
+            jump_ops,
+            rho0,
+            solver=solver,
+            solver_kwargs=tuple(sorted(kwargs.items())),
+            n_states=M,
+            chunk_size=chunk_size,
+        )
+        rho = rho[:M, :M]
+        # the jax solvers do not report whether they converged, so the residual
+        # of the linear system is checked against their stopping criterion
+        tol = kwargs.get("tol", 1e-5)
+        atol = kwargs.get("atol", 0.0)
+        if residual <= max(tol / _np.sqrt(M), atol):
+            print("Converged trace is ", rho.trace(), " ( residual is ", residual, " )")
+        else:
+            from warnings import warn
+
+            warn(
+                f"The iterative solver did not converge (the residual is {residual}, "
+                f"the target was tol={tol}, atol={atol}). Consider increasing "
+                "`maxiter`.",
+                stacklevel=2,
+            )
+
     else:
-        raise ValueError("method must be 'ed' or 'iterative'")
+        raise ValueError("method must be 'ed', 'iterative' or 'iterative_jax'")
 
     return rho
+
+
+@_partial(
+    _jax.jit, static_argnames=("solver", "solver_kwargs", "n_states", "chunk_size")
+)
+def _steady_state_jax(
+    hamiltonian_nh, jump_ops, rho0, *, solver, solver_kwargs, n_states, chunk_size
+):
+    def left(op, rho):
+        return _jax_matvec(op, rho, n_states, chunk_size)
+
+    def right(rho, op):
+        # ρ O^† = (O ρ^†)^†
+        return left(op, rho.conj().T).conj().T
+
+    def lindblad(rho):
+        drho = -1j * left(hamiltonian_nh, rho) + 1j * right(rho, hamiltonian_nh)
+        for L in jump_ops:
+            drho = drho + right(left(L, rho), L)
+        return drho
+
+    # The Lindbladian is trace-preserving, so adding the trace times the
+    # normalized identity makes the system nonsingular, and its solution is the
+    # steady state with unit trace.
+    diagonal = _jnp.arange(rho0.shape[0]) < n_states
+    identity = _jnp.diag(diagonal.astype(rho0.dtype)) / n_states
+    identity = _sharding.shard_along_axis(identity, axis=0)
+
+    def matvec(rho):
+        return lindblad(rho) + _jnp.trace(rho) * identity
+
+    rho0 = _sharding.shard_along_axis(rho0, axis=0)
+    solve = _jax_gmres if solver == "gmres" else _jax_bicgstab
+    rho, _ = solve(matvec, identity, x0=rho0, **dict(solver_kwargs))
+    residual = _jnp.linalg.norm(matvec(rho) - identity)
+    return rho, residual
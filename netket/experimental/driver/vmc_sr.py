@@ -1,20 +1,25 @@
 from typing import Any
 from collections.abc import Callable
+from functools import partial
 
 import jax
+import jax.numpy as jnp
 from jax.flatten_util import ravel_pytree
 
 from netket import jax as nkjax
 from netket.optimizer.solver import cholesky
 from netket.vqs import MCState, FullSumState
-from netket.utils import timing, struct
-from netket.utils.types import ScalarOrSchedule, Optimizer, Array, PyTree
+from netket.utils import timing, struct, wrap_afun
+from netket.utils.types import ScalarOrSchedule, Optimizer, Array, PyTree, DType
 from netket.jax._jacobian.default_mode import JacobianMode
-from netket.operator import AbstractOperator
+from netket.operator import AbstractOperator, DiscreteJaxOperator
+from netket.sampler import MetropolisSamplerNumpy
 from netket import stats as nkstats
+from netket.vqs.mc import kernels
 
 from netket.driver.abstract_variational_driver import (
     AbstractVariationalDriver,
+    apply_gradient,
 )
 from netket._src.ngd.sr_srt_common import sr, srt
 from netket._src.ngd.srt_onthefly import srt_onthefly
@@ -101,6 +106,14 @@ class VMC_SR(AbstractVariationalDriver):
     solver from `JAX <https://jax.readthedocs.io/en/latest/jax.experimental.linalg.html>`_, `netket solvers <dense-solvers>`_ or a
     custom-written one can be used.
 
+    For large numbers of samples (or parameters, when ``use_ntk=False``), factorizing the matrix becomes the
+    bottleneck of the optimization. In this case, the randomized low-rank solver
+    :func:`~netket.optimizer.solver.nystrom` can be used instead,
+    for example ``linear_solver_fn=nk.optimizer.solver.nystrom(rank=256)``.
+    When ``on_the_fly=False``, the driver recognizes this solver (or any solver with the attribute
+    ``matrix_free = True``) and never constructs the matrix: the Nyström approximation is sketched
+    from products with the jacobian, and the diagonal shift is treated exactly.
+
 
     Natural Gradient Descent
     ------------------------
@@ -165,6 +178,34 @@ class VMC_SR(AbstractVariationalDriver):
 
     The default choice is to use the ``on_the_fly=True`` mode.
 
+    Mixed precision
+    ---------------
+    The jacobian is the largest array stored by this driver. If ``jacobian_dtype`` is
+    specified (for example ``jnp.float32``), the jacobian is computed and stored in this
+    lower precision, halving (or quartering, with ``jnp.bfloat16``) the required memory.
+    The QGT or NTK and the products with the jacobian are accumulated in the precision
+    of the local energies, in which the linear system is also solved.
+
+    Fused steps
+    -----------
+    For small and medium sized models, the time spent dispatching the several jitted
+    functions that make up an optimization step and synchronizing with the host can be
+    a large fraction of the total run time. If ``fused=True``, sampling, the computation
+    of the local energies, the natural gradient and the update of the parameters are
+    compiled into a single function, and the ``step_size`` steps that separate two
+    consecutive loggings in :meth:`~netket.driver.AbstractVariationalDriver.run` are
+    executed in a single dispatch using :func:`jax.lax.scan`.
+
+    The loss, observables and callbacks are evaluated on the same steps as in the
+    standard mode, that is the first step of every block of ``step_size`` steps. The
+    statistics of the loss along the ``step_size`` steps preceding every logged step
+    (included) are also logged as ``{loss_name}_fused``, padded with NaN for the
+    steps before the first one. The trajectory of the parameters is the same as in
+    the standard mode.
+
+    This mode requires an Hamiltonian which can be converted to a
+    :class:`~netket.operator.DiscreteJaxOperator` and a sampler written in Jax.
+
     References
     ----------
     - Stochastic Reconfiguration was originally introduced in the QMC field by `Sorella <https://arxiv.org/abs/cond-mat/9803107>`_.
@@ -209,6 +250,8 @@ class VMC_SR(AbstractVariationalDriver):
     _use_ntk: bool = struct.field(serialize=False)
     _on_the_fly: bool = struct.field(serialize=False)
     _linear_solver_fn: Any = struct.field(serialize=False)
+    _fused: bool = struct.field(serialize=False)
+    _jacobian_dtype: DType | None = struct.field(serialize=False)
 
     # Internal things cached
     _unravel_params_fn: Any = struct.field(serialize=False)
@@ -220,6 +263,7 @@ class VMC_SR(AbstractVariationalDriver):
     """
     PyTree to pass on information from the solver,e.g, the quadratic model.
     """
+    _fused_loss_stats: nkstats.Stats | None = struct.field(serialize=False)
 
     def __init__(
         self,
@@ -235,6 +279,8 @@ class VMC_SR(AbstractVariationalDriver):
         mode: JacobianMode | None = None,
         use_ntk: bool | None = None,
         on_the_fly: bool | None = None,
+        fused: bool = False,
+        jacobian_dtype: DType | None = None,
     ):
         r"""
         Initialize the driver with the given arguments.
@@ -275,6 +321,15 @@ class VMC_SR(AbstractVariationalDriver):
                 instead of the Quantum Geometric Tensor (QGT), aka switching between
                 SR and minSR. (Defaults to None, which will automatically choose the best
                 method)
+            fused: Whether to execute all the steps between two loggings in a single
+                jitted function (see the section *Fused steps* above). (Defaults to False)
+            jacobian_dtype: If specified, the jacobian is computed and stored in this
+                lower precision (for example `jnp.float32` or `jnp.bfloat16`), while the
+                QGT or NTK is accumulated and the linear system is solved in the
+                precision of the local energies (see the section *Mixed precision*
+                above). Not supported with `on_the_fly=True`, and `on_the_fly`
+                defaults to False if it is specified. (Defaults to None, the
+                precision of the parameters)
         """
         if isinstance(variational_state, FullSumState):
             raise TypeError(
@@ -287,7 +342,8 @@ class VMC_SR(AbstractVariationalDriver):
             print("Automatic SR implementation choice: ", "NTK" if use_ntk else "QGT")
 
         if on_the_fly is None:
-            if use_ntk:
+            # the jacobian must be stored to be kept in a lower precision
+            if use_ntk and jacobian_dtype is None:
                 on_the_fly = True
             else:
                 on_the_fly = False
@@ -301,7 +357,30 @@ class VMC_SR(AbstractVariationalDriver):
                 """
             )
 
+        if fused:
+            if not isinstance(hamiltonian, DiscreteJaxOperator):
+                if not hasattr(hamiltonian, "to_jax_operator"):
+                    raise TypeError(
+                        "`fused=True` requires an Hamiltonian that can be converted "
+                        f"to a DiscreteJaxOperator, but {type(hamiltonian)} cannot."
+                    )
+                hamiltonian = hamiltonian.to_jax_operator()
+            if isinstance(variational_state.sampler, MetropolisSamplerNumpy):
+                raise TypeError(
+                    "`fused=True` is not supported by samplers not written in Jax, "
+                    f"such as {type(variational_state.sampler)}."
+                )
+
+        if jacobian_dtype is not None and on_the_fly:
+            raise ValueError(
+                "`jacobian_dtype` is not supported with `on_the_fly=True`, "
+                "as the jacobian is never stored."
+            )
+
         self._ham = hamiltonian
+        self._fused = fused
+        self._jacobian_dtype = jacobian_dtype
+        self._fused_loss_stats = None
 
         self.diag_shift = diag_shift
         self.proj_reg = proj_reg
@@ -351,16 +430,7 @@ class VMC_SR(AbstractVariationalDriver):
         if callable(momentum):
             momentum = momentum(self.step_count)
 
-        if self.use_ntk:
-            if self.on_the_fly:
-                compute_sr_update_fun = srt_onthefly
-            else:
-                compute_sr_update_fun = srt
-        else:
-            if self.on_the_fly:
-                raise NotImplementedError
-            else:
-                compute_sr_update_fun = sr
+        compute_sr_update_fun = self._get_sr_update_fun()
 
         samples = _flatten_samples(self.state.samples)
         self._dp, self._old_updates, self.info = compute_sr_update_fun(
@@ -380,6 +450,148 @@ class VMC_SR(AbstractVariationalDriver):
 
         return self._dp
 
+    def _get_sr_update_fun(self):
+        if self.use_ntk:
+            if self.on_the_fly:
+                return srt_onthefly
+            else:
+                compute_sr_update_fun = srt
+        else:
+            if self.on_the_fly:
+                raise NotImplementedError
+            else:
+                compute_sr_update_fun = sr
+
+        if self._jacobian_dtype is not None:
+            compute_sr_update_fun = nkjax.HashablePartial(
+                compute_sr_update_fun, jacobian_dtype=self._jacobian_dtype
+            )
+        return compute_sr_update_fun
+
+    def iter(self, n_steps: int, step: int = 1):
+        """
+        Returns a generator which advances the VMC optimization, yielding
+        after every `step_size` steps.
+
+        If the driver was constructed with ``fused=True``, the optimization steps
+        between two yields are executed in a single jitted function, together with
+        the forward and backward pass of the step on which the generator yields
+        next. As for the standard mode, the generator yields on the first step of
+        every block of `step` steps, before its update is applied.
+
+        Args:
+            n_steps: The total number of steps to perform (this is
+                equivalent to the length of the iterator)
+            step: The number of internal steps the simulation
+                is advanced between yielding from the iterator
+
+        Yields:
+            int: The current step.
+        """
+        if not self._fused:
+            yield from super().iter(n_steps, step)
+            return
+
+        if n_steps > 0:
+            self._dp = self._forward_and_backward_fused(1, step)
+
+        for start in range(0, n_steps, step):
+            yield self.step_count
+
+            self._step_count += 1
+            self.update_parameters(self._dp)
+
+            # the remaining steps of the block, followed by the forward and
+            # backward pass of the first step of the next block if there is one
+            n_fused = min(step, n_steps - start - 1)
+            if n_fused > 0:
+                self._dp = self._forward_and_backward_fused(n_fused, step)
+                # all but the last update are applied by the fused steps
+                self._step_count += n_fused - 1
+                if start + step >= n_steps:
+                    self._step_count += 1
+                    self.update_parameters(self._dp)
+
+    @timing.timed
+    def _forward_and_backward_fused(self, n_steps: int, n_logged: int):
+        """
+        Performs `n_steps - 1` optimization steps followed by the forward and
+        backward pass of the last one in a single jitted function, returning the
+        gradient of the last step.
+
+        The statistics of the loss along the steps are stored in a series of
+        length `n_logged`, padded at the beginning with NaN if `n_steps` is
+        smaller, so that its last entry always corresponds to the last step.
+        """
+        vstate = self.state
+
+        # Evaluate the (possibly iteration dependent) hyperparameters of all the
+        # steps on the host, so that any schedule can be used.
+        steps = range(self.step_count, self.step_count + n_steps)
+        hyperparams = {}
+        for name in ("diag_shift", "proj_reg", "momentum"):
+            value = getattr(self, name)
+            if value is None:
+                hyperparams[name] = None
+            elif callable(value):
+                hyperparams[name] = jnp.asarray([value(i) for i in steps])
+            else:
+                hyperparams[name] = jnp.full((n_steps,), value)
+
+        if vstate.chunk_size is None:
+            local_kernel = kernels.local_value_kernel_jax
+        else:
+            local_kernel = nkjax.HashablePartial(
+                kernels.local_value_kernel_jax_chunked, chunk_size=vstate.chunk_size
+            )
+
+        (
+            params,
+            self._optimizer_state,
+            sampler_state,
+            samples,
+            self._dp,
+            self._old_updates,
+            self._loss_stats,
+            self._fused_loss_stats,
+            self.info,
+        ) = _fused_sr_steps(
+            vstate._apply_fun,
+            wrap_afun(vstate._sampler_model),
+            local_kernel,
+            self._get_sr_update_fun(),
+            self._optimizer.update,
+            self._linear_solver_fn,
+            self.mode,
+            self.chunk_size_bwd,
+            vstate.chain_length,
+            vstate.n_discard_per_chain,
+            n_steps,
+            vstate.sampler,
+            vstate.parameters,
+            vstate.model_state,
+            self._optimizer_state,
+            vstate.sampler_state,
+            self._ham,
+            self._old_updates,
+            hyperparams,
+        )
+
+        self._fused_loss_stats = jax.tree_util.tree_map(
+            lambda x: jnp.concatenate(
+                [jnp.full((n_logged - n_steps, *x.shape[1:]), jnp.nan, x.dtype), x]
+            ),
+            self._fused_loss_stats,
+        )
+
+        # Setting the parameters resets the samples, which are restored afterwards
+        # so that observables are estimated on the samples of the last step.
+        vstate.parameters = params
+        vstate.sampler_state = sampler_state
+        vstate._samples = samples
+
+        return self._dp
+
     @timing.timed
     def _log_additional_data(self, log_dict: dict, step: int):
         """
@@ -402,6 +614,10 @@ class VMC_SR(AbstractVariationalDriver):
         if self.info is not None:
             log_dict["info"] = self.info
 
+        # Log the loss along all the steps executed in a single dispatch.
+        if self._fused and self._fused_loss_stats is not None:
+            log_dict[self._loss_name + "_fused"] = self._fused_loss_stats
+
     @property
     def mode(self) -> JacobianMode:
         """
@@ -471,3 +687,123 @@ class VMC_SR(AbstractVariationalDriver):
         if not isinstance(value, int | None):
             raise TypeError("chunk_size must be an integer or None")
         self._chunk_size_bwd = value
+
+
+@partial(
+    jax.jit,
+    static_argnames=(
+        "apply_fun",
+        "machine",
+        "local_kernel",
+        "sr_update_fun",
+        "optimizer_fun",
+        "solver_fn",
+        "mode",
+        "chunk_size_bwd",
+        "chain_length",
+        "n_discard_per_chain",
+        "n_steps",
+    ),
+)
+def _fused_sr_steps(
+    apply_fun,
+    machine,
+    local_kernel,
+    sr_update_fun,
+    optimizer_fun,
+    solver_fn,
+    mode,
+    chunk_size_bwd,
+    chain_length,
+    n_discard_per_chain,
+    n_steps,
+    sampler,
+    params,
+    model_state,
+    optimizer_state,
+    sampler_state,
+    hamiltonian,
+    old_updates,
+    hyperparams,
+):
+    """
+    Performs `n_steps - 1` steps of VMC with natural gradient, followed by the
+    sampling and computation of the update of the last step, which is returned
+    without being applied to the parameters.
+
+    The statistics of the loss of all the steps are returned stacked along the
+    first axis.
+    """
+
+    def forward_and_backward(params, sampler_state, old_updates, hyperparams):
+        variables = {"params": params, **model_state}
+
+        sampler_state = sampler.reset(machine, variables, sampler_state)
+        if n_discard_per_chain > 0:
+            _, sampler_state = sampler._sample_chain(
+                machine, variables, sampler_state, n_discard_per_chain
+            )
+        samples, sampler_state = sampler._sample_chain(
+            machine, variables, sampler_state, chain_length
+        )
+
+        σ = _flatten_samples(samples)
+        local_energies = local_kernel(apply_fun, variables, σ, hamiltonian)
+        local_energies = local_energies.reshape(samples.shape[:-1])
+        loss_stats = nkstats.statistics(local_energies)
+
+        dp, old_updates, info = sr_update_fun(
+            apply_fun,
+            local_energies,
+            params,
+            model_state,
+            σ,
+            solver_fn=solver_fn,
+            mode=mode,
+            old_updates=old_updates,
+            chunk_size=chunk_size_bwd,
+            **hyperparams,
+        )
+        return sampler_state, samples, dp, old_updates, loss_stats, info
+
+    def step(carry, hyperparams):
+        params, optimizer_state, sampler_state, samples, dp, old_updates = carry
+        optimizer_state, params = apply_gradient(
+            optimizer_fun, optimizer_state, dp, params
+        )
+        sampler_state, samples, dp, old_updates, loss_stats, info = (
+            forward_and_backward(params, sampler_state, old_updates, hyperparams)
+        )
+        carry = (params, optimizer_state, sampler_state, samples, dp, old_updates)
+        return carry, (loss_stats, info)
+
+    hyperparams_0 = jax.tree_util.tree_map(lambda x: x[0], hyperparams)
+    sampler_state, samples, dp, old_updates, loss_stats_0, info = forward_and_backward(
+        params, sampler_state, old_updates, hyperparams_0
+    )
+
+    hyperparams_rest = jax.tree_util.tree_map(lambda x: x[1:], hyperparams)
+    carry = (params, optimizer_state, sampler_state, samples, dp, old_updates)
+    carry, (loss_stats, infos) = jax.lax.scan(
+        step, carry, xs=hyperparams_rest, length=n_steps - 1
+    )
+    params, optimizer_state, sampler_state, samples, dp, old_updates = carry
+
+    loss_stats = jax.tree_util.tree_map(
+        lambda x0, x: jnp.concatenate([x0[None], x]), loss_stats_0, loss_stats
+    )
+    if n_steps > 1:
+        info = jax.tree_util.tree_map(lambda x: x[-1], infos)
+    loss_stats_last = jax.tree_util.tree_map(lambda x: x[-1], loss_stats)
+
+    return (
+        params,
+        optimizer_state,
+        sampler_state,
+        samples,
+        dp,
+        old_updates,
+        loss_stats_last,
+        loss_stats,
+        info,
+    )
@@ -16,13 +16,15 @@
 # pylint: disable=function-redefined
 
 import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from functools import reduce
 from collections.abc import Iterable, Sequence
 from warnings import warn
 
 from netket.utils import struct, deprecated_new_name, deprecated
 from netket.utils.types import Array
-from netket.utils.float import prune_zeros
+from netket.utils.float import comparable, prune_zeros
 from netket.utils.dispatch import dispatch
 from netket.utils.group import (
     Element,
@@ -31,6 +33,7 @@ from netket.utils.group import (
     Permutation,
     PermutationGroup,
 )
+from netket.utils.group._group import random
 
 from .lattice import Lattice
 
@@ -241,6 +244,15 @@ class TranslationGroup(PermutationGroup):
 
         return pt.reshape(len(self), len(self))
 
+    def product_table_entries(self, idx_g: Array, idx_h: Array) -> Array:
+        shape = tuple(int(x) for x in self.group_shape)
+        g = np.unravel_index(idx_g, shape)
+        h = np.unravel_index(idx_h, shape)
+        # g^{-1} h is the translation by the difference of the coordinates
+        return np.ravel_multi_index(
+            tuple(hi - gi for gi, hi in zip(g, h)), shape, mode="wrap"
+        )
+
     def momentum_irrep(self, *k: Array) -> np.ndarray:
         r"""Returns the irrep characters (phase factors) corresponding to
         crystal momentum :math:`\vec k`."""
@@ -273,6 +285,9 @@ TranslationGroup.inverse.__doc__ = (
 TranslationGroup.product_table.__doc__ = (
     PermutationGroup.product_table.__doc__ + _tg_efficiency_notice
 )
+TranslationGroup.product_table_entries.__doc__ = (
+    PermutationGroup.product_table_entries.__doc__ + _tg_efficiency_notice
+)
 
 
 @struct.dataclass
@@ -416,17 +431,24 @@ class SpaceGroup(PermutationGroup):
         return self
 
     @struct.property_cached
-    def product_table(self) -> Array:
+    def _point_group_rows(self) -> np.ndarray:
+        """The first :code:`n_PG` rows of :attr:`product_table`, i.e. the indices
+        of :math:`p^{-1}h` for all point-group symmetries :math:`p` and space-group
+        symmetries :math:`h`, reshaped to :code:`(n_PG, n_TG, n_PG)`.
+
+        Together with the translation group, these are all that is needed to
+        multiply arbitrary elements of the space group."""
         # compute first n_PG rows of product table like in PermutationGroup
         perms = self.to_array()
-        inverse = perms[self.inverse].squeeze()
         n_symm = len(perms)
         n_PG = len(self._point_group)
         n_TG = len(self.full_translation_group)
         lookup = np.unique(np.column_stack((perms, np.arange(len(self)))), axis=0)
 
         PG_rows = np.zeros([n_PG, n_symm], dtype=int)
-        for i, g_inv in enumerate(inverse[:n_PG]):
+        for i, perm in enumerate(perms[:n_PG]):
+            # `np.argsort` of a permutation array is its inverse
+            g_inv = np.argsort(perm)
             row_perms = perms[:, g_inv]
             row_perms = np.unique(
                 np.column_stack((row_perms, np.arange(len(self)))), axis=0
@@ -440,23 +462,223 @@ class SpaceGroup(PermutationGroup):
             PG_rows[i, row_perms[:, -1]] = lookup[:, -1]
 
         # PG_rows contains pg^-1 th ph - split three terms into three dimensions
-        PG_rows = PG_rows.reshape(n_PG, n_TG, n_PG)
-        # the full product table is of the form pg^-1 tg^-1 th ph
-        # the middle two terms are the product table of the TG
-        product_table = PG_rows[:, self.full_translation_group.product_table, :]
-        # reshuffle into output shape
-        product_table = product_table.transpose(1, 0, 2, 3)
+        return PG_rows.reshape(n_PG, n_TG, n_PG)
+
+    def product_table_entries(self, idx_g: Array, idx_h: Array) -> Array:
+        n_PG = len(self._point_group)
+        # group elements are ordered as translation-major products th ph
+        tg, pg = np.divmod(idx_g, n_PG)
+        th, ph = np.divmod(idx_h, n_PG)
+        # g^-1 h = pg^-1 tg^-1 th ph, the middle two terms are a translation
+        t = self.full_translation_group.product_table_entries(tg, th)
+        return self._point_group_rows[pg, t, ph]
+
+    @struct.property_cached
+    def _identity_index(self) -> int:
+        return int(self.product_table_entries(0, 0))
+
+    @struct.property_cached
+    def inverse(self) -> Array:
+        return self.product_table_entries(np.arange(len(self)), self._identity_index)
+
+    @struct.property_cached
+    def product_table(self) -> Array:
+        idx = np.arange(len(self))
+        return self.product_table_entries(idx[:, np.newaxis], idx)
+
+    @struct.property_cached
+    def conjugacy_classes(self) -> tuple[Array, Array, Array]:
+        n_symm = len(self)
+        n_PG = len(self._point_group)
+        tg = self.full_translation_group
+        shape = tuple(int(x) for x in tg.group_shape)
+
+        # conjugacy classes are the orbits of the conjugation action h^-1 g h,
+        # which are generated by the point group and the elementary translations
+        unit_translations = [
+            np.ravel_multi_index(tuple(np.eye(len(shape), dtype=int)[i]), shape)
+            for i in range(len(shape))
+            if shape[i] > 1
+        ]
+        pg_identity = self._identity_index % n_PG
+        generators = np.concatenate(
+            [np.arange(n_PG), np.asarray(unit_translations, dtype=int) * n_PG]
+        )
+        generators[n_PG:] += pg_identity
+
+        g = np.arange(n_symm)[:, np.newaxis]
+        h = generators[np.newaxis, :]
+        # exploits that h^{-1}gh = (g^{-1} h)^{-1} h
+        conj = self.product_table_entries(self.product_table_entries(g, h), h)
+        rows = np.broadcast_to(g, conj.shape).ravel()
+        graph = coo_matrix(
+            (np.ones(conj.size, dtype=bool), (rows, conj.ravel())),
+            shape=(n_symm, n_symm),
+        )
+        n_classes, labels = connected_components(graph, directed=False)
+
+        # order the classes by their lowest-indexed member as in FiniteGroup
+        representatives = np.full(n_classes, n_symm)
+        np.minimum.at(representatives, labels, np.arange(n_symm))
+        order = np.argsort(representatives)
+        representatives = representatives[order]
+        inverse = np.argsort(order)[labels]
+        classes = inverse[np.newaxis, :] == np.arange(n_classes)[:, np.newaxis]
 
-        return product_table.reshape(n_symm, n_symm)
+        return classes, representatives, inverse
+
+    @struct.property_cached
+    def _momentum_stars(self) -> list[Array]:
+        """Representatives of the stars of the wave vectors allowed by the
+        translation group, given as integer coordinates along
+        :attr:`~TranslationGroup.group_shape`."""
+        n_PG = len(self._point_group)
+        shape = np.asarray(self.full_translation_group.group_shape)
+        ndim = len(shape)
+        # p^-1 t p for all point-group symmetries p and elementary translations t,
+        # where group elements are ordered as translation-major products t p
+        units = [
+            (
+                np.ravel_multi_index(tuple(np.eye(ndim, dtype=int)[a]), tuple(shape))
+                if shape[a] > 1
+                else 0
+            )
+            for a in range(ndim)
+        ]
+        p = np.arange(n_PG)[:, np.newaxis]
+        conj = self.product_table_entries(p, np.asarray(units) * n_PG + p) // n_PG
+        # coordinates of the conjugated translations, shape (n_PG, ndim, ndim)
+        conj = np.stack(np.unravel_index(conj, tuple(shape)), axis=-1)
+
+        # the point group maps the character with momentum m onto that with
+        # m'_a = L_a sum_b m_b c_ab / L_b, where c_ab are the coordinates of p^-1 e_a p
+        momenta = np.stack(np.unravel_index(np.arange(np.prod(shape)), shape), -1)
+        images = np.einsum("mb,pab->pma", momenta / shape, conj) * shape
+        images = np.ravel_multi_index(
+            tuple(np.rint(images).astype(int).T), tuple(shape), mode="wrap"
+        ).T
+
+        stars = []
+        in_star = np.zeros(len(momenta), dtype=bool)
+        for m in range(len(momenta)):
+            if not in_star[m]:
+                stars.append(momenta[m])
+                in_star[images[:, m]] = True
+        return stars
+
+    @struct.property_cached
+    def _induced_irreps(self) -> list[Array]:
+        """Irrep matrices of the space group, in no particular order.
+
+        The representation induced by every momentum irrep of the translation
+        group acts on a space of dimension :code:`n_PG` and contains all irreps
+        of the space group defined on the star of that momentum. It is decomposed
+        with Dixon's algorithm as in :meth:`FiniteGroup._irrep_matrices`, which
+        only requires the :code:`n_PG` rows of :attr:`product_table` corresponding
+        to point-group symmetries, instead of the full regular representation."""
+        n_symm = len(self)
+        n_PG = len(self._point_group)
+        shape = np.asarray(self.full_translation_group.group_shape)
+
+        # p h = u q, where p, q are point-group symmetries and u a translation
+        p = np.arange(n_PG)
+        u, q = np.divmod(
+            self.product_table_entries(
+                self.inverse[p][:, np.newaxis], np.arange(n_symm)
+            ),
+            n_PG,
+        )
+        u = np.stack(np.unravel_index(u, tuple(shape)), axis=-1)
+
+        irreps = []
+        for m in self._momentum_stars:
+            # In the basis of the functions f_p(t p) = χ(t), the induced
+            # representation of h is the monomial matrix ρ(h)_{p,q} = χ(u) δ_{q,q(p,h)}
+            phases = np.exp(2j * np.pi * (u @ (m / shape)))
+
+            # Hermitian matrix that commutes with the representation,
+            # E = Σ_h ρ(h) X ρ(h)^† for a random Hermitian X, accumulated over
+            # chunks of n_PG group elements
+            x = random(n_PG**2, seed=0, cplx=True).reshape(n_PG, n_PG)
+            x = x + x.T.conj()
+            e = np.zeros((n_PG, n_PG), dtype=x.dtype)
+            for h in np.split(np.arange(n_symm), n_symm // n_PG):
+                e += np.einsum(
+                    "ah,bh,abh->ab",
+                    phases[:, h],
+                    phases[:, h].conj(),
+                    x[q[:, np.newaxis, h], q[np.newaxis, :, h]],
+                )
+
+            # its eigenspaces each carry a single irrep
+            e, v = np.linalg.eigh(e)
+            gaps = np.diff(e) > 1e-8 * np.abs(e).max()
+            limits = np.concatenate([[0], np.flatnonzero(gaps) + 1, [n_PG]])
+
+            characters = set()
+            for start, stop in zip(limits[:-1], limits[1:]):
+                w = v[:, start:stop]
+                irrep = np.einsum("ai,ahj->hij", w.conj(), phases[..., None] * w[q])
+                character = np.trace(irrep, axis1=1, axis2=2)
+                key = comparable(np.stack([character.real, character.imag])).tobytes()
+                # the same irrep can appear several times in the representation
+                if key not in characters:
+                    characters.add(key)
+                    irreps.append(prune_zeros(irrep))
+        return irreps
+
+    @struct.property_cached
+    def _is_faithful(self) -> bool:
+        """Whether all symmetries are distinct permutations, which is not the
+        case if the lattice is periodic along an axis of length 2."""
+        return len(np.unique(self.to_array(), axis=0)) == len(self)
+
+    @struct.property_cached
+    def _irrep_matrices(self) -> list[Array]:
+        # the induced representations are only irreducible if the group acts
+        # faithfully on the lattice
+        if not self._is_faithful:
+            return self._dixon_irrep_matrices()
+
+        # sort the irreps in the same order as the rows of the character table
+        _, representatives, _ = self.conjugacy_classes
+        table = np.stack(
+            [
+                np.trace(irrep[representatives], axis1=1, axis2=2)
+                for irrep in self._induced_irreps
+            ]
+        )
+        return [self._induced_irreps[i] for i in self._character_order(table)]
+
+    @struct.property_cached
+    def character_table_by_class(self) -> np.ndarray:
+        r"""
+        The character table, computed as the traces of :meth:`irrep_matrices`.
+
+        Each row of the output lists the characters of one irrep in the order the
+        conjugacy classes are listed in :attr:`conjugacy_classes`. The irreps are
+        sorted by dimension.
+        """
+        if not self._is_faithful:
+            return self._burnside_character_table()
+
+        _, representatives, _ = self.conjugacy_classes
+        table = np.stack(
+            [
+                np.trace(irrep[representatives], axis1=1, axis2=2)
+                for irrep in self._irrep_matrices
+            ]
+        )
+        return prune_zeros(table)
 
     @struct.property_cached
     def _point_group_conjugacy_table(self) -> np.ndarray:
         """Part of the conjugacy table :math:`h^{-1}gh` where h are
         point-group symmetries."""
-        n_PG = len(self.point_group)
-        col_index = np.arange(n_PG)[np.newaxis, :]
+        g = np.arange(len(self))[:, np.newaxis]
+        h = np.arange(len(self.point_group))[np.newaxis, :]
         # exploits that h^{-1}gh = (g^{-1} h)^{-1} h
-        return self.product_table[self.product_table[:, :n_PG], col_index]
+        return self.product_table_entries(self.product_table_entries(g, h), h)
 
     def _little_group_index(self, k: Array) -> Array:
         r"""
@@ -650,3 +872,10 @@ _sg_efficiency_notice = """
 SpaceGroup.product_table.__doc__ = (
     PermutationGroup.product_table.__doc__ + _sg_efficiency_notice
 )
+SpaceGroup.product_table_entries.__doc__ = (
+    PermutationGroup.product_table_entries.__doc__ + _sg_efficiency_notice
+)
+SpaceGroup.inverse.__doc__ = PermutationGroup.inverse.__doc__ + _sg_efficiency_notice
+SpaceGroup.conjugacy_classes.__doc__ = (
+    PermutationGroup.conjugacy_classes.__doc__ + _sg_efficiency_notice
+)
@@ -1,5 +1,5 @@
-import itertools
-import math
+import functools
+
 import numpy as np
 
 import jax
@@ -10,9 +10,8 @@ from netket.utils.types import Array
 
 from netket.hilbert.constraint import SumConstraint
 
-from .base import HilbertIndex, is_indexable
+from .base import HilbertIndex, is_indexable, max_states
 from .uniform_tensor import UniformTensorProductHilbertIndex
-from .unconstrained import LookupTableHilbertIndex
 from .constrained_generic import ConstrainedHilbertIndex, optimalConstrainedHilbertindex
 
 
@@ -38,6 +37,11 @@ class SumConstrainedHilbertIndex(HilbertIndex):
     """
     Specialized implementation for a constrained space with a SumConstraint.
     Does not require the unconstrained space to be indexable.
+
+    The states are ranked in lexicographic order with the combinatorial number
+    system, generalized to local occupations bounded by the size of the local
+    space. Ranking and unranking are computed arithmetically from a table of
+    counts of size :math:`O(N^2 n_{max}^2)`, without storing all the states.
     """
 
     range: StaticRange = struct.field(pytree_node=True)
@@ -57,56 +61,131 @@ class SumConstrainedHilbertIndex(HilbertIndex):
 
     @property
     def n_states(self):
-        if self._n_max == 1:
-            return math.comb(self.size, self.n_particles)
-        else:
-            return self._lookup_table.n_states
+        return _count_bounded_compositions(self.size, self._n_occupation, self._n_max)
 
     @property
     def _n_max(self):
         return max(self.shape) - 1
 
-    def states_to_numbers(self, states: Array) -> Array:
-        return self._lookup_table.states_to_numbers(states)
+    @property
+    def _n_occupation(self):
+        # Total occupation of the local states counted in increasing order of
+        # their value, such that the lexicographic order of the occupations is
+        # the same as that of the states.
+        if self.range.step > 0:
+            return self.n_particles
+        else:
+            return self.size * self._n_max - self.n_particles
 
-    def numbers_to_states(self, numbers: Array):
-        return self._lookup_table.numbers_to_states(numbers)
+    @property
+    def _ranking_table(self) -> np.ndarray:
+        return _ranking_table(self.size, self._n_occupation, self._n_max)
 
-    def all_states(self):
-        return self._lookup_table.all_states()
+    def _states_to_occupations(self, states):
+        fock = self.range.states_to_numbers(states, dtype=jnp.int32)
+        if self.range.step > 0:
+            return fock
+        else:
+            return self._n_max - fock
+
+    def _occupations_to_states(self, occupations):
+        if self.range.step < 0:
+            occupations = self._n_max - occupations
+        return self.range.numbers_to_states(occupations, dtype=self.range.dtype)
 
     @jax.jit
-    def _compute_all_states(self):
-        if self.n_particles == 0:
-            return jnp.zeros((1, self.size), dtype=self.range.dtype)
-        with jax.ensure_compile_time_eval():
-            c = jnp.repeat(
-                jnp.eye(self.size, dtype=self.range.dtype),
-                np.array(self.shape) - 1,
-                axis=0,
-            )
-            combs = jnp.array(
-                list(itertools.combinations(np.arange(len(c)), self.n_particles))
+    def states_to_numbers(self, states: Array) -> Array:
+        table = jnp.asarray(self._ranking_table)
+        occupations = self._states_to_occupations(states)
+
+        # occupation left for the sites from i (included) onwards
+        remaining = self._n_occupation - (
+            jnp.cumsum(occupations, axis=-1) - occupations
+        )
+        n_sites_after = jnp.arange(self.size - 1, -1, -1)
+        return table[n_sites_after, remaining, occupations].sum(
+            axis=-1, dtype=jnp.int32
+        )
+
+    @jax.jit
+    def numbers_to_states(self, numbers: Array):
+        table = jnp.asarray(self._ranking_table)
+        numbers = jnp.asarray(numbers, dtype=jnp.int32)
+
+        # Determine the occupations site by site. This loop is unrolled
+        # (rather than a scan) so that it can also be evaluated eagerly.
+        remaining = jnp.full(numbers.shape, self._n_occupation, dtype=jnp.int32)
+        occupations = []
+        for n_sites_after in range(self.size - 1, -1, -1):
+            # the occupation of the site is the number of occupations whose
+            # cumulative count is not larger than the remaining rank
+            thresholds = table[n_sites_after, remaining, 1:]
+            occupation = jnp.sum(
+                thresholds <= numbers[..., None], axis=-1, dtype=jnp.int32
             )
-            all_states = c[combs].sum(axis=1, dtype=self.range.dtype)
-            if (np.array(self.shape) > 1).any():
-                all_states = jnp.unique(all_states, axis=0)
-        all_states_fock = jnp.asarray(all_states)
-        return self.range.numbers_to_states(all_states_fock, dtype=self.range.dtype)
-
-    @struct.property_cached(pytree_node=True)
-    def _lookup_table(self) -> LookupTableHilbertIndex:
-        with jax.ensure_compile_time_eval():
-            all_states = self._compute_all_states()
-        return LookupTableHilbertIndex(all_states)
+            numbers = numbers - table[n_sites_after, remaining, occupation]
+            remaining = remaining - occupation
+            occupations.append(occupation)
+        occupations = jnp.stack(occupations, axis=-1)
+        return self._occupations_to_states(occupations)
+
+    @jax.jit
+    def all_states(self):
+        return self.numbers_to_states(jnp.arange(self.n_states, dtype=jnp.int32))
 
     @property
     def n_states_bound(self):
-        # upper bound on n_states, exact if n_max == 1
-        # number of combinations to check in _compute_all_states
-        return math.comb((np.array(self.shape) - 1).sum(), self.n_particles)
+        return self.n_states
 
     @property
     def is_indexable(self):
-        # make sure we have less than than max_states to check in _compute_all_states
-        return is_indexable(self.n_states_bound)
+        return is_indexable(self.n_states)
+
+
+@functools.cache
+def _bounded_compositions_table(size: int, n_total: int, n_max: int) -> list:
+    """
+    Returns the table `C[k][m]` of the number of ways of distributing `m`
+    particles on `k` sites with at most `n_max` particles per site, for
+    `0 <= k <= size` and `0 <= m <= n_total`.
+
+    For `n_max = 1` this is the binomial coefficient `comb(k, m)`.
+    """
+    counts = [[0] * (n_total + 1) for _ in range(size + 1)]
+    counts[0][0] = 1
+    for k in range(1, size + 1):
+        for m in range(n_total + 1):
+            counts[k][m] = sum(counts[k - 1][m - v] for v in range(min(n_max, m) + 1))
+    return counts
+
+
+def _count_bounded_compositions(size: int, n_total: int, n_max: int) -> int:
+    if n_total < 0 or n_total > size * n_max:
+        return 0
+    return _bounded_compositions_table(size, n_total, n_max)[size][n_total]
+
+
+@functools.cache
+def _ranking_table(size: int, n_total: int, n_max: int) -> np.ndarray:
+    """
+    Returns the table `T[k, m, v]` of the number of configurations of `k`
+    sites holding `m - v'` particles for all `v' < v`, that is the number of
+    configurations that precede lexicographically those where a site followed by
+    `k` other sites, holding `m` particles in total, has occupation `v`.
+
+    The rank of a configuration is then the sum over the sites of
+    `T[k_i, m_i, v_i]`, where `k_i` is the number of sites after site `i`,
+    `m_i` the number of particles on site `i` and after, and `v_i` its occupation.
+    """
+    n_total = max(n_total, 0)
+    counts = _bounded_compositions_table(size, n_total, n_max)
+
+    table = np.zeros((size + 1, n_total + 1, n_max + 2), dtype=np.int64)
+    for k in range(size + 1):
+        for m in range(n_total + 1):
+            for v in range(n_max + 1):
+                c = counts[k][m - v] if m >= v else 0
+                table[k, m, v + 1] = table[k, m, v] + c
+    # Entries that cannot be reached by a valid state may be larger than the
+    # number of states, and are clipped to avoid overflows.
+    return np.minimum(table, max_states).astype(np.int32)
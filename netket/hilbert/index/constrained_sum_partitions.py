@@ -9,7 +9,6 @@ from netket.utils.types import Array
 from netket.hilbert.constraint import SumOnPartitionConstraint
 
 from .base import HilbertIndex, is_indexable
-from .unconstrained import LookupTableHilbertIndex
 from .constrained_sum import SumConstrainedHilbertIndex
 from .constrained_generic import optimalConstrainedHilbertindex
 
@@ -35,8 +34,12 @@ def optimalConstrainedHilbertindex(
 @struct.dataclass
 class SumOnPartitionConstrainedHilbertIndex(HilbertIndex):
     """
-    Specialized implementation for a constrained space with a SumConstraint.
-    Does not require the unconstrained space to be indexable.
+    Specialized implementation for a constrained space with a
+    SumOnPartitionConstraint. Does not require the unconstrained space to be
+    indexable.
+
+    The states are numbered in lexicographic order by combining the numbers of
+    the states of every partition in a mixed-radix representation.
     """
 
     sub_indices: list[SumConstrainedHilbertIndex] = struct.field(pytree_node=False)
@@ -53,65 +56,39 @@ class SumOnPartitionConstrainedHilbertIndex(HilbertIndex):
     def n_states(self):
         return math.prod(s.n_states for s in self.sub_indices)
 
-    def states_to_numbers(self, states: Array) -> Array:
-        return self._lookup_table.states_to_numbers(states)
-
-    def numbers_to_states(self, numbers: Array):
-        return self._lookup_table.numbers_to_states(numbers)
+    @property
+    def _basis(self) -> tuple[int, ...]:
+        # number of states of all the partitions after each partition
+        basis = [1]
+        for index in self.sub_indices[:0:-1]:
+            basis.insert(0, basis[0] * index.n_states)
+        return tuple(basis)
 
-    def all_states(self):
-        return self._lookup_table.all_states()
+    @jax.jit
+    def states_to_numbers(self, states: Array) -> Array:
+        numbers = jnp.zeros(states.shape[:-1], dtype=jnp.int32)
+        start = 0
+        for index, base in zip(self.sub_indices, self._basis):
+            sub_states = states[..., start : start + index.size]
+            numbers = numbers + base * index.states_to_numbers(sub_states)
+            start += index.size
+        return numbers
 
     @jax.jit
-    def _compute_all_states(self):
+    def numbers_to_states(self, numbers: Array):
         states = []
-        for index in self.sub_indices:
-            states.append(index.all_states())
-        return combine_configurations(*states)
+        for index, base in zip(self.sub_indices, self._basis):
+            states.append(index.numbers_to_states((numbers // base) % index.n_states))
+        return jnp.concatenate(states, axis=-1)
 
-    @struct.property_cached(pytree_node=True)
-    def _lookup_table(self) -> LookupTableHilbertIndex:
-        with jax.ensure_compile_time_eval():
-            all_states = self._compute_all_states()
-        return LookupTableHilbertIndex(all_states)
+    @jax.jit
+    def all_states(self):
+        return self.numbers_to_states(jnp.arange(self.n_states, dtype=jnp.int32))
 
     @property
     def n_states_bound(self):
-        # upper bound on n_states, exact if n_max == 1
-        # number of combinations to check in _compute_all_states
-        return math.prod(s.n_states_bound for s in self.sub_indices)
+        return self.n_states
 
     @property
     def is_indexable(self):
-        # make sure we have less than than max_states to check in _compute_all_states
-        return is_indexable(self.n_states_bound)
-
-
-def combine_configurations(*matrices):
-    """
-    Concatenate a list of configurations, generating all possible combinations.
-    """
-    if len(matrices) == 1:
-        return matrices[0]
-
-    # Initialize with the first matrix
-    result = matrices[0]
-
-    for matrix in matrices[1:]:
-        M1, N1 = result.shape
-        M2, N2 = matrix.shape
-
-        # Reshape matrices to make use of broadcasting
-        result_reshaped = result[:, jnp.newaxis, :]
-        matrix_reshaped = matrix[jnp.newaxis, :, :]
-
-        # Create the resulting matrix by concatenating along the last axis
-        result = jnp.concatenate(
-            (result_reshaped.repeat(M2, axis=1), matrix_reshaped.repeat(M1, axis=0)),
-            axis=-1,
-        )
-
-        # Reshape to the new form
-        result = result.reshape(M1 * M2, N1 + N2)
-
-    return result
+        return is_indexable(self.n_states)
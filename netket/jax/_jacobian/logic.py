@@ -22,12 +22,13 @@ from jax.tree_util import Partial
 
 from netket.utils import config
 from netket.utils import timing
-from netket.utils.types import Array, PyTree
+from netket.utils.types import Array, DType, PyTree
 from netket.jax import (
     tree_to_real,
     vmap_chunked,
 )
 from netket.jax.sharding import sharding_decorator
+from netket.jax._math import _reduced_precision_dtype
 
 from . import jacobian_dense
 from . import jacobian_pytree
@@ -42,6 +43,7 @@ from . import jacobian_pytree
         "chunk_size",
         "center",
         "dense",
+        "dtype",
         "_sqrt_rescale",
     ),
 )
@@ -56,6 +58,7 @@ def jacobian(
     chunk_size: int | None = None,
     center: bool = False,
     dense: bool = False,
+    dtype: DType | None = None,
     _sqrt_rescale: bool = False,
     _axis_0_is_sharded: bool = None,  # type: ignore[attr-defined]
 ) -> PyTree:
@@ -134,6 +137,13 @@ def jacobian(
             are the derivatives wrt the real part of the parameters, while the
             second :math:`N_\text{pars}` elements are the derivatives wrt the
             imaginary part of the paramters.
+        dtype: Optional floating point dtype (such as :code:`jnp.float32` or
+            :code:`jnp.bfloat16`) in which the jacobian is stored. Every chunk of
+            the jacobian is converted to this precision as soon as it is computed,
+            so that the full jacobian is never materialized in the precision of
+            the parameters. Complex jacobians are stored in the complex dtype
+            with the same precision, or in :code:`jnp.complex64` if there is none.
+            (Defaults to the precision of the parameters).
         _sqrt_rescale: **internal flag** (do not rely on it) a boolean flag
             (disabled by default). If enabled, the jacobian is rescaled by
             :math:`1/\sqrt{N_\text{samples}}` to match the scaling emerging in
@@ -343,6 +353,9 @@ def jacobian(
     else:
         f = forward_fn
 
+    if dtype is not None:
+        jacobian_fun = _with_output_precision(jacobian_fun, dtype)
+
     # jacobians is a tree with leaf shapes:
     # - (n_samples, 2, ...) if mode complex, holding the real and imaginary jacobian
     # - (n_samples, ...) if mode real/holomorphic
@@ -397,6 +410,21 @@ def jacobian(
     return jacobians
 
 
+def _with_output_precision(jacobian_fun, dtype):
+    """
+    Wraps the function computing the jacobian so that its output is converted
+    to the precision of `dtype`.
+    """
+
+    def _jacobian_fun(f, params, σ):
+        return jax.tree_util.tree_map(
+            lambda x: x.astype(_reduced_precision_dtype(dtype, x.dtype)),
+            jacobian_fun(f, params, σ),
+        )
+
+    return _jacobian_fun
+
+
 def _multiply_by_pdf(oks, pdf):
     """
     Computes  O'ⱼ̨ₖ = Oⱼₖ pⱼ .
@@ -68,3 +68,60 @@ def logdet_cmplx(A: Array) -> jax.Array:
     sign, logabsdet = jnp.linalg.slogdet(A)
     cplx_type = dtype_complex(A.dtype)
     return logabsdet.astype(cplx_type) + jnp.log(sign.astype(cplx_type))
+
+
+def _reduced_precision_dtype(typ, like):
+    """
+    Returns the dtype with the precision of `typ` and the kind (real or complex)
+    of `like`.
+    """
+    if jnp.issubdtype(like, jnp.complexfloating) and not jnp.issubdtype(
+        typ, jnp.complexfloating
+    ):
+        if typ == jnp.dtype("float64"):
+            return jnp.dtype("complex128")
+        # There are no complex types with less than single precision
+        return jnp.dtype("complex64")
+    return jnp.dtype(typ)
+
+
+def matmul_mixed_precision(a: Array, b: Array, *, dtype=None) -> Array:
+    """
+    Computes :code:`a @ b`, where one of the two operands (usually a large matrix)
+    is stored in a lower precision than the other (usually a vector), without
+    materializing a copy of the former in higher precision.
+
+    The operand with the higher precision is split into the sum of two terms
+    represented in the lower precision, :math:`b = b_{hi} + b_{lo}`, which
+    recovers most of its accuracy, and the products are accumulated in `dtype`.
+
+    Args:
+        a: The first operand.
+        b: The second operand.
+        dtype: The dtype used to accumulate the products and of the output. Defaults
+            to the promoted dtype of `a` and `b`.
+    """
+    if dtype is None:
+        dtype = jnp.result_type(a, b)
+    if a.dtype == b.dtype:
+        return jnp.matmul(a, b, preferred_element_type=dtype)
+
+    def _bits(x):
+        return jnp.finfo(x.dtype).bits
+
+    def _split(x, low_dtype):
+        low_dtype = _reduced_precision_dtype(low_dtype, x.dtype)
+        x_hi = x.astype(low_dtype)
+        x_lo = (x - x_hi.astype(x.dtype)).astype(low_dtype)
+        return x_hi, x_lo
+
+    if _bits(a) < _bits(b):
+        b_hi, b_lo = _split(b, a.dtype)
+        return jnp.matmul(a, b_hi, preferred_element_type=dtype) + jnp.matmul(
+            a, b_lo, preferred_element_type=dtype
+        )
+    else:
+        a_hi, a_lo = _split(a, b.dtype)
+        return jnp.matmul(a_hi, b, preferred_element_type=dtype) + jnp.matmul(
+            a_lo, b, preferred_element_type=dtype
+        )
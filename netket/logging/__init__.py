@@ -15,6 +15,7 @@
 from .base import AbstractLog
 from .runtime_log import RuntimeLog
 from .json_log import JsonLog
+from .json_lines_log import JsonLinesLog
 from .state_log import StateLog
 from .tensorboard import TensorBoardLog
 
@@ -0,0 +1,137 @@
+# Copyright 2026 The NetKet Authors - All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any
+
+import orjson
+
+from netket.utils.history import History, HistoryDict
+
+from .json_log import JsonLog
+from .runtime_log import default
+
+
+class JsonLinesLog(JsonLog):
+    """
+    This logger streams expectation values and other log data to a
+    `JSON-lines <https://jsonlines.org/>`_ file and can save the latest model
+    parameters in MessagePack encoding to a separate file.
+
+    It behaves like :class:`netket.logging.JsonLog`, but every time the data is
+    flushed only the iterations logged since the previous flush are appended to
+    the file, as a new line. The cost of flushing therefore does not grow with
+    the length of the simulation.
+
+    Every line of the file has the same nested structure as the file written by
+    :class:`~netket.logging.JsonLog`, restricted to the new iterations. The
+    complete log can be loaded with :meth:`~netket.logging.JsonLinesLog.load`
+    (or :meth:`HistoryDict.from_file <netket.utils.history.HistoryDict.from_file>`),
+    which concatenates all lines and reassembles the history objects.
+
+    .. code:: python
+
+        log = nk.logging.JsonLinesLog("output")
+        driver.run(100, out=log)
+
+        data = nk.logging.JsonLinesLog.load("output.jsonl")
+        data["Energy"].Mean
+    """
+
+    _log_extension: str = ".jsonl"
+
+    def __init__(self, output_prefix: str, *args, **kwargs):
+        """
+        Construct a JSON-lines Logger.
+
+        Args:
+            output_prefix: the name of the output files before the extension
+            save_params_every: every how many iterations should machine parameters be
+                flushed to file
+            write_every: every how many iterations should data be flushed to file
+            mode: Specify the behaviour in case the file already exists at this
+                output_prefix. Options are
+                - `[w]rite`: (default) overwrites file if it already exists;
+                - `[x]` or `fail`: fails if file already exists;
+            save_params: bool flag indicating whether variables of the variational state
+                should be serialized at some interval. The output file is overwritten
+                every time variables are saved again.
+            autoflush_cost: Maximum fraction of runtime that can be dedicated to
+                serializing data. Defaults to 0.005 (0.5 per cent)
+        """
+        super().__init__(output_prefix, *args, **kwargs)
+
+        # Number of iterations of every history already written to file, indexed
+        # by the path of the history in the data tree.
+        self._n_written: dict[tuple, int] = {}
+        # The file is truncated on the first write, and appended to afterwards.
+        self._file_created = False
+
+    def _write_log(self):
+        new_data = _new_entries(self.data, (), self._n_written)
+        if new_data is None and self._file_created:
+            return
+
+        with open(
+            self._prefix + self._log_extension, "ab" if self._file_created else "wb"
+        ) as io:
+            if new_data is not None:
+                io.write(
+                    orjson.dumps(
+                        new_data,
+                        default=default,
+                        option=orjson.OPT_SERIALIZE_NUMPY,
+                    )
+                )
+                io.write(b"\n")
+        self._file_created = True
+
+    @staticmethod
+    def load(fname: str) -> HistoryDict:
+        """
+        Loads the data written by a :class:`~netket.logging.JsonLinesLog` into an
+        :class:`~netket.utils.history.HistoryDict`.
+
+        Args:
+            fname: The name of the file to read, including the `.jsonl` extension.
+        """
+        return HistoryDict.from_jsonl_file(fname)
+
+
+def _new_entries(tree: Any, path: tuple, n_written: dict[tuple, int]) -> Any:
+    """
+    Returns the subtree of `tree` containing only the iterations of every
+    :class:`~netket.utils.history.History` that are not yet written to file, or
+    `None` if there is none, and updates `n_written` accordingly.
+    """
+    if isinstance(tree, History):
+        n = n_written.get(path, 0)
+        if len(tree) <= n:
+            return None
+        n_written[path] = len(tree)
+        return {k: v[n:] for k, v in tree.to_dict().items()}
+    elif isinstance(tree, (dict, HistoryDict)):
+        result = {}
+        for key, val in tree.items():
+            new_val = _new_entries(val, path + (key,), n_written)
+            if new_val is not None:
+                result[key] = new_val
+        return result if len(result) > 0 else None
+    elif isinstance(tree, (list, tuple)):
+        # Containers are written in full, padding with empty entries, so that
+        # the position of every history is preserved.
+        result = [
+            _new_entries(val, path + (i,), n_written) for i, val in enumerate(tree)
+        ]
+        return result if any(r is not None for r in result) else None
+    return None
@@ -46,8 +46,18 @@ class JsonLog(RuntimeLog):
     have a subfield `iter` with the iterations at which that quantity has been computed,
     then `Mean` and others.
     Complex numbers are logged as dictionaries :code:`{'real':list, 'imag':list}`.
+
+    .. note::
+
+        Every time the data is flushed, the whole history is serialized again, so
+        the cost of flushing grows with the length of the simulation. For very long
+        simulations consider using :class:`netket.logging.JsonLinesLog`, which only
+        appends the new data to the file.
     """
 
+    _log_extension: str = ".log"
+    """The extension of the file where the logged data is written."""
+
     def __init__(
         self,
         output_prefix: str,
@@ -94,7 +104,7 @@ class JsonLog(RuntimeLog):
         if mode == "append":
             raise ValueError("Append mode is no longer supported.")
 
-        file_exists = _path.exists(output_prefix + ".log") or _path.exists(
+        file_exists = _path.exists(output_prefix + self._log_extension) or _path.exists(
             output_prefix + ".mpack"
         )
 
@@ -117,7 +127,10 @@ class JsonLog(RuntimeLog):
         self._steps_notflushed_write = 0
         self._steps_notflushed_pars = 0
         self._save_params = save_params
-        self._files_open = [output_prefix + ".log", output_prefix + ".mpack"]
+        self._files_open = [
+            output_prefix + self._log_extension,
+            output_prefix + ".mpack",
+        ]
 
         self._autoflush_cost = autoflush_cost
         self._last_flush_time = time.time()
@@ -169,12 +182,18 @@ class JsonLog(RuntimeLog):
         # Time how long flushing data takes.
         self._last_flush_time = time.time()
         if self._is_master_process:
-            self.serialize(self._prefix + ".log")
+            self._write_log()
         self._last_flush_runtime = time.time() - self._last_flush_time
 
         self._flush_log_time += self._last_flush_runtime
         self._steps_notflushed_write = 0
 
+    def _write_log(self):
+        """
+        Writes the logged data to the log file. Only called on the master process.
+        """
+        self.serialize(self._prefix + self._log_extension)
+
     def _flush_params(self, variational_state):
         if not self._save_params:
             return
@@ -214,7 +233,7 @@ class JsonLog(RuntimeLog):
                 self.flush()
 
     def __repr__(self):
-        _str = f"JsonLog('{self._prefix}', mode={self._file_mode}, "
+        _str = f"{type(self).__name__}('{self._prefix}', mode={self._file_mode}, "
         _str = _str + f"autoflush_cost={self._autoflush_cost})"
         _str = _str + "\n  Runtime cost:"
         _str = _str + f"\n  \tLog:    {self._flush_log_time}"
@@ -33,6 +33,8 @@ from netket.nn.symmetric_linear import (
     DenseSymmFFT,
     DenseEquivariantFFT,
     DenseEquivariantIrrep,
+    _point_group_product_rows,
+    _space_group_fft_shape,
 )
 
 # Same as netket.nn.symmetric_linear.default_equivariant_initializer
@@ -59,6 +61,7 @@ class GCNN_FFT(nn.Module):
     product_table: HashableArray
     """Product table describing the algebra of the symmetry group
     Numpy/Jax arrays must be wrapped into an :class:`netket.utils.HashableArray`.
+    Only the rows corresponding to point-group symmetries are needed.
     """
     shape: tuple
     """Shape of the translation group"""
@@ -284,6 +287,7 @@ class GCNN_Parity_FFT(nn.Module):
     product_table: HashableArray
     """Product table describing the algebra of the symmetry group
     Numpy/Jax arrays must be wrapped into an :class:`netket.utils.HashableArray`.
+    Only the rows corresponding to point-group symmetries are needed.
     """
     shape: tuple
     """Shape of the translation group"""
@@ -638,6 +642,7 @@ def GCNN(
             fourier transform over the translation group, a fourier transform using
             the irreducible representations or by constructing the full kernel matrix.
         shape: A tuple specifying the dimensions of the translation group.
+            Inferred when symmetries is a lattice or a space group.
         layers: Number of layers (not including sum layer over output).
         features: Number of features in each layer starting from the input. If a single
             number is given, all layers will have the same number of features.
@@ -692,9 +697,13 @@ def GCNN(
                 "in order to construct the space group"
             )
     elif isinstance(symmetries, PermutationGroup):
-        # If we get a group and default to irrep projection
+        fft_shape = _space_group_fft_shape(symmetries)
+        if shape is None:
+            shape = fft_shape
+        # Space groups are convolved with FFTs over the translations and a dense
+        # mixing of the point group, otherwise default to irrep projection
         if mode == "auto":
-            mode = "irreps"
+            mode = "irreps" if fft_shape is None else "fft"
         sg = symmetries
     else:
         if irreps is not None and (mode == "irreps" or mode == "auto"):
@@ -741,7 +750,7 @@ def GCNN(
     if mode == "fft":
         sym = HashableArray(np.asarray(sg))
         if product_table is None:
-            product_table = HashableArray(sg.product_table)
+            product_table = _point_group_product_rows(sg, shape)
         if parity:
             return GCNN_Parity_FFT(
                 symmetries=sym,
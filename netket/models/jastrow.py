@@ -42,30 +42,89 @@ class Jastrow(nn.Module):
             "kernel", self.kernel_init, (nv * (nv - 1) // 2,), self.param_dtype
         )
 
-        # .at[].set is VERY slow for complex128 numbers in jax.
-        # So we do it on the real-valued real and imaginary parts separately and then join them back
-        # See issue https://github.com/jax-ml/jax/issues/24872
-        if jnp.issubdtype(self.param_dtype, jnp.complex128):
-            Wr = (
-                jnp.zeros((nv, nv), dtype=kernel.real.dtype)
-                .at[il]
-                .set(kernel.real, unique_indices=True, indices_are_sorted=True)
-            )
-            Wi = (
-                jnp.zeros((nv, nv), dtype=kernel.imag.dtype)
-                .at[il]
-                .set(kernel.imag, unique_indices=True, indices_are_sorted=True)
-            )
-            W = Wr + 1j * Wi
-
-        else:
-            W = (
-                jnp.zeros((nv, nv), dtype=self.param_dtype)
-                .at[il]
-                .set(kernel, unique_indices=True, indices_are_sorted=True)
-            )
+        W = _lower_triangular_matrix(kernel, nv, il)
 
         W, x_in = promote_dtype(W, x_in, dtype=None)
         y = jnp.einsum("...i,ij,...j", x_in, W, x_in)
 
         return y
+
+    def init_fast_update(self, x_in: Array):
+        r"""
+        Computes the log-amplitude and the row sums
+        :math:`h_i = \sum_j (W_{ij} + W_{ji}) s_j`, used as cache by
+        :meth:`~netket.models.Jastrow.fast_update`.
+        """
+        nv = x_in.shape[-1]
+        il = jnp.tril_indices(nv, k=-1)
+        kernel = self.variables["params"]["kernel"]
+
+        W = _lower_triangular_matrix(kernel, nv, il)
+        W, x_in = promote_dtype(W, x_in, dtype=None)
+        h = x_in @ (W + W.T)
+        y = 0.5 * jnp.einsum("...i,...i", x_in, h)
+        return y, (y, h)
+
+    def fast_update(self, x_in: Array, x_p: Array, sites: Array, cache):
+        r"""
+        Computes the log-amplitude of `x_p`, which differs from `x_in` only on the
+        degrees of freedom `sites`, updating the row sums in :math:`O(N)`
+        operations per modified site.
+        """
+        y, h = cache
+        nv = x_in.shape[-1]
+        kernel = self.variables["params"]["kernel"]
+
+        # columns W_sym[:, k] of the symmetric matrix for every modified site k,
+        # gathered directly from the packed lower-triangular kernel.
+        i = jnp.arange(nv)
+        lo = jnp.minimum(i, sites[..., None])
+        hi = jnp.maximum(i, sites[..., None])
+        cols = jnp.take(kernel, hi * (hi - 1) // 2 + lo, mode="fill", fill_value=0)
+        cols = jnp.where(i == sites[..., None], 0, cols)
+
+        delta = jnp.take_along_axis(
+            x_p, sites, axis=-1, mode="fill", fill_value=0
+        ) - jnp.take_along_axis(x_in, sites, axis=-1, mode="fill", fill_value=0)
+        cols, delta = promote_dtype(cols, delta, dtype=None)
+
+        # W_sym restricted to the modified sites
+        W_kk = jnp.take_along_axis(
+            cols, sites[..., None, :], axis=-1, mode="fill", fill_value=0
+        )
+        h_k = jnp.take_along_axis(h, sites, axis=-1, mode="fill", fill_value=0)
+
+        y = (
+            y
+            + jnp.einsum("...k,...k", delta, h_k)
+            + 0.5 * jnp.einsum("...k,...kl,...l", delta, W_kk, delta)
+        )
+        h = h + jnp.einsum("...k,...ki", delta, cols)
+        return y, (y, h)
+
+
+def _lower_triangular_matrix(kernel, nv, il):
+    # .at[].set is VERY slow for complex128 numbers in jax.
+    # So we do it on the real-valued real and imaginary parts separately and then join them back
+    # See issue https://github.com/jax-ml/jax/issues/24872
+    if jnp.issubdtype(kernel.dtype, jnp.complex128):
+        Wr = (
+            jnp.zeros((nv, nv), dtype=kernel.real.dtype)
+            .at[il]
+            .set(kernel.real, unique_indices=True, indices_are_sorted=True)
+        )
+        Wi = (
+            jnp.zeros((nv, nv), dtype=kernel.imag.dtype)
+            .at[il]
+            .set(kernel.imag, unique_indices=True, indices_are_sorted=True)
+        )
+        W = Wr + 1j * Wi
+
+    else:
+        W = (
+            jnp.zeros((nv, nv), dtype=kernel.dtype)
+            .at[il]
+            .set(kernel, unique_indices=True, indices_are_sorted=True)
+        )
+
+    return W
@@ -80,6 +80,40 @@ class RBM(nn.Module):
         else:
             return x
 
+    def _log_psi_from_preactivation(self, input, theta):
+        x = jnp.sum(self.activation(theta), axis=-1)
+        if self.use_visible_bias:
+            x = x + jnp.dot(input, self.variables["params"]["visible_bias"])
+        return x
+
+    def init_fast_update(self, input):
+        r"""
+        Computes the log-amplitude and the hidden-layer pre-activations
+        :math:`\theta = W\sigma + b`, used as cache by
+        :meth:`~netket.models.RBM.fast_update`.
+        """
+        params = self.variables["params"]["Dense"]
+        theta = jnp.dot(input, params["kernel"], precision=self.precision)
+        if self.use_hidden_bias:
+            theta = theta + params["bias"]
+        return self._log_psi_from_preactivation(input, theta), theta
+
+    def fast_update(self, input, input_p, sites, theta):
+        r"""
+        Computes the log-amplitude of `input_p`, which differs from `input` only
+        on the degrees of freedom `sites`, updating the pre-activations `theta`
+        in :math:`O(N_{\text{hidden}})` operations per modified site.
+        """
+        kernel = self.variables["params"]["Dense"]["kernel"]
+        delta = jnp.take_along_axis(
+            input_p, sites, axis=-1, mode="fill", fill_value=0
+        ) - jnp.take_along_axis(input, sites, axis=-1, mode="fill", fill_value=0)
+        rows = jnp.take(kernel, sites, axis=0, mode="fill", fill_value=0)
+        theta = theta + jnp.einsum(
+            "...k,...kh->...h", delta, rows, precision=self.precision
+        )
+        return self._log_psi_from_preactivation(input_p, theta), theta
+
 
 class RBMModPhase(nn.Module):
     r"""
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import flax.linen as nn
+import jax
 import jax.numpy as jnp
 
 from functools import partial
@@ -223,6 +224,84 @@ class Slater2nd(nn.Module):
 
         return log_sd(n)
 
+    def _full_orbitals(self):
+        # (n_modes, n_fermions) matrix of all orbitals. In the spin-conserving case
+        # this is block-diagonal, and the determinant of its rows selected by the
+        # occupied modes is the product of the determinants of every spin sector.
+        if self.generalized:
+            return self.orbitals
+        return jax.scipy.linalg.block_diag(*self.orbitals)
+
+    def init_fast_update(self, n):
+        """
+        Computes the log-amplitude together with the positions of the occupied
+        modes and the inverse of the Slater matrix, used as cache by
+        :meth:`~netket.models.Slater2nd.fast_update`.
+        """
+        if not jnp.issubdtype(n, int):
+            n = jnp.isclose(n, 1)
+        orbitals = self._full_orbitals()
+
+        @partial(jnp.vectorize, signature="(n)->(f),(f,f)")
+        def _init(n):
+            R = n.nonzero(size=self.hilbert.n_fermions)[0]
+            return R, jnp.linalg.inv(orbitals[R, :])
+
+        R, A_inv = _init(n)
+        log_psi = self(n)
+        return log_psi, (R, A_inv, log_psi)
+
+    def fast_update(self, n, n_p, sites, cache):
+        """
+        Computes the log-amplitude of `n_p`, which is obtained from `n` by hopping
+        a single fermion, updating the inverse Slater matrix with the
+        Sherman-Morrison formula in :math:`O(N_f^2)` operations.
+
+        The rows of the cached Slater matrix are not kept sorted. The sign of the
+        permutation is tracked in the imaginary part of the log-amplitude instead.
+        """
+        if sites.shape[-1] > 2:
+            raise NotImplementedError(
+                "The fast update of Slater2nd only supports transitions that hop "
+                "a single fermion (modifying at most 2 modes), but the rule can "
+                f"modify up to {sites.shape[-1]} modes."
+            )
+        if not jnp.issubdtype(n, int):
+            n = jnp.isclose(n, 1)
+            n_p = jnp.isclose(n_p, 1)
+        orbitals = self._full_orbitals()
+
+        @partial(jnp.vectorize, signature="(n),(n),(k),(f),(f,f),()->(f),(f,f),()")
+        def _update(n, n_p, sites, R, A_inv, log_psi):
+            occ = jnp.take(n, sites, mode="fill", fill_value=0)
+            occ_p = jnp.take(n_p, sites, mode="fill", fill_value=0)
+            removed = (occ == 1) & (occ_p == 0)
+            added = (occ == 0) & (occ_p == 1)
+            is_hop = removed.any() & added.any()
+
+            a = sites[jnp.argmax(removed)]
+            b = sites[jnp.argmax(added)]
+            k = jnp.argmax(R == a)
+
+            # replace the row of mode a with the one of mode b
+            col = A_inv[:, k]
+            u = jnp.where(is_hop, orbitals[b] - orbitals[a], 0)
+            ratio = jnp.where(is_hop, jnp.dot(orbitals[b], col), 1)
+            A_inv = A_inv - jnp.outer(col, u @ A_inv) / ratio
+
+            # fermionic sign of the hop
+            modes = jnp.arange(n.shape[-1])
+            between = (modes > jnp.minimum(a, b)) & (modes < jnp.maximum(a, b))
+            n_between = jnp.sum(jnp.where(between, n, 0))
+            sign = jnp.where(is_hop & (n_between % 2 == 1), 1j * jnp.pi, 0)
+
+            log_psi = log_psi + jnp.log(ratio.astype(log_psi.dtype)) + sign
+            R = R.at[k].set(jnp.where(is_hop, b, R[k]))
+            return R, A_inv, log_psi
+
+        R, A_inv, log_psi = _update(n, n_p, sites, *cache)
+        return log_psi, (R, A_inv, log_psi)
+
 
 class MultiSlater2nd(nn.Module):
     r"""
@@ -28,12 +28,37 @@ from netket.utils.types import Array, DType, NNInitFunc
 from netket.utils.group import PermutationGroup
 from collections.abc import Sequence
 from netket.graph import Graph, Lattice
+from netket.graph.space_group import SpaceGroup
 from netket.errors import SymmModuleInvalidInputShape
 
 # All layers defined here have kernels of shape [out_features, in_features, n_symm]
 default_equivariant_initializer = lecun_normal(in_axis=1, out_axis=0)
 
 
+def _space_group_fft_shape(sg) -> tuple | None:
+    """
+    The shape of the translation group of `sg` if the FFT-based layers can be used
+    with it, i.e. if `sg` is a :class:`~netket.graph.space_group.SpaceGroup` on a
+    lattice that is periodic along all axes, otherwise None.
+    """
+    if isinstance(sg, SpaceGroup) and all(sg.lattice.pbc):
+        return tuple(int(x) for x in sg.lattice.extent)
+    return None
+
+
+def _point_group_product_rows(sg: PermutationGroup, shape: tuple) -> HashableArray:
+    """
+    The rows of the product table of `sg` corresponding to point-group symmetries,
+    which are all that is used by :class:`DenseEquivariantFFT`. Computed without
+    constructing the full product table for groups that support it.
+    """
+    n_point = len(sg) // int(np.prod(shape))
+    rows = sg.product_table_entries(
+        np.arange(n_point)[:, np.newaxis], np.arange(len(sg))[np.newaxis, :]
+    )
+    return HashableArray(rows)
+
+
 class DenseSymmMatrix(Module):
     r"""Implements a symmetrized linear transformation over a permutation group
     using matrix multiplication."""
@@ -267,7 +292,11 @@ class DenseEquivariantFFT(Module):
     """
 
     product_table: HashableArray
-    """Product table for space group."""
+    """Product table for space group. Only the rows corresponding to point-group
+    symmetries are used, so it is sufficient to pass the first
+    :code:`n_symm // prod(shape)` rows of the table, which can be computed with
+    :meth:`~netket.utils.group.FiniteGroup.product_table_entries` without
+    constructing the full table."""
     features: int
     """The number of output features. Will be the second dimension of the output."""
     shape: tuple
@@ -291,7 +320,7 @@ class DenseEquivariantFFT(Module):
     def setup(self):
         pt = np.asarray(self.product_table)
 
-        self.n_symm = len(pt)
+        self.n_symm = pt.shape[1]
         self.n_cells = np.prod(np.asarray(self.shape))
         self.n_point = self.n_symm // self.n_cells
         if self.mask is not None:
@@ -687,6 +716,7 @@ def DenseSymm(
             transform, matrix multiplication, or to choose a sensible default
             based on the symmetry group.
         shape: A tuple specifying the dimensions of the translation group.
+            Inferred when symmetries is a lattice or a space group.
         features: The number of output features. The full output shape
             is :code:`[n_batch,features,n_symm]`.
         use_bias: A bool specifying whether to add a bias to the output (default: True).
@@ -717,6 +747,14 @@ def DenseSymm(
                 "in order to construct the space group"
             )
         sym = HashableArray(np.asarray(symmetries.automorphisms()))
+    elif isinstance(symmetries, PermutationGroup):
+        fft_shape = _space_group_fft_shape(symmetries)
+        if shape is None:
+            shape = fft_shape
+        # space groups can be convolved efficiently with FFTs
+        if mode == "auto" and fft_shape is not None:
+            mode = "fft"
+        sym = HashableArray(np.asarray(symmetries))
     elif isinstance(symmetries, HashableArray):
         sym = symmetries
     else:
@@ -783,6 +821,7 @@ def DenseEquivariant(
             fourier transform over the translation group, a fourier transform using
             the irreducible representations or by constructing the full kernel matrix.
         shape: A tuple specifying the dimensions of the translation group.
+            Inferred when symmetries is a lattice or a space group.
         features: The number of output features. The full output shape
             is [n_batch,features,n_symm].
         use_bias: A bool specifying whether to add a bias to the output (default: True).
@@ -819,9 +858,13 @@ def DenseEquivariant(
                 "in order to construct the space group"
             )
     elif isinstance(symmetries, PermutationGroup):
-        # If we get a group and default to irrep projection
+        fft_shape = _space_group_fft_shape(symmetries)
+        if shape is None:
+            shape = fft_shape
+        # Space groups are convolved with FFTs over the translations and a dense
+        # mixing of the point group, otherwise default to irrep projection
         if mode == "auto":
-            mode = "irreps"
+            mode = "irreps" if fft_shape is None else "fft"
         sg = symmetries
 
     elif isinstance(symmetries, Sequence):
@@ -857,7 +900,7 @@ def DenseEquivariant(
             )
         else:
             return DenseEquivariantFFT(
-                HashableArray(sg.product_table), mask=mask, shape=shape, **kwargs  # type: ignore
+                _point_group_product_rows(sg, shape), mask=mask, shape=shape, **kwargs
             )
     elif mode in ["irreps", "auto"]:
         irreps = tuple(HashableArray(irrep) for irrep in sg.irrep_matrices())
@@ -26,11 +26,12 @@ from ._lazy import Adjoint, Transpose, Squared
 from ._heisenberg import Heisenberg
 
 from ._abstract_super_operator import AbstractSuperOperator
-from ._local_liouvillian import LocalLiouvillian
+from ._local_liouvillian import LocalLiouvillian, LocalLiouvillianJax
 
 from ._continuous_operator import ContinuousOperator
 from ._kinetic import KineticEnergy
 from ._potential import PotentialEnergy
+from ._pair_potential import PairPotential
 
 from ._fermion2nd import (
     FermionOperator2nd,
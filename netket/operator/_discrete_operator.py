@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import deque
+from collections.abc import Callable, Iterable
+from itertools import islice
+
 import numpy as np
 import jax
 import jax.numpy as jnp
@@ -194,7 +198,9 @@ class DiscreteOperator(AbstractOperator[DiscreteHilbert]):
 
         return out
 
-    def to_sparse(self) -> _csr_matrix:
+    def to_sparse(
+        self, *, chunk_size: int | None = None, n_workers: int | None = None
+    ) -> _csr_matrix:
         r"""Returns the sparse matrix representation of the operator. Note that,
         in general, the size of the matrix is exponential in the number of quantum
         numbers, and this operation should thus only be performed for
@@ -202,36 +208,91 @@ class DiscreteOperator(AbstractOperator[DiscreteHilbert]):
 
         This method requires an indexable Hilbert space.
 
+        The matrix is built by streaming blocks of `chunk_size` basis states
+        through :meth:`get_conn_flattened`, writing the results directly into the
+        arrays of the CSR matrix, so that neither all the basis states nor all
+        their connected states need to be held in memory at once.
+
+        Args:
+            chunk_size: The number of rows of the matrix computed at once. Defaults
+                to a number of rows with about :math:`2^{22}` connected elements in
+                total.
+            n_workers: If specified, the blocks of rows are computed in parallel by
+                a pool of `n_workers` processes. This is only useful for large
+                operators whose connected elements are computed with Numba, and is
+                ignored for :class:`~netket.operator.DiscreteJaxOperator`.
+
         Returns:
             The sparse matrix representation of the operator.
         """
         concrete_op = self.collect()
-        hilb = self.hilbert
-
-        x = hilb.all_states()
-
-        sections = np.empty(x.shape[0], dtype=np.int32)
-        x_prime, mels = concrete_op.get_conn_flattened(x, sections)
-
-        numbers = hilb.states_to_numbers(x_prime)
-
-        sections1 = np.empty(sections.size + 1, dtype=np.int32)
-        sections1[1:] = sections
-        sections1[0] = 0
-
-        ## eliminate duplicates from numbers
-        # rows_indices = compute_row_indices(hilb.states_to_numbers(x), sections1)
+        n_states = self.hilbert.n_states
+
+        if chunk_size is None:
+            try:
+                max_conn_size = max(1, concrete_op.max_conn_size)
+            except NotImplementedError:
+                max_conn_size = 1
+            chunk_size = max(1, _TO_SPARSE_CHUNK_CONNS // max_conn_size)
+        chunks = [
+            (start, min(start + chunk_size, n_states))
+            for start in range(0, n_states, chunk_size)
+        ]
+
+        from ._discrete_operator_jax import DiscreteJaxOperator
+
+        if n_workers is not None and not isinstance(concrete_op, DiscreteJaxOperator):
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Workers are spawned rather than forked because jax is not fork-safe.
+            executor = ProcessPoolExecutor(
+                n_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            results = _map_bounded(
+                executor,
+                _to_sparse_chunk,
+                ((concrete_op, *c) for c in chunks),
+                max_pending=2 * n_workers,
+            )
+        else:
+            executor = None
+            results = (_to_sparse_chunk(concrete_op, *c) for c in chunks)
+
+        try:
+            indptr = np.zeros(n_states + 1, dtype=np.int64)
+            indices = np.empty(0, dtype=np.int32)
+            data = None
+            nnz = 0
+            for (start, stop), (sections, numbers, mels) in zip(chunks, results):
+                if data is None:
+                    # estimate the number of non-zeros from the first block
+                    capacity = int(np.ceil(len(mels) * n_states / (stop - start)))
+                    indices = np.empty(capacity, dtype=numbers.dtype)
+                    data = np.empty(capacity, dtype=mels.dtype)
+                if nnz + len(mels) > len(data):
+                    capacity = max(2 * len(data), nnz + len(mels))
+                    indices = _grow_buffer(indices, nnz, capacity)
+                    data = _grow_buffer(data, nnz, capacity)
+
+                indices[nnz : nnz + len(mels)] = numbers
+                data[nnz : nnz + len(mels)] = mels
+                indptr[start + 1 : stop + 1] = nnz + sections
+                nnz += len(mels)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if data is None:
+            data = np.empty(0, dtype=self.dtype)
+        if nnz < np.iinfo(np.int32).max:
+            indptr = indptr.astype(np.int32)
 
         return _csr_matrix(
-            (mels, numbers, sections1),
-            shape=(self.hilbert.n_states, self.hilbert.n_states),
+            (data[:nnz], indices[:nnz], indptr),
+            shape=(n_states, n_states),
         )
 
-        # return _csr_matrix(
-        #    (mels, (rows_indices, numbers)),
-        #    shape=(self.hilbert.n_states, self.hilbert.n_states),
-        # )
-
     def to_dense(self) -> np.ndarray:
         r"""Returns the dense matrix representation of the operator. Note that,
         in general, the size of the matrix is exponential in the number of quantum
@@ -299,3 +360,44 @@ class DiscreteOperator(AbstractOperator[DiscreteHilbert]):
 
     def to_linear_operator(self):
         return self.to_sparse()
+
+
+_TO_SPARSE_CHUNK_CONNS = 2**22
+"""Default number of connected elements computed at once by `to_sparse`."""
+
+
+def _to_sparse_chunk(op: DiscreteOperator, start: int, stop: int):
+    """
+    Computes the rows `start:stop` of the sparse matrix of `op`, returning the
+    end of every row, the column indices and the matrix elements.
+    """
+    hilb = op.hilbert
+    x = hilb.numbers_to_states(np.arange(start, stop, dtype=np.int32))
+
+    sections = np.empty(stop - start, dtype=np.int32)
+    x_prime, mels = op.get_conn_flattened(x, sections)
+    numbers = np.asarray(hilb.states_to_numbers(x_prime))
+    return sections, numbers, np.asarray(mels)
+
+
+def _grow_buffer(buffer: np.ndarray, n: int, capacity: int) -> np.ndarray:
+    new_buffer = np.empty(capacity, dtype=buffer.dtype)
+    new_buffer[:n] = buffer[:n]
+    return new_buffer
+
+
+def _map_bounded(executor, fun: Callable, arguments: Iterable, max_pending: int):
+    """
+    Like `executor.map(fun, *zip(*arguments))`, but submits at most `max_pending`
+    tasks ahead of the results which have been consumed, so that the results of
+    all the tasks are never held in memory at once.
+    """
+    arguments = iter(arguments)
+    pending = deque(
+        executor.submit(fun, *args) for args in islice(arguments, max_pending)
+    )
+    while pending:
+        result = pending.popleft().result()
+        for args in islice(arguments, 1):
+            pending.append(executor.submit(fun, *args))
+        yield result
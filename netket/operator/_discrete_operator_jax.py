@@ -221,7 +221,13 @@ class DiscreteJaxOperator(DiscreteOperator):
             # out[:] = _n_conn
         return out
 
-    def to_sparse(self, jax_: bool = False) -> JAXSparse:
+    def to_sparse(
+        self,
+        jax_: bool = False,
+        *,
+        chunk_size: int | None = None,
+        n_workers: int | None = None,
+    ) -> JAXSparse:
         r"""Returns the sparse matrix representation of the operator. Note that,
         in general, the size of the matrix is exponential in the number of quantum
         numbers, and this operation should thus only be performed for
@@ -232,6 +238,11 @@ class DiscreteJaxOperator(DiscreteOperator):
         Args:
             jax_: If True, returns an experimental Jax sparse matrix. If False,
                 returns a normal scipy CSR matrix. False by default.
+            chunk_size: The number of rows of the scipy matrix computed at once
+                (see :meth:`netket.operator.DiscreteOperator.to_sparse`). Ignored
+                if `jax_` is True.
+            n_workers: Ignored, as the connected elements of jax operators are
+                computed by a single jitted function.
 
         Returns:
             The sparse jax matrix representation of the operator.
@@ -239,7 +250,7 @@ class DiscreteJaxOperator(DiscreteOperator):
 
         if not jax_:
             # calls the get_conn_flattened code path
-            return super().to_sparse()
+            return super().to_sparse(chunk_size=chunk_size, n_workers=n_workers)
 
         x = self.hilbert.all_states()
         n = x.shape[0]
@@ -134,7 +134,7 @@ class FermionOperator2ndNumba(FermionOperator2ndBase):
         )
 
     @staticmethod
-    @numba.jit(nopython=True)
+    @numba.jit(nopython=True, nogil=True)
     def _flattened_kernel(  # pragma: no cover
         x,
         sections,
@@ -51,28 +51,95 @@ def jacfwd(f):
     return jacfun
 
 
+def _hessian_diagonal(grad_fun: Callable, x: Array) -> Array:
+    """
+    Diagonal of the Jacobian of `grad_fun` at `x`, computed one column at a time
+    with forward-mode derivatives, so that the memory does not grow quadratically
+    with the size of `x`.
+    """
+
+    def diagonal_element(_, i):
+        e_i = jnp.zeros_like(x).at[i].set(1)
+        return None, jax.jvp(grad_fun, (x,), (e_i,))[1][i]
+
+    _, diag = jax.lax.scan(diagonal_element, None, jnp.arange(x.shape[0]))
+    return diag
+
+
+def _sample_key(seed: int, x: Array) -> jax.Array:
+    """
+    A random key depending on the seed and on the bits of the sample `x`, so that
+    different samples are probed with independent random vectors.
+    """
+    bits = jax.lax.bitcast_convert_type(x.real.astype(jnp.float32), jnp.uint32)
+    weights = jnp.arange(1, bits.size + 1, dtype=jnp.uint32)
+    return jax.random.fold_in(
+        jax.random.key(seed), jnp.sum(bits * weights, dtype=jnp.uint32)
+    )
+
+
 class KineticEnergy(ContinuousOperator):
     r"""This is the kinetic energy operator (hbar = 1). The local value is given by:
     :math:`E_{kin} = -1/2 ( \sum_i \frac{1}{m_i} (\log(\psi))'^2 + (\log(\psi))'' )`
+
+    The Laplacian of :math:`\log(\psi)` can be computed with different methods,
+    selected with the `laplacian` argument:
+
+    - :code:`"forward"` (default): the second derivatives are computed one
+      coordinate at a time as forward-mode derivatives of the gradient, scanning
+      over the :math:`D` coordinates. The cost is the same as computing the full
+      Hessian, but the memory only grows linearly with :math:`D`.
+    - :code:`"hessian"`: the full :math:`D\times D` Hessian is computed at once
+      and only its diagonal is kept. This is fastest for a small number of
+      coordinates, but cost and memory grow as :math:`D^2`.
+    - :code:`"hutchinson"`: the Laplacian is replaced by the unbiased Hutchinson
+      estimator :math:`z^T M^{-1} H z` averaged over `n_probes` Rademacher vectors
+      :math:`z`, which only requires `n_probes` Hessian-vector products per sample.
+      This adds some variance to the local energies, but is much cheaper when
+      :math:`D` is large.
     """
 
     _is_hermitian: bool = struct.static_field()
     _mass: Array = struct.field()
+    _laplacian: str = struct.static_field()
+    _n_probes: int = struct.static_field()
+    _seed: int = struct.static_field()
 
     def __init__(
         self,
         hilbert: AbstractHilbert,
         mass: float | list[float],
         dtype: DType | None = None,
+        *,
+        laplacian: str = "forward",
+        n_probes: int = 1,
+        seed: int = 0,
     ):
         r"""Args:
         hilbert: The underlying Hilbert space on which the operator is defined
         mass: float if all masses are the same, list indicating the mass of each particle otherwise
         dtype: Data type of the mass
+        laplacian: Method used to compute the Laplacian, one of
+            :code:`"forward"`, :code:`"hessian"` or :code:`"hutchinson"`
+            (see above).
+        n_probes: Number of random vectors per sample used by the Hutchinson
+            estimator (only used if :code:`laplacian="hutchinson"`).
+        seed: Seed of the random vectors used by the Hutchinson estimator, which
+            are also determined by the samples they are applied to.
         """
+        if laplacian not in ("forward", "hessian", "hutchinson"):
+            raise ValueError(
+                f"Unknown laplacian method '{laplacian}'. Valid values are "
+                "'forward', 'hessian' or 'hutchinson'."
+            )
+        if n_probes < 1:
+            raise ValueError(f"n_probes must be a positive integer (got {n_probes}).")
 
         self._mass = jnp.asarray(mass, dtype=dtype)
         self._is_hermitian = np.allclose(self._mass.imag, 0.0)
+        self._laplacian = laplacian
+        self._n_probes = int(n_probes)
+        self._seed = int(seed)
 
         super().__init__(hilbert, self._mass.dtype)
 
@@ -80,6 +147,11 @@ class KineticEnergy(ContinuousOperator):
     def mass(self):
         return self._mass
 
+    @property
+    def laplacian(self) -> str:
+        """The method used to compute the Laplacian of the log-amplitude."""
+        return self._laplacian
+
     @property
     def is_hermitian(self):
         return self._is_hermitian
@@ -96,10 +168,26 @@ class KineticEnergy(ContinuousOperator):
         dlogpsi_x = jacrev(logpsi_x)
         inverse_mass = jnp.reciprocal(self._mass)
 
-        dp_dx2 = jnp.diag(jacfwd(dlogpsi_x)(x)[0].reshape(x.shape[0], x.shape[0]))
-        dp_dx = dlogpsi_x(x)[0][0] ** 2
+        def grad_x(x):
+            return dlogpsi_x(x)[0][0]
+
+        dp_dx = grad_x(x) ** 2
+
+        if self._laplacian == "hessian":
+            dp_dx2 = jacfwd(dlogpsi_x)(x)[0].reshape(x.shape[0], x.shape[0])
+            laplacian = jnp.sum(inverse_mass * jnp.diag(dp_dx2), axis=-1)
+        elif self._laplacian == "forward":
+            dp_dx2 = _hessian_diagonal(grad_x, x)
+            laplacian = jnp.sum(inverse_mass * dp_dx2, axis=-1)
+        else:
+            z = jax.random.rademacher(
+                _sample_key(self._seed, x), (self._n_probes, x.shape[0])
+            ).astype(x.dtype)
+            # Hessian-vector products
+            hz = jax.vmap(lambda z: jax.jvp(grad_x, (x,), (z,))[1])(z)
+            laplacian = jnp.mean(jnp.sum(inverse_mass * z * hz, axis=-1), axis=0)
 
-        return -0.5 * jnp.sum(inverse_mass * (dp_dx2 + dp_dx), axis=-1)
+        return -0.5 * (jnp.sum(inverse_mass * dp_dx, axis=-1) + laplacian)
 
     def _expect_kernel(
         self,
@@ -113,7 +201,16 @@ class KineticEnergy(ContinuousOperator):
 
     @struct.property_cached(pytree_ignore=True)
     def _attrs(self) -> tuple[Hashable, ...]:
-        return (self.hilbert, self.dtype, HashableArray(self.mass))
+        return (
+            self.hilbert,
+            self.dtype,
+            HashableArray(self.mass),
+            self._laplacian,
+            self._n_probes,
+            self._seed,
+        )
 
     def __repr__(self):
-        return f"KineticEnergy(m={self._mass})"
+        if self._laplacian == "forward":
+            return f"KineticEnergy(m={self._mass})"
+        return f"KineticEnergy(m={self._mass}, laplacian={self._laplacian})"
@@ -20,6 +20,9 @@ from numba.typed import List
 
 from scipy.sparse.linalg import LinearOperator
 
+import jax.numpy as jnp
+from jax.tree_util import register_pytree_node_class
+
 import netket.jax as nkjax
 from netket.jax import canonicalize_dtypes
 from netket.utils.optional_deps import import_optional_dependency
@@ -468,6 +471,15 @@ class LocalLiouvillian(AbstractSuperOperator):
 
         return L
 
+    def to_jax_operator(self) -> "LocalLiouvillianJax":
+        """
+        Returns the jax-compatible version of this super-operator, which is an
+        instance of :class:`netket.operator.LocalLiouvillianJax`.
+        """
+        return LocalLiouvillianJax(
+            self.hamiltonian, self.jump_operators, dtype=self.dtype
+        )
+
     def to_qobj(self):  # -> "qutip.liouvillian"
         r"""Convert the operator to a qutip's liouvillian Qobj.
 
@@ -479,3 +491,138 @@ class LocalLiouvillian(AbstractSuperOperator):
         return qutip.liouvillian(
             self.hamiltonian.to_qobj(), [op.to_qobj() for op in self.jump_operators]
         )
+
+
+@register_pytree_node_class
+class LocalLiouvillianJax(AbstractSuperOperator, DiscreteJaxOperator):
+    """
+    Jax-compatible version of :class:`netket.operator.LocalLiouvillian`.
+
+    The non-hermitian hamiltonian and the jump operators are stored as jax
+    operators, and the connected elements are computed on device with a fixed
+    number :attr:`max_conn_size` of connected elements per sample, padded with
+    zero matrix elements. This super-operator can therefore be used inside of
+    :func:`jax.jit` and does not require moving the samples to the host.
+    """
+
+    def __init__(
+        self,
+        ham: DiscreteOperator,
+        jump_ops: list[DiscreteOperator] = [],
+        dtype: DType | None = None,
+    ):
+        lind = LocalLiouvillian(ham, jump_ops, dtype=dtype)
+        super().__init__(lind.hilbert_physical)
+
+        self._dtype = lind.dtype
+        self._H = lind.hamiltonian.to_jax_operator()
+        self._Hnh = lind.hamiltonian_nh.to_jax_operator()
+        self._jump_ops = [L.to_jax_operator() for L in lind.jump_operators]
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def is_hermitian(self):
+        return False
+
+    @property
+    def hamiltonian(self) -> DiscreteJaxOperator:
+        """The hamiltonian of this Liouvillian"""
+        return self._H
+
+    @property
+    def hamiltonian_nh(self) -> DiscreteJaxOperator:
+        """The non hermitian Local Operator part of the Liouvillian"""
+        return self._Hnh
+
+    @property
+    def jump_operators(self) -> list[DiscreteJaxOperator]:
+        """The list of local operators in this Liouvillian"""
+        return self._jump_ops
+
+    @property
+    def max_conn_size(self) -> int:
+        """The maximum number of non zero ⟨x|O|x'⟩ for every x."""
+        return 2 * self._Hnh.max_conn_size + sum(
+            L.max_conn_size**2 for L in self._jump_ops
+        )
+
+    def get_conn_padded(self, x):
+        N = self.hilbert_physical.size
+        xr, xc = x[..., :N], x[..., N:]
+
+        def _join(xr_p, xc_p):
+            shape = jnp.broadcast_shapes(xr_p.shape, xc_p.shape)
+            return jnp.concatenate(
+                [jnp.broadcast_to(xr_p, shape), jnp.broadcast_to(xc_p, shape)],
+                axis=-1,
+            )
+
+        # -i H_nh ρ
+        xr_prime, mels_r = self._Hnh.get_conn_padded(xr)
+        xps = [_join(xr_prime, xc[..., None, :])]
+        mels = [-1j * mels_r]
+
+        # +i ρ H_nh^†
+        xc_prime, mels_c = self._Hnh.get_conn_padded(xc)
+        xps.append(_join(xr[..., None, :], xc_prime))
+        mels.append(1j * jnp.conj(mels_c))
+
+        # L ρ L^†
+        for L in self._jump_ops:
+            L_xr_prime, L_mels_r = L.get_conn_padded(xr)
+            L_xc_prime, L_mels_c = L.get_conn_padded(xc)
+            xp = _join(L_xr_prime[..., :, None, :], L_xc_prime[..., None, :, :])
+            mel = L_mels_r[..., :, None] * jnp.conj(L_mels_c[..., None, :])
+            xps.append(xp.reshape(x.shape[:-1] + (-1, x.shape[-1])))
+            mels.append(mel.reshape(x.shape[:-1] + (-1,)))
+
+        xp = jnp.concatenate(xps, axis=-2)
+        mels = jnp.concatenate(mels, axis=-1).astype(self.dtype)
+        return xp, mels
+
+    def tree_flatten(self):
+        data = (self._H, self._Hnh, self._jump_ops)
+        metadata = {"hilbert": self.hilbert, "dtype": self.dtype}
+        return data, metadata
+
+    @classmethod
+    def tree_unflatten(cls, metadata, data):
+        op = cls.__new__(cls)
+        DiscreteOperator.__init__(op, metadata["hilbert"])
+        op._dtype = metadata["dtype"]
+        op._H, op._Hnh, op._jump_ops = data
+        return op
+
+    def to_numba_operator(self) -> LocalLiouvillian:
+        """
+        Returns the standard numba version of this super-operator, which is an
+        instance of :class:`netket.operator.LocalLiouvillian`.
+        """
+        return LocalLiouvillian(
+            self.hamiltonian.to_numba_operator(),
+            [L.to_numba_operator() for L in self.jump_operators],
+            dtype=self.dtype,
+        )
+
+    def to_linear_operator(
+        self, *, sparse: bool = True, append_trace: bool = False
+    ) -> LinearOperator:
+        r"""Returns a lazy scipy linear_operator representation of the Lindblad
+        Super-Operator.
+
+        See :meth:`netket.operator.LocalLiouvillian.to_linear_operator`.
+        """
+        return self.to_numba_operator().to_linear_operator(
+            sparse=sparse, append_trace=append_trace
+        )
+
+    def to_qobj(self):  # -> "qutip.liouvillian"
+        r"""Convert the operator to a qutip's liouvillian Qobj.
+
+        Returns:
+            A :class:`qutip.liouvillian` object.
+        """
+        return self.to_numba_operator().to_qobj()
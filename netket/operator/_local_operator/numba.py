@@ -109,7 +109,7 @@ class LocalOperatorNumba(LocalOperatorBase):
         return xp, mels
 
     @staticmethod
-    @numba.jit(nopython=True)
+    @numba.jit(nopython=True, nogil=True)
     def _get_conn_flattened_kernel(
         x,
         sections,
@@ -0,0 +1,372 @@
+# Copyright 2021 The NetKet Authors - All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+from collections.abc import Callable
+from collections.abc import Hashable
+from functools import partial
+
+import numpy as np
+from scipy.stats import poisson
+
+import jax
+import jax.numpy as jnp
+from jax.scipy.special import erfc
+
+from netket.utils.types import DType, PyTree, Array
+
+from netket.hilbert import AbstractHilbert
+from netket.operator import ContinuousOperator
+from netket.utils import HashableArray, struct
+
+
+class PairPotential(ContinuousOperator):
+    r"""
+    Potential energy of particles interacting through a pair potential
+
+    .. math::
+
+        V(x) = \sum_{i<j} q_i q_j v(|r_i - r_j|),
+
+    where the distances are computed with the minimum image convention of the
+    :class:`~netket.experimental.geometry.Cell` of the Hilbert space.
+
+    If a `cutoff` is given, :math:`v(r)` is set to zero for :math:`r\geq`
+    `cutoff`. In boxes that are periodic along all directions and at least three
+    times larger than the cutoff, the interacting pairs are then found with a
+    cell list, such that the cost grows linearly with the number of particles
+    instead of quadratically. The cell list is constructed inside of jit with a
+    static bound `max_per_cell` on the number of particles in every cell: if a
+    sample has more particles in a cell than this, its energy is computed
+    summing over all pairs, so the result never depends on this setting. If
+    `max_per_cell` is not given, it is chosen such that the occupation of a cell
+    of uniformly distributed particles rarely exceeds it, and the cell list is
+    only used if the neighboring cells of a particle can hold fewer than all
+    the other particles.
+
+    If `potential="coulomb"`, :math:`v(r) = 1/r`. In boxes that are periodic
+    along all directions, the sum over all periodic images is computed with the
+    Ewald summation (only implemented in 3 dimensions), including a uniform
+    neutralizing background if the total charge is not zero. Boxes that are
+    periodic only along some directions are not supported.
+    """
+
+    _potential_fun: Callable | None = struct.static_field()
+    _coefficient: Array
+    _charges: Array
+    _cutoff: float | None = struct.static_field()
+    _n_cells: tuple[int, ...] | None = struct.static_field()
+    _max_per_cell: int | None = struct.static_field()
+    _ewald_alpha: float | None = struct.static_field()
+    _ewald_kmax: int | None = struct.static_field()
+
+    def __init__(
+        self,
+        hilbert: AbstractHilbert,
+        potential: Callable | str,
+        *,
+        charges: Array | None = None,
+        cutoff: float | None = None,
+        max_per_cell: int | None = None,
+        ewald_alpha: float | None = None,
+        ewald_kmax: int | None = None,
+        coefficient: float = 1.0,
+        dtype: DType | None = None,
+    ):
+        r"""
+        Args:
+            hilbert: The underlying Hilbert space on which the operator is defined,
+                which must be a :class:`~netket.experimental.hilbert.Particle` space.
+            potential: The pair potential :math:`v(r)` as a (vectorized) function
+                of the distance, or :code:`"coulomb"` for :math:`v(r)=1/r`.
+            charges: Optional charges :math:`q_i` of the particles
+                (default: all 1).
+            cutoff: Optional distance beyond which the pair potential vanishes.
+                For Coulomb interactions in periodic boxes, the cutoff of the
+                real-space part of the Ewald sum (default: half the smallest side).
+            max_per_cell: Static bound on the number of particles in every cell of
+                the cell list (default: the occupation exceeded by any cell with
+                a probability of about :math:`10^{-4}` for uniformly distributed
+                particles, and at least 4).
+            ewald_alpha: The splitting parameter of the Ewald sum
+                (default: :code:`3.5 / cutoff`).
+            ewald_kmax: The largest reciprocal lattice vector included in the
+                Ewald sum, in units of :math:`2\pi/L` along every direction
+                (default: chosen from `ewald_alpha` for a relative accuracy of
+                about :math:`10^{-5}`).
+            coefficient: A coefficient multiplying the potential energy.
+            dtype: Data type of the coefficient.
+        """
+        geometry = getattr(hilbert, "geometry", None)
+        if geometry is None:
+            raise TypeError(
+                "PairPotential requires a Hilbert space of particles in a "
+                "`netket.experimental.geometry.Cell`."
+            )
+
+        extent = np.asarray(geometry.extent)
+        periodic = all(geometry.pbc)
+        n_particles = hilbert.n_particles
+
+        if cutoff is not None and periodic and cutoff > extent.min() / 2:
+            raise ValueError(
+                f"The cutoff ({cutoff}) cannot be larger than half the side of "
+                f"the periodic box ({extent.min() / 2})."
+            )
+
+        if isinstance(potential, str):
+            if potential != "coulomb":
+                raise ValueError(
+                    f"Unknown potential '{potential}'. Pass a function of the "
+                    "distance or 'coulomb'."
+                )
+            potential = None
+            if any(geometry.pbc) and not periodic:
+                raise NotImplementedError(
+                    "Coulomb interactions are only implemented in boxes that are "
+                    "periodic along all directions or none."
+                )
+            if periodic:
+                if geometry.dimension != 3:
+                    raise NotImplementedError(
+                        "The Ewald summation is only implemented in 3 dimensions."
+                    )
+                if cutoff is None:
+                    cutoff = float(extent.min() / 2)
+                if ewald_alpha is None:
+                    ewald_alpha = 3.5 / cutoff
+                if ewald_kmax is None:
+                    # exp(-k^2 / 4 alpha^2) < 1e-5 for k > 2 * 3.4 * alpha
+                    k_max = 2 * 3.4 * ewald_alpha
+                    ewald_kmax = int(np.ceil(k_max * extent.max() / (2 * np.pi)))
+            elif cutoff is not None:
+                raise ValueError(
+                    "Coulomb interactions cannot be truncated in non-periodic boxes."
+                )
+        elif not callable(potential):
+            raise TypeError("The potential must be a function of the distance.")
+
+        if charges is None:
+            charges = np.ones(n_particles)
+        charges = jnp.asarray(charges)
+        if charges.shape != (n_particles,):
+            raise ValueError(
+                f"Expected {n_particles} charges, one for every particle, got an "
+                f"array with shape {charges.shape}."
+            )
+
+        n_cells = None
+        if cutoff is not None and periodic:
+            n_cells = tuple(int(x) for x in np.floor(extent / cutoff))
+            # with fewer than 3 cells along an axis the neighboring cells repeat
+            if min(n_cells) < 3:
+                n_cells = None
+            elif max_per_cell is None:
+                max_per_cell = _default_max_per_cell(n_particles, n_cells)
+                # the cell list is not cheaper than summing over all pairs if the
+                # neighboring cells can hold all the particles
+                if 3 ** len(n_cells) * max_per_cell >= n_particles:
+                    n_cells = None
+
+        self._potential_fun = potential
+        self._coefficient = jnp.array(coefficient, dtype=dtype)
+        self._charges = charges
+        self._cutoff = None if cutoff is None else float(cutoff)
+        self._n_cells = n_cells
+        self._max_per_cell = None if n_cells is None else int(max_per_cell)
+        self._ewald_alpha = None if ewald_alpha is None else float(ewald_alpha)
+        self._ewald_kmax = ewald_kmax
+
+        super().__init__(hilbert, self._coefficient.dtype)
+
+    @property
+    def coefficient(self) -> Array:
+        return self._coefficient
+
+    @property
+    def charges(self) -> Array:
+        """The charges of the particles."""
+        return self._charges
+
+    @property
+    def is_hermitian(self) -> bool:
+        return True
+
+    def _pair_fun(self, r: Array) -> Array:
+        if self._potential_fun is not None:
+            return self._potential_fun(r)
+        elif self._ewald_alpha is not None:
+            # real-space part of the Ewald sum
+            return erfc(self._ewald_alpha * r) / r
+        else:
+            return 1 / r
+
+    def _expect_kernel(
+        self,
+        logpsi: Callable,
+        params: PyTree,
+        x: Array,
+    ) -> Array:
+        geometry = self.hilbert.geometry
+        pos = x.reshape(x.shape[0], -1, geometry.dimension)
+
+        pair_energy = partial(
+            _all_pairs_energy, geometry, self._pair_fun, self._cutoff, self.charges
+        )
+        if self._n_cells is None:
+            energy = jax.vmap(pair_energy)(pos)
+        else:
+            energy, overflow = jax.vmap(
+                partial(
+                    _cell_list_energy,
+                    geometry,
+                    self._pair_fun,
+                    self._cutoff,
+                    self._n_cells,
+                    self._max_per_cell,
+                ),
+                in_axes=(None, 0),
+            )(self.charges, pos)
+            # fall back to all pairs for the samples with too many particles in
+            # some cell, iterating over the samples so that the others are skipped
+            energy = jax.lax.cond(
+                jnp.any(overflow),
+                lambda: jax.lax.map(
+                    lambda args: jax.lax.cond(
+                        args[0],
+                        lambda: pair_energy(args[1]),
+                        lambda: args[2],
+                    ),
+                    (overflow, pos, energy),
+                ),
+                lambda: energy,
+            )
+
+        if self._ewald_alpha is not None:
+            energy = energy + jax.vmap(
+                partial(
+                    _ewald_long_range_energy,
+                    geometry,
+                    self._ewald_alpha,
+                    self._ewald_kmax,
+                ),
+                in_axes=(None, 0),
+            )(self.charges, pos)
+
+        return self.coefficient * energy
+
+    @struct.property_cached(pytree_ignore=True)
+    def _attrs(self) -> tuple[Hashable, ...]:
+        return (
+            self.hilbert,
+            self._potential_fun,
+            self.dtype,
+            HashableArray(self.coefficient),
+            HashableArray(self.charges),
+            self._cutoff,
+            self._n_cells,
+            self._max_per_cell,
+            self._ewald_alpha,
+            self._ewald_kmax,
+        )
+
+    def __repr__(self):
+        potential = "coulomb" if self._potential_fun is None else self._potential_fun
+        return (
+            f"PairPotential(coefficient={self.coefficient}, potential={potential}, "
+            f"cutoff={self._cutoff})"
+        )
+
+
+def _default_max_per_cell(n_particles: int, n_cells: tuple[int, ...]) -> int:
+    # the occupation of every cell is approximately Poisson distributed
+    n_total = int(np.prod(n_cells))
+    max_per_cell = poisson.isf(1e-4 / n_total, n_particles / n_total)
+    return min(max(int(max_per_cell), 4), n_particles)
+
+
+def _all_pairs_energy(geometry, pair_fun, cutoff, charges, pos):
+    i, j = np.triu_indices(pos.shape[0], 1)
+    r = geometry.distance(pos[i], pos[j])
+    v = charges[i] * charges[j] * pair_fun(r)
+    if cutoff is not None:
+        v = jnp.where(r < cutoff, v, 0)
+    return jnp.sum(v)
+
+
+def _cell_list_energy(geometry, pair_fun, cutoff, n_cells, max_per_cell, charges, pos):
+    """
+    Pair energy computed with a cell list of cells larger than the cutoff, such
+    that all interacting pairs are in neighboring cells.
+
+    Returns the energy and whether some cell contains more than `max_per_cell`
+    particles, in which case the energy is not correct.
+    """
+    n_particles, d = pos.shape
+    extent = np.asarray(geometry.extent)
+    shape = np.asarray(n_cells)
+    n_total = int(np.prod(shape))
+    strides = np.array([int(np.prod(shape[k + 1 :])) for k in range(d)])
+
+    coords = jnp.floor((pos % extent) / (extent / shape)).astype(jnp.int32)
+    coords = jnp.clip(coords, 0, shape - 1)
+    cell = coords @ strides
+
+    # table of the particles in every cell, padded with n_particles
+    order = jnp.argsort(cell)
+    sorted_cell = cell[order]
+    start = jnp.searchsorted(sorted_cell, jnp.arange(n_total))
+    end = jnp.searchsorted(sorted_cell, jnp.arange(n_total), side="right")
+    overflow = jnp.any(end - start > max_per_cell)
+    slot = jnp.arange(n_particles) - start[sorted_cell]
+    table = jnp.full((n_total, max_per_cell), n_particles, dtype=jnp.int32)
+    table = table.at[sorted_cell, slot].set(order.astype(jnp.int32), mode="drop")
+
+    # candidate neighbors of every particle in the 3^d neighboring cells
+    offsets = np.array(list(itertools.product((-1, 0, 1), repeat=d)))
+    neighbor_cells = ((coords[:, None, :] + offsets) % shape) @ strides
+    neighbors = table[neighbor_cells].reshape(n_particles, -1)
+    valid = (neighbors < n_particles) & (neighbors != jnp.arange(n_particles)[:, None])
+    neighbors = jnp.where(valid, neighbors, 0)
+
+    r = geometry.distance(pos[:, None, :], pos[neighbors])
+    valid = valid & (r < cutoff)
+    v = charges[:, None] * charges[neighbors] * pair_fun(jnp.where(valid, r, cutoff))
+    # every pair is counted twice
+    return 0.5 * jnp.sum(jnp.where(valid, v, 0)), overflow
+
+
+def _ewald_long_range_energy(geometry, alpha, kmax, charges, pos):
+    """
+    Reciprocal-space, self-interaction and neutralizing background terms of the
+    Ewald sum of the Coulomb energy.
+    """
+    extent = np.asarray(geometry.extent)
+    volume = np.prod(extent)
+
+    n = np.array(list(itertools.product(range(-kmax, kmax + 1), repeat=3)))
+    n = n[np.any(n != 0, axis=-1)]
+    k = 2 * np.pi * n / extent
+    k2 = np.sum(k**2, axis=-1)
+    weight = 2 * np.pi / volume * np.exp(-k2 / (4 * alpha**2)) / k2
+
+    phase = pos @ k.T
+    structure_factor2 = (charges @ jnp.cos(phase)) ** 2 + (
+        charges @ jnp.sin(phase)
+    ) ** 2
+    reciprocal = jnp.sum(weight * structure_factor2)
+
+    self_energy = -alpha / np.sqrt(np.pi) * jnp.sum(charges**2)
+    background = -np.pi * jnp.sum(charges) ** 2 / (2 * volume * alpha**2)
+    return reciprocal + self_energy + background
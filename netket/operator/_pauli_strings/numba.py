@@ -167,7 +167,7 @@ class PauliStringsNumba(PauliStringsBase):
         self._initialized = False
 
     @staticmethod
-    @jit(nopython=True)
+    @jit(nopython=True, nogil=True)
     def _flattened_kernel(
         x,
         sections,
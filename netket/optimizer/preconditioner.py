@@ -113,7 +113,25 @@ class AbstractLinearPreconditioner(struct.Pytree, mutable=True):
         *args,
         **kwargs,
     ) -> PyTree:
-        self._lhs = self.lhs_constructor(vstate, step)
+        lhs = self.lhs_constructor(vstate, step)
+        return self.solve_with_lhs(lhs, gradient)
+
+    def solve_with_lhs(self, lhs: LinearOperator, gradient: PyTree) -> PyTree:
+        """
+        Solves the linear system with an already constructed left hand side `lhs`,
+        as returned by :meth:`lhs_constructor`.
+
+        This can be used by drivers that need the left hand side of the system
+        (for example the jacobian of the QGT) before preconditioning the gradient.
+
+        Args:
+            lhs: The left hand side of the linear system.
+            gradient: The right hand side of the linear system.
+
+        Returns:
+            The solution of the linear system.
+        """
+        self._lhs = lhs
 
         x0 = self.x0 if self.solver_restart else None
         self.x0, self.info = self._lhs.solve(self.solver, gradient, x0=x0)
@@ -14,6 +14,7 @@
 
 from .qgt_jacobian import QGTJacobianDense, QGTJacobianPyTree
 from .qgt_onthefly import QGTOnTheFly
+from .qgt_block_diagonal import QGTBlockDiagonal
 
 from .default import QGTAuto
 
@@ -0,0 +1,321 @@
+# Copyright 2021 The NetKet Authors - All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Callable, Hashable
+
+import jax
+from jax import numpy as jnp
+from flax import struct
+
+from netket.utils.api_utils import partial_from_kwargs
+from netket.utils.types import Array, PyTree
+from netket import jax as nkjax
+from netket.jax._utils_tree import RealImagTuple
+
+from ..linear_operator import LinearOperator, SolverT, Uninitialized
+
+from .common import check_valid_vector_type
+from .qgt_jacobian import QGTJacobian_DefaultConstructor
+from .qgt_jacobian_pytree import QGTJacobianPyTreeT
+
+
+@partial_from_kwargs(exclusive_arg_names=(("mode", "holomorphic")))
+def QGTBlockDiagonal(
+    vstate,
+    *,
+    groups: str | Callable[[tuple[str, ...], Array], Hashable] = "module",
+    mode: str | None = None,
+    holomorphic: bool | None = None,
+    diag_shift: float | None = 0.0,
+    diag_scale: float | None = None,
+    chunk_size: int | None = None,
+    **kwargs,
+) -> "QGTBlockDiagonalT":
+    """
+    Block-diagonal approximation of the S Matrix, where the correlations between
+    parameters belonging to different groups (by default, different modules of the
+    network) are neglected.
+
+    The Jacobian O_k is precomputed and stored as a PyTree, as in
+    :func:`~netket.optimizer.qgt.QGTJacobianPyTree`, and every diagonal block is
+    applied and solved independently of the others. The cost of dense solvers
+    therefore scales with the size of the largest block instead of the total
+    number of parameters, similarly to K-FAC. All blocks are solved in the same
+    compiled function, so independent blocks can be executed concurrently.
+
+    The grouping of the parameters can be specified with the `groups` argument:
+
+    - :code:`"module"` groups together the parameters of the same module, that is,
+      all the leaves of the parameters sharing the same path up to the last key
+      (for example :code:`("Dense_0", "kernel")` and :code:`("Dense_0", "bias")`).
+    - :code:`"leaf"` puts every leaf of the parameters in its own block.
+    - A callable :code:`groups(path, leaf)`, taking the path of a leaf as a tuple of
+      strings and the leaf itself, and returning a hashable label. Leaves with the
+      same label are grouped in the same block.
+
+    Args:
+        vstate: The variational state
+        groups: The grouping of the parameters into diagonal blocks (see above).
+        mode: "real", "complex" or "holomorphic": specifies the implementation
+              used to compute the jacobian. "real" discards the imaginary part
+              of the output of the model. "complex" splits the real and imaginary
+              part of the parameters and output. It works also for non holomorphic
+              models. holomorphic works for any function assuming it's holomorphic
+              or real valued.
+        holomorphic: a flag to indicate that the function is holomorphic.
+        diag_scale: Fractional shift :math:`\\epsilon_1` added to diagonal entries.
+        diag_shift: Constant shift :math:`\\epsilon_2` added to diagonal entries.
+        chunk_size: If supplied, overrides the chunk size of the variational state
+                    (useful for models where the backward pass requires more
+                    memory than the forward pass).
+    """
+    # TODO: Find a better way to handle this case
+    from netket.vqs import FullSumState
+
+    if isinstance(vstate, FullSumState):
+        samples = vstate._all_states
+        pdf = vstate.probability_distribution()
+    else:
+        samples = vstate.samples
+        pdf = None
+
+    if chunk_size is None:
+        chunk_size = getattr(vstate, "chunk_size", None)
+
+    qgt = QGTJacobian_DefaultConstructor(
+        vstate._apply_fun,
+        vstate.parameters,
+        vstate.model_state,
+        samples,
+        pdf=pdf,
+        dense=False,
+        mode=mode,
+        holomorphic=holomorphic,
+        diag_shift=diag_shift,
+        diag_scale=diag_scale,
+        chunk_size=chunk_size,
+        **kwargs,
+    )
+    return QGTBlockDiagonal_FromJacobian(qgt, groups=groups)
+
+
+def QGTBlockDiagonal_FromJacobian(
+    qgt: QGTJacobianPyTreeT,
+    *,
+    groups: str | Callable[[tuple[str, ...], Array], Hashable] = "module",
+) -> "QGTBlockDiagonalT":
+    """
+    Splits a :class:`QGTJacobianPyTreeT` into the diagonal blocks corresponding
+    to the groups of parameters specified by `groups` (see
+    :func:`~netket.optimizer.qgt.QGTBlockDiagonal`).
+    """
+    groups = _group_leaves(qgt._params_structure, groups)
+    treedef = jax.tree_util.tree_structure(qgt._params_structure)
+
+    blocks = tuple(
+        qgt.replace(
+            O=_select_leaves(qgt.O, treedef, idx),
+            scale=(
+                None if qgt.scale is None else _select_leaves(qgt.scale, treedef, idx)
+            ),
+            _params_structure=_select_leaves(qgt._params_structure, treedef, idx),
+        )
+        for idx in groups
+    )
+    return QGTBlockDiagonalT(
+        blocks=blocks,
+        diag_shift=qgt.diag_shift,
+        _groups=groups,
+        _params_structure=qgt._params_structure,
+    )
+
+
+@struct.dataclass
+class QGTBlockDiagonalT(LinearOperator):
+    """
+    Block-diagonal approximation of the S Matrix behaving like a linear operator,
+    where every block is a :class:`QGTJacobianPyTreeT` on a group of parameters.
+
+    See :func:`~netket.optimizer.qgt.QGTBlockDiagonal` for more details.
+    """
+
+    blocks: tuple[QGTJacobianPyTreeT, ...] = Uninitialized
+    """The diagonal blocks, acting on the groups of leaves of the parameters
+    specified by `_groups`."""
+
+    _groups: tuple[tuple[int, ...], ...] = struct.field(
+        pytree_node=False, default=Uninitialized
+    )
+    """Indices of the leaves of the parameters belonging to every block."""
+
+    _params_structure: PyTree = struct.field(pytree_node=False, default=Uninitialized)
+    """Parameters of the network. Its only purpose is to represent its own shape."""
+
+    @property
+    def mode(self) -> str:
+        return self.blocks[0].mode
+
+    def __add__(self, eps):
+        return self.replace(
+            diag_shift=self.diag_shift + eps,
+            blocks=tuple(block + eps for block in self.blocks),
+        )
+
+    @jax.jit
+    def __matmul__(self, vec: PyTree | Array) -> PyTree | Array:
+        # Turn vector RHS into PyTree
+        if hasattr(vec, "ndim"):
+            _, unravel = nkjax.tree_ravel(self._params_structure)
+            vec = unravel(vec)
+            ravel = True
+        else:
+            ravel = False
+
+        check_valid_vector_type(self._params_structure, vec)
+
+        result = self._map_blocks(lambda block, v: block @ v, vec)
+
+        # Ravel PyTree back into vector as needed
+        if ravel:
+            result, _ = nkjax.tree_ravel(result)
+
+        return result
+
+    @jax.jit
+    def _solve(
+        self, solve_fun: SolverT, y: PyTree, *, x0: PyTree | None = None
+    ) -> PyTree:
+        """
+        Solve independently the linear systems of every diagonal block with the
+        chosen solver.
+
+        Args:
+            y: the vector y in the system above.
+            x0: optional initial guess for the solution.
+
+        Returns:
+            x: the PyTree solving the system.
+            info: a tuple with the information returned by the solver for every
+                block.
+        """
+        check_valid_vector_type(self._params_structure, y)
+
+        treedef = jax.tree_util.tree_structure(self._params_structure)
+        y_leaves = treedef.flatten_up_to(y)
+        x0_leaves = None if x0 is None else treedef.flatten_up_to(x0)
+
+        out_leaves = [None] * len(y_leaves)
+        infos = []
+        for idx, block in zip(self._groups, self.blocks):
+            y_block = [y_leaves[i] for i in idx]
+            x0_block = None if x0 is None else [x0_leaves[i] for i in idx]
+            x_block, info = block._solve(solve_fun, y_block, x0=x0_block)
+            for i, x in zip(idx, x_block):
+                out_leaves[i] = x
+            infos.append(info)
+
+        return treedef.unflatten(out_leaves), tuple(infos)
+
+    @jax.jit
+    def to_dense(self) -> jnp.ndarray:
+        """
+        Convert the lazy matrix representation to a dense matrix representation.
+
+        Returns:
+            A dense matrix representation of this S matrix, with the same layout as
+            :meth:`QGTJacobianPyTreeT.to_dense`.
+            In R→C mode with complex parameters, real and imaginary parts of
+            parameters get own rows/columns.
+        """
+        params, unravel = nkjax.tree_ravel(
+            jax.tree_util.tree_map(
+                lambda x: jnp.zeros(x.shape, x.dtype), self._params_structure
+            )
+        )
+        n = params.size
+        split_complex = self.mode != "holomorphic" and jnp.iscomplexobj(params)
+
+        def column(v):
+            res, _ = nkjax.tree_ravel(self @ unravel(v))
+            if split_complex:
+                res = jnp.concatenate([res.real, res.imag])
+            return res
+
+        basis = jnp.eye(n, dtype=params.dtype)
+        if split_complex:
+            basis = jnp.concatenate([basis, 1j * basis])
+        return jax.vmap(column)(basis).T
+
+    def _map_blocks(self, fun: Callable, vec: PyTree) -> PyTree:
+        treedef = jax.tree_util.tree_structure(self._params_structure)
+        leaves = treedef.flatten_up_to(vec)
+        out_leaves = [None] * len(leaves)
+        for idx, block in zip(self._groups, self.blocks):
+            res = fun(block, [leaves[i] for i in idx])
+            for i, r in zip(idx, res):
+                out_leaves[i] = r
+        return treedef.unflatten(out_leaves)
+
+    def __repr__(self):
+        return (
+            f"QGTBlockDiagonal(diag_shift={self.diag_shift}, "
+            f"n_blocks={len(self.blocks)}, mode={self.mode})"
+        )
+
+
+def _path_to_str(path) -> tuple[str, ...]:
+    def _key(k):
+        for attr in ("key", "name", "idx"):
+            if hasattr(k, attr):
+                return str(getattr(k, attr))
+        return str(k)
+
+    return tuple(_key(k) for k in path)
+
+
+def _group_leaves(params: PyTree, groups) -> tuple[tuple[int, ...], ...]:
+    """
+    Returns the indices of the leaves of `params` belonging to every group.
+    """
+    leaves_with_path, _ = jax.tree_util.tree_flatten_with_path(params)
+
+    if groups == "leaf":
+        return tuple((i,) for i in range(len(leaves_with_path)))
+    elif groups == "module":
+        labels = [_path_to_str(path)[:-1] for path, _ in leaves_with_path]
+    elif callable(groups):
+        labels = [groups(_path_to_str(path), leaf) for path, leaf in leaves_with_path]
+    else:
+        raise ValueError(
+            f"Unknown grouping '{groups}'. Valid values are 'module', 'leaf' "
+            "or a callable returning the label of the group of every leaf."
+        )
+
+    # preserve the order in which the groups first appear
+    indices = {}
+    for i, label in enumerate(labels):
+        indices.setdefault(label, []).append(i)
+    return tuple(tuple(idx) for idx in indices.values())
+
+
+def _select_leaves(tree: PyTree, treedef, idx: tuple[int, ...]) -> PyTree:
+    """
+    Selects the subtrees corresponding to the leaves `idx` of the parameters from
+    a tree with the structure of the parameters, or a :class:`RealImagTuple`
+    of such trees as returned by the complex-mode jacobian.
+    """
+    if isinstance(tree, RealImagTuple):
+        return RealImagTuple(tuple(_select_leaves(t, treedef, idx) for t in tree))
+    subtrees = treedef.flatten_up_to(tree)
+    return [subtrees[i] for i in idx]
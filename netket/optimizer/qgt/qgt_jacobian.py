@@ -17,6 +17,7 @@ import jax
 
 from netket.utils import timing
 from netket.utils.api_utils import partial_from_kwargs
+from netket.utils.types import DType
 from netket import jax as nkjax
 
 from .qgt_jacobian_dense import QGTJacobianDenseT
@@ -41,6 +42,7 @@ def QGTJacobian_DefaultConstructor(
     diag_shift: float | None = 0.0,
     diag_scale: float | None = None,
     chunk_size: int | None = None,
+    jacobian_dtype: DType | None = None,
     **kwargs,
 ) -> QGTJacobianDenseT | QGTJacobianPyTreeT:
     """
@@ -105,6 +107,7 @@ def QGTJacobian_DefaultConstructor(
         chunk_size=chunk_size,
         dense=dense,
         center=True,
+        dtype=jacobian_dtype,
         _sqrt_rescale=True,
     )
     shift, offset = to_shift_offset(diag_shift, diag_scale)
@@ -176,6 +179,10 @@ def QGTJacobianDense(
         chunk_size: If supplied, overrides the chunk size of the variational state
                     (useful for models where the backward pass requires more
                     memory than the forward pass).
+        jacobian_dtype: If supplied, the jacobian is computed and stored in this
+                    lower precision (for example :code:`jnp.float32`), reducing the
+                    memory used by the QGT, while its products with vectors are
+                    accumulated in the precision of the vectors.
     """
     # TODO: Find a better way to handle this case
     from netket.vqs import FullSumState
@@ -252,6 +259,10 @@ def QGTJacobianPyTree(
         chunk_size: If supplied, overrides the chunk size of the variational state
                     (useful for models where the backward pass requires more
                     memory than the forward pass).
+        jacobian_dtype: If supplied, the jacobian is computed and stored in this
+                    lower precision (for example :code:`jnp.float32`), reducing the
+                    memory used by the QGT, while its products with vectors are
+                    accumulated in the precision of the vectors.
     """
     # TODO: Find a better way to handle this case
     from netket.vqs import FullSumState
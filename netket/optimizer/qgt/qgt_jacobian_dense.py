@@ -13,12 +13,15 @@
 # limitations under the License.
 
 
+from functools import partial
+
 import jax
 from jax import numpy as jnp
 from flax import struct
 
 from netket.utils.types import Scalar, PyTree
 from netket import jax as nkjax
+from netket.jax._math import matmul_mixed_precision
 
 from ..linear_operator import LinearOperator, SolverT, Uninitialized
 
@@ -132,6 +135,59 @@ class QGTJacobianDenseT(LinearOperator):
 
         return reassemble(out), info
 
+    @jax.jit
+    def gradient(self, O_loc: jnp.ndarray) -> PyTree:
+        r"""
+        Computes the gradient of the expectation value of an hermitian operator
+        from its local estimators, reusing the jacobian stored in this QGT instead
+        of differentiating the model again.
+
+        The gradient is :math:`2 O^\dagger (O_{loc} - \langle O_{loc} \rangle)/N_s`,
+        and is returned with the same structure as the parameters.
+
+        .. note::
+
+            This is only correct if the QGT was constructed from the same
+            Monte Carlo samples (without a `pdf`) on which `O_loc` is evaluated.
+
+        Args:
+            O_loc: The local estimators on the samples used to construct the QGT.
+
+        Returns:
+            The gradient of the expectation value.
+        """
+        if self.mode == "imag":
+            raise ValueError(
+                "Cannot compute the gradient from the imaginary part of the QGT."
+            )
+
+        O_loc = O_loc.reshape(-1)
+        n_samples = O_loc.shape[0]
+        # The jacobian is already divided by sqrt(n_samples)
+        ΔO_loc = (O_loc - jnp.mean(O_loc)) / jnp.sqrt(n_samples)
+
+        if self.mode == "holomorphic":
+            grad = matmul_mixed_precision(ΔO_loc, self.O.conj())
+        elif self.mode == "complex":
+            ΔO_loc = jnp.stack([ΔO_loc.real, ΔO_loc.imag], axis=-1)
+            grad = matmul_mixed_precision(
+                ΔO_loc.reshape(-1), self.O.reshape(-1, self.O.shape[-1])
+            )
+        else:
+            grad = matmul_mixed_precision(ΔO_loc.real, self.O)
+        grad = 2 * grad
+
+        if self.scale is not None:
+            grad = grad * self.scale
+
+        params = jax.tree_util.tree_map(
+            lambda x: jnp.zeros(x.shape, x.dtype), self._params_structure
+        )
+        _, reassemble = convert_tree_to_dense_format(params, self.mode)
+        return jax.tree_util.tree_map(
+            lambda x, target: x.astype(target.dtype), reassemble(grad), params
+        )
+
     @jax.jit
     def to_dense(self) -> jnp.ndarray:
         """
@@ -248,12 +304,23 @@ class QGTJacobianDenseT(LinearOperator):
 
 
 def mat_vec(v: PyTree, O: PyTree, diag_shift: Scalar, imag: bool = False) -> PyTree:
+    if O.dtype != v.dtype:
+        # The jacobian is stored in a lower precision than the vector: avoid
+        # materializing it in higher precision.
+        matmul = partial(matmul_mixed_precision, dtype=jnp.result_type(O, v))
+    else:
+        matmul = jnp.matmul
+
     if not imag:
         # Matrix vector product of the (real part, or holomorphic) QGT matrix
         # with a vector. In the standard case, it does the multiplication equivalent
         # to J_r.T@(J_r@v_r) + J_i.T@(J_i@v_i) + diag_shift*v
-        w = O @ v
-        res = jnp.tensordot(w.conj(), O, axes=w.ndim).conj()
+        if matmul is jnp.matmul:
+            w = O @ v
+            res = jnp.tensordot(w.conj(), O, axes=w.ndim).conj()
+        else:
+            w = matmul(O, v)
+            res = matmul(w.conj().reshape(-1), O.reshape(-1, O.shape[-1])).conj()
         return res + diag_shift * v
     else:
         # Matrix vector product of the imaginary part of the QGT matrix
@@ -261,11 +328,11 @@ def mat_vec(v: PyTree, O: PyTree, diag_shift: Scalar, imag: bool = False) -> PyT
         # J_r.T@(J_i@v_i) - J_i.T@(J_r@v_r) + diag_shift*v
 
         Or = jnp.flip(O, axis=1).reshape(-1, O.shape[-1])
-        w = Or @ v
+        w = matmul(Or, v)
 
-        flip_sign = jnp.array([1, -1]).reshape(1, 2, 1)
+        flip_sign = jnp.array([1, -1], dtype=O.dtype).reshape(1, 2, 1)
         Ol = (flip_sign * O).reshape(-1, O.shape[-1])
-        res = jnp.tensordot(w.conj(), Ol, axes=w.ndim).conj()
+        res = matmul(w.conj(), Ol).conj()
         return res + diag_shift * v
 
 
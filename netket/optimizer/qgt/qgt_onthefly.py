@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from collections.abc import Callable
+from typing import Any
 import warnings
 
 import jax
@@ -30,7 +31,8 @@ from netket.errors import (
 )
 
 from .common import check_valid_vector_type
-from .qgt_onthefly_logic import mat_vec_factory, mat_vec_chunked_factory
+from .qgt_onthefly_logic import mat_vec_factory, mat_vec_chunked_factory, mat_diag
+from .qgt_onthefly_preconditioner import DiagonalPreconditioner, nystrom_preconditioner
 
 from ..linear_operator import LinearOperator, SolverT, Uninitialized
 
@@ -54,15 +56,25 @@ def QGTOnTheFly(
         chunk_size: If supplied, overrides the chunk size of the variational state
                     (useful for models where the backward pass requires more
                     memory than the forward pass).
+        holomorphic: boolean indicating if the ansatz is holomorphic or not. May
+                    speed up computations for models with complex-valued parameters.
+        diag_scale: Fractional shift :math:`\\epsilon_1` added to diagonal entries,
+                    such that the matrix is :math:`S + \\epsilon_1\\text{diag}(S) +
+                    \\epsilon_2`, where :math:`\\epsilon_2` is `diag_shift`. The
+                    diagonal of the S matrix is computed in chunks from the
+                    per-sample gradients.
+        preconditioner: Optional preconditioner for the iterative solver, passed
+                    to it as the argument :code:`M` (supported by all solvers in
+                    :mod:`jax.scipy.sparse.linalg`). Can be :code:`"diagonal"`,
+                    to use the inverse of the diagonal of the S matrix, computed
+                    in chunks from the per-sample gradients, :code:`"nystrom"` to
+                    use a randomized Nyström low-rank approximation of the S matrix
+                    (see :class:`~netket.optimizer.SR` to reuse it over several
+                    steps), or a previously constructed preconditioner.
+        preconditioner_rank: The rank of the Nyström preconditioner, which is
+                    constructed with :code:`preconditioner_rank + 10` matrix-vector
+                    products (default 32).
     """
-    if kwargs.pop("diag_scale", None) is not None:
-        raise NotImplementedError(
-            "\n`diag_scale` argument is not yet supported by QGTOnTheFly."
-            "Please use `QGTJacobianPyTree` or `QGTJacobianDense`.\n\n"
-            "You are also encouraged to nag the developers to support "
-            "this feature.\n\n"
-        )
-
     # TODO: Find a better way to handle this case
     from netket.vqs import FullSumState
 
@@ -98,6 +110,9 @@ def QGTOnTheFly_DefaultConstructor(
     *,
     chunk_size: int | None = None,
     holomorphic: bool | None = None,
+    diag_scale: float | None = None,
+    preconditioner: str | Callable | None = None,
+    preconditioner_rank: int = 32,
     **kwargs,
 ) -> "QGTOnTheFlyT":
     """ """
@@ -153,7 +168,7 @@ def QGTOnTheFly_DefaultConstructor(
         samples=samples,
         pdf=pdf,
     )
-    return QGTOnTheFlyT(
+    S = QGTOnTheFlyT(
         _mat_vec=mat_vec,
         _params=parameters,
         _chunking=chunking,
@@ -161,6 +176,36 @@ def QGTOnTheFly_DefaultConstructor(
         **kwargs,
     )
 
+    if diag_scale is not None or preconditioner == "diagonal":
+        diagonal = mat_diag(
+            apply_fun,
+            parameters,
+            model_state,
+            samples,
+            pdf,
+            chunk_size if chunking else None,
+        )
+    if diag_scale is not None:
+        S = S.replace(
+            _diag_scale_term=jax.tree_util.tree_map(lambda d: diag_scale * d, diagonal)
+        )
+        diagonal = jax.tree_util.tree_map(lambda d: (1 + diag_scale) * d, diagonal)
+
+    if preconditioner == "diagonal":
+        diagonal = jax.tree_util.tree_map(lambda d: d + S.diag_shift, diagonal)
+        # Leave the components with a vanishing diagonal unchanged
+        diagonal = jax.tree_util.tree_map(lambda d: jnp.where(d > 0, d, 1), diagonal)
+        preconditioner = DiagonalPreconditioner(diagonal)
+    elif preconditioner == "nystrom":
+        preconditioner = nystrom_preconditioner(S, rank=preconditioner_rank)
+    elif isinstance(preconditioner, str):
+        raise ValueError(
+            f"Unknown preconditioner '{preconditioner}'. Valid values are "
+            "'diagonal', 'nystrom', None or a preconditioner object."
+        )
+
+    return S.replace(_preconditioner=preconditioner)
+
 
 @struct.dataclass
 class QGTOnTheFlyT(LinearOperator):
@@ -196,6 +241,14 @@ class QGTOnTheFlyT(LinearOperator):
         - "auto": autoselect real or complex.
     """
 
+    _diag_scale_term: PyTree | None = None
+    """Optional pytree with the diagonal of the S matrix times `diag_scale`, added
+    to the diagonal entries."""
+
+    _preconditioner: Any = None
+    """Optional approximation of the inverse of this matrix, passed as the argument
+    `M` to the iterative solver."""
+
     def __matmul__(self, y):
         return onthefly_mat_treevec(self, y)
 
@@ -259,6 +312,10 @@ def onthefly_mat_treevec(
     vec = nkjax.tree_cast(vec, S._params)
 
     res = S._mat_vec(vec, S.diag_shift)
+    if S._diag_scale_term is not None:
+        res = jax.tree_util.tree_map(
+            lambda r, d, v: r + d * v, res, S._diag_scale_term, vec
+        )
 
     if ravel_result:
         res, _ = nkjax.tree_ravel(res)
@@ -278,7 +335,10 @@ def _solve(
     if x0 is None:
         x0 = jax.tree_util.tree_map(jnp.zeros_like, y)
 
-    out, info = solve_fun(self, y, x0=x0)
+    if self._preconditioner is not None:
+        out, info = solve_fun(self, y, x0=x0, M=self._preconditioner)
+    else:
+        out, info = solve_fun(self, y, x0=x0)
     return out, info
 
 
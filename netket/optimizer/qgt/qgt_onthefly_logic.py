@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import jax
+import jax.numpy as jnp
 from jax.tree_util import Partial
 from functools import partial
 from netket.stats import subtract_mean
@@ -24,6 +25,7 @@ from netket.jax import (
     chunk,
 )
 from netket.jax.sharding import sharding_decorator
+from netket.utils.version_check import module_version
 
 # Stochastic Reconfiguration with jvp and vjp
 
@@ -208,3 +210,83 @@ def mat_vec_chunked_factory(
         pdf=pdf,
     )
     # return Partial(lambda f, *args: jax.jit(f)(*args), Partial(partial(_mat_vec_chunked, fun), params, samples))
+
+
+# -------------------------------------------------------------------------------
+# Diagonal of the S matrix, used to precondition the iterative solvers
+
+
+@partial(
+    sharding_decorator,
+    sharded_args_tree=(False, False, True, True, False),
+    reduction_op_tree=(jax.lax.psum, jax.lax.psum),
+    # the replication check of shard_map is broken since jax 0.4.38 and fails
+    # with 'None is not iterable' (see srt_onthefly)
+    check_rep=module_version("jax") < (0, 4, 38),
+)
+def _O_moments(forward_fn, params, samples, weights, chunk_size):
+    @partial(scanmap, scan_fun=scan_reduce, argnums=(2, 3))
+    def __O_moments(forward_fn, params, samples, weights):
+        def _grads(σ):
+            # gradients of the real and imaginary part of log ψ(σ)
+            def f(p):
+                out = forward_fn(p, σ[None])[0]
+                return jnp.stack([out.real, out.imag])
+
+            out, vjp_fun = jax.vjp(f, params)
+            (res,) = jax.vmap(vjp_fun)(jnp.eye(2, dtype=out.dtype))
+            return res
+
+        g = jax.vmap(_grads)(samples)
+        m1 = jax.tree_util.tree_map(lambda x: jnp.tensordot(weights, x, axes=1), g)
+        m2 = jax.tree_util.tree_map(
+            lambda x: jnp.tensordot(weights, jnp.abs(x) ** 2, axes=1), g
+        )
+        return m1, m2
+
+    samples, _ = chunk(samples, chunk_size)
+    weights, _ = chunk(weights, chunk_size)
+    return __O_moments(forward_fn, params, samples, weights)
+
+
+@partial(jax.jit, static_argnums=(0, 5))
+def mat_diag(forward_fn, params, model_state, samples, pdf=None, chunk_size=None):
+    """
+    Computes the diagonal of the SR matrix Sₖₖ = ⟨|ΔOₖ|²⟩ without constructing the
+    jacobian, by accumulating the first two moments of the per-sample gradients
+    over chunks of `chunk_size` samples.
+
+    For complex parameters, the average of the diagonal elements corresponding
+    to their real and imaginary part is returned.
+
+    Args:
+        forward_fn: The forward pass of the Ansatz
+        params : a pytree of parameters p
+        model_state: untrained state parameters of the model
+        samples : an array of (n in total) samples σ
+        pdf: a vector of weights/probabiltiy density function to weight each
+             sample in the expectation values, or None to use the empirical estimate
+        chunk_size: the number of samples for which the gradients are computed
+             simultaneously, or None to compute them all at once
+    Returns:
+        a real-valued pytree with the same structure as params
+    """
+
+    def fun(W, samples):
+        return forward_fn({"params": W, **model_state}, samples)
+
+    if pdf is None:
+        weights = jnp.full(samples.shape[0], 1.0 / samples.shape[0])
+    else:
+        weights = pdf
+
+    m1, m2 = _O_moments(fun, params, samples, weights, chunk_size)
+
+    def _diag(p, m1, m2):
+        # sum the contributions of the real and imaginary part of log ψ
+        d = jnp.sum(m2 - jnp.abs(m1) ** 2, axis=0)
+        if jnp.iscomplexobj(p):
+            d = d / 2
+        return d.astype(jnp.real(p).dtype)
+
+    return jax.tree_util.tree_map(_diag, params, m1, m2)
@@ -0,0 +1,129 @@
+# Copyright 2021 The NetKet Authors - All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from functools import partial
+
+import jax
+import jax.numpy as jnp
+
+import netket.jax as nkjax
+from netket.utils import struct
+from netket.utils.types import Array, PyTree
+from netket.optimizer.solver.solvers import _nystrom_approximation
+
+# Preconditioners for the iterative solution of the linear system S x = F with
+# the lazy QGTOnTheFly. They approximate (S + δ)⁻¹ and are passed to the solver
+# as the argument `M`, which is supported by all jax.scipy.sparse.linalg solvers.
+
+
+class DiagonalPreconditioner(struct.Pytree):
+    """
+    Jacobi preconditioner :math:`M = \\textrm{diag}(S+\\delta)^{-1}`.
+    """
+
+    diagonal: PyTree
+    """The diagonal of the S matrix, including the diagonal shift."""
+
+    def __init__(self, diagonal: PyTree):
+        self.diagonal = diagonal
+
+    def __call__(self, v: PyTree) -> PyTree:
+        return jax.tree_util.tree_map(lambda x, d: x / d, v, self.diagonal)
+
+
+class NystromPreconditioner(struct.Pytree):
+    """
+    Randomized Nyström preconditioner of
+    `Frangella, Tropp and Udell (2023) <https://arxiv.org/abs/2110.02820>`_,
+
+    .. math::
+
+        M = \\lambda_r U \\Lambda^{-1} U^T + (1 - UU^T),
+
+    where :math:`U \\Lambda U^T` is the rank :math:`r` Nyström approximation of
+    :math:`S+\\delta` and :math:`\\lambda_r` its smallest retained eigenvalue.
+
+    Complex parameters are treated as pairs of real parameters, because the S matrix
+    is in general only a real-linear operator.
+    """
+
+    U: Array
+    """The approximate eigenvectors, as a (n_parameters, rank) real matrix."""
+
+    eigenvalues: Array
+    """The approximate eigenvalues, sorted in decreasing order."""
+
+    def __init__(self, U: Array, eigenvalues: Array):
+        self.U = U
+        self.eigenvalues = eigenvalues
+
+    def __call__(self, v: PyTree) -> PyTree:
+        v, unravel = nkjax.tree_ravel(v)
+        x = _realify(v)
+
+        Λ_min = jnp.maximum(self.eigenvalues[-1], jnp.finfo(x.dtype).tiny)
+        Λ = jnp.maximum(self.eigenvalues, Λ_min)
+        Ut_x = self.U.T @ x
+        y = self.U @ (Ut_x * (Λ_min / Λ)) + x - self.U @ Ut_x
+
+        return unravel(_complexify(y, v))
+
+
+def _realify(x: Array) -> Array:
+    if jnp.iscomplexobj(x):
+        return jnp.concatenate([x.real, x.imag])
+    return x
+
+
+def _complexify(x: Array, like: Array) -> Array:
+    if jnp.iscomplexobj(like):
+        n = like.shape[0]
+        return (x[:n] + 1j * x[n:]).astype(like.dtype)
+    return x.astype(like.dtype)
+
+
+@partial(jax.jit, static_argnames=("rank", "oversampling"))
+def nystrom_preconditioner(
+    S, *, rank: int, oversampling: int = 10, seed: int = 0
+) -> NystromPreconditioner:
+    """
+    Constructs the :class:`NystromPreconditioner` of a lazy S matrix from
+    :code:`rank + oversampling` matrix-vector products.
+
+    Args:
+        S: The S matrix, including the diagonal shift.
+        rank: The rank of the approximation.
+        oversampling: The number of additional random vectors used to sketch the matrix.
+        seed: The seed used to generate the random test matrix.
+    """
+    params, unravel = nkjax.tree_ravel(S._params)
+    n = _realify(params).shape[0]
+
+    def matvec(x):
+        res, _ = nkjax.tree_ravel(S @ unravel(_complexify(x, params)))
+        return _realify(res)
+
+    if S._chunking:
+        # the chunked mat-vec product cannot be vmapped
+        def matmat(X):
+            return jax.lax.map(matvec, X.T).T
+
+    else:
+        matmat = jax.vmap(matvec, in_axes=1, out_axes=1)
+
+    sketch_size = min(rank + oversampling, n)
+    U, Λ = _nystrom_approximation(
+        matmat, n, sketch_size, jax.random.key(seed), jnp.real(params).dtype
+    )
+    return NystromPreconditioner(U[:, :rank], Λ[:rank])
@@ -295,3 +295,140 @@ def solve(A, b, *, assume_a="pos", x0=None):
 
     x = jsp.linalg.solve(A, b, assume_a="pos")
     return unravel(x), None
+
+
+def _nystrom_approximation(matmat, n: int, sketch_size: int, key, dtype):
+    """
+    Computes the randomized Nyström approximation :math:`A \\approx U \\Lambda U^\\dagger`
+    of a positive semi-definite matrix, only accessed through its action on a
+    block of vectors `matmat(X) = A @ X`.
+
+    Uses the numerically stable algorithm of
+    `Tropp et al., SIAM J. Matrix Anal. Appl. 38, 1454 (2017) <https://arxiv.org/abs/1706.05736>`_.
+
+    Args:
+        matmat: A function computing the product of the matrix with a `(n, k)` matrix.
+        n: The size of the matrix.
+        sketch_size: The number of random vectors used to sketch the matrix.
+        key: The random key used to generate the test matrix.
+        dtype: The dtype of the test matrix.
+
+    Returns:
+        The orthonormal `(n, sketch_size)` matrix of approximate eigenvectors and
+        the approximate eigenvalues, sorted in decreasing order.
+    """
+    Ω = jax.random.normal(key, (n, sketch_size), dtype=dtype)
+    Ω, _ = jnp.linalg.qr(Ω)
+    Y = matmat(Ω)
+
+    # Shift the sketch by a small amount to make the core matrix numerically
+    # positive definite, and remove it from the eigenvalues at the end.
+    eps = jnp.finfo(jnp.real(Y).dtype).eps
+    ν = jnp.sqrt(n) * eps * jnp.linalg.norm(Y)
+    Y_ν = Y + ν * Ω
+
+    core = Ω.conj().T @ Y_ν
+    core = (core + core.conj().T) / 2
+    C = jnp.linalg.cholesky(core)
+    # B = Y_ν C^{-†}, such that the approximation is B B^†
+    B = jsp.linalg.solve_triangular(C, Y_ν.conj().T, lower=True).conj().T
+    U, Σ, _ = jnp.linalg.svd(B, full_matrices=False)
+    Λ = jnp.maximum(Σ**2 - ν, 0)
+    return U, Λ
+
+
+def _matrix_free(solver):
+    # Marks solvers that only need products with the matrix and treat the diagonal
+    # shift exactly, so that the NGD drivers never construct the matrix.
+    solver.matrix_free = True
+    return solver
+
+
+@partial_from_kwargs
+@_matrix_free
+def nystrom(
+    A,
+    b,
+    *,
+    rank: int,
+    oversampling: int = 10,
+    diag_shift: float | None = None,
+    seed: int = 0,
+    x0=None,
+):
+    r"""
+    Approximately solve the linear system using a randomized Nyström low-rank
+    approximation of the (positive semi-definite) matrix.
+
+    The matrix is only accessed through matrix-vector products with a random test
+    matrix of :code:`rank + oversampling` columns, so it is never constructed or
+    factorized if :code:`A` is a linear operator.
+    The approximation :math:`A \approx U \Lambda U^\dagger` is truncated to the largest
+    :code:`rank` eigenvalues, and the system is solved as
+
+    .. math::
+
+        x = U (\Lambda + \lambda)^{-1} U^\dagger b + \lambda_\textrm{tail}^{-1}(1 - UU^\dagger) b
+
+    If :code:`diag_shift` is specified, :code:`A` is assumed not to include the shift,
+    which is then treated exactly (:math:`\lambda = \lambda_\textrm{tail} =` :code:`diag_shift`).
+    Otherwise, :math:`\lambda=0` and the unresolved part of the spectrum of :code:`A` is
+    approximated by the smallest retained eigenvalue, :math:`\lambda_\textrm{tail}=\Lambda_{r}`.
+
+    This is exact if the rank of the matrix (without the diagonal shift) is smaller
+    than :code:`rank`, and is otherwise a good approximation when the spectrum decays
+    quickly, as is the case for the neural tangent kernel used in
+    :class:`~netket.experimental.driver.VMC_SR`.
+
+    .. note::
+
+        If you pass only keyword arguments, this solver will directly create
+        a partial capturing them.
+
+    .. note::
+
+        This solver has the attribute :code:`matrix_free = True`, which is used by
+        :class:`~netket.experimental.driver.VMC_SR` to pass it the matrix as a lazy
+        operator together with the diagonal shift. Wrappers of this solver (other
+        than :func:`functools.partial`) should set the same attribute to keep this
+        behaviour.
+
+    Args:
+        A: the matrix A in Ax=b
+        b: the vector b in Ax=b
+        rank: the number of eigenvalues retained in the approximation
+        oversampling: the number of additional random vectors used to sketch the
+            matrix, improving the accuracy of the retained eigenvalues
+        diag_shift: if specified, the exact diagonal shift to add to A
+        seed: the seed used to generate the random test matrix
+        x0: unused
+    """
+    del x0
+
+    b, unravel = tree_ravel(b)
+    n = b.shape[0]
+    sketch_size = min(rank + oversampling, n)
+
+    if isinstance(A, jax.Array):
+        matmat = A.__matmul__
+    else:
+
+        def matvec(v):
+            return tree_ravel(A @ unravel(v))[0]
+
+        matmat = jax.vmap(matvec, in_axes=1, out_axes=1)
+
+    U, Λ = _nystrom_approximation(matmat, n, sketch_size, jax.random.key(seed), b.dtype)
+    U = U[:, :rank]
+    Λ = Λ[:rank]
+
+    if diag_shift is None:
+        Λ_tail = jnp.maximum(Λ[-1], jnp.finfo(Λ.dtype).tiny)
+        Λ_shifted = jnp.maximum(Λ, Λ_tail)
+    else:
+        Λ_tail = diag_shift
+        Λ_shifted = Λ + diag_shift
+
+    Uh_b = U.conj().T @ b
+    x = U @ (Uh_b / Λ_shifted) + (b - U @ Uh_b) / Λ_tail
+    return unravel(x), {"eigenvalues": Λ}
@@ -115,6 +115,16 @@ class SR(AbstractLinearPreconditioner, mutable=True):
     qgt_kwargs: dict = struct.field(serialize=False, default=None)
     """The keyword arguments to be passed to the Geometric Tensor constructor."""
 
+    preconditioner_refresh: int = struct.field(serialize=False, default=1)
+    """Number of steps for which the preconditioner of the iterative solver
+    constructed by the Geometric Tensor is reused before being recomputed."""
+
+    _qgt_preconditioner: Any = struct.field(serialize=False, default=None)
+    """Preconditioner of the iterative solver constructed at the last refresh."""
+
+    _n_lhs: int = struct.field(serialize=False, default=0)
+    """Number of linear systems constructed so far."""
+
     def __init__(
         self,
         qgt: Callable | None = None,
@@ -123,6 +133,7 @@ class SR(AbstractLinearPreconditioner, mutable=True):
         diag_shift: ScalarOrSchedule = 0.01,
         diag_scale: ScalarOrSchedule | None = None,
         solver_restart: bool = False,
+        preconditioner_refresh: int = 1,
         **kwargs,
     ):
         r"""
@@ -151,6 +162,11 @@ class SR(AbstractLinearPreconditioner, mutable=True):
             solver_restart: If False uses the last solution of the linear
                 system as a starting point for the solution of the next
                 (default=False).
+            preconditioner_refresh: If the Geometric Tensor constructs a preconditioner
+                for the iterative solver (such as the :code:`preconditioner="nystrom"`
+                option of :class:`~netket.optimizer.qgt.QGTOnTheFly`), the number of
+                steps for which it is reused before being recomputed (default=1, recomputed
+                at every step).
             holomorphic: boolean indicating if the ansatz is holomorphic or not. May
                 speed up computations for models with complex-valued parameters.
         """
@@ -161,6 +177,7 @@ class SR(AbstractLinearPreconditioner, mutable=True):
         self.qgt_kwargs = kwargs
         self.diag_shift = diag_shift
         self.diag_scale = diag_scale
+        self.preconditioner_refresh = preconditioner_refresh
 
         check_conflicting_args_in_partial(
             qgt,
@@ -195,13 +212,26 @@ class SR(AbstractLinearPreconditioner, mutable=True):
                 )
             diag_scale = diag_scale(step)
 
-        return self.qgt_constructor(
+        qgt_kwargs = self.qgt_kwargs
+        reuse_preconditioner = (
+            self._qgt_preconditioner is not None
+            and self._n_lhs % self.preconditioner_refresh != 0
+        )
+        if reuse_preconditioner:
+            qgt_kwargs = {**qgt_kwargs, "preconditioner": self._qgt_preconditioner}
+
+        lhs = self.qgt_constructor(
             vstate,
             diag_shift=diag_shift,
             diag_scale=diag_scale,
-            **self.qgt_kwargs,
+            **qgt_kwargs,
         )
 
+        self._n_lhs += 1
+        if self.preconditioner_refresh > 1:
+            self._qgt_preconditioner = getattr(lhs, "_preconditioner", None)
+        return lhs
+
     def __repr__(self):
         return (
             f"{type(self).__name__}("
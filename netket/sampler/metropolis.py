@@ -55,6 +55,8 @@ class MetropolisSamplerState(SamplerState):
     """Current batch of configurations in the Markov chain."""
     log_prob: jnp.ndarray = struct.field(sharded=True, serialize=False)
     """Log probabilities of the current batch of configurations σ in the Markov chain."""
+    log_psi: jnp.ndarray = struct.field(sharded=True, serialize=False)
+    """Log-amplitudes of the current batch of configurations σ in the Markov chain."""
     rng: jnp.ndarray = struct.field(
         sharded=struct.ShardedFieldSpec(
             sharded=True, deserialization_function="relaxed-rng-key"
@@ -63,6 +65,9 @@ class MetropolisSamplerState(SamplerState):
     """State of the random number generator (key, in jax terms)."""
     rule_state: Any | None
     """Optional state of the transition rule."""
+    fast_update_cache: Any | None = struct.field(sharded=True, serialize=False)
+    """Optional cache of the model used to update the log-amplitude incrementally
+    when the sampler is constructed with `fast_update=True`."""
 
     n_steps_proc: int = struct.field(default_factory=lambda: jnp.zeros((), dtype=int))
     """Number of moves performed along the chains in this process since the last reset."""
@@ -79,14 +84,20 @@ class MetropolisSamplerState(SamplerState):
         rng: jnp.ndarray,
         rule_state: Any | None,
         log_prob: jnp.ndarray | None = None,
+        fast_update_cache: Any | None = None,
+        log_psi: jnp.ndarray | None = None,
     ):
         self.σ = σ
         self.rng = rng
         self.rule_state = rule_state
+        self.fast_update_cache = fast_update_cache
 
         if log_prob is None:
             log_prob = jnp.full(self.σ.shape[:-1], -jnp.inf, dtype=float)
         self.log_prob = shard_along_axis(log_prob, axis=0)
+        if log_psi is None:
+            log_psi = jnp.full(self.σ.shape[:-1], -jnp.inf, dtype=log_prob.dtype)
+        self.log_psi = shard_along_axis(log_psi, axis=0)
 
         self.n_accepted_proc = shard_along_axis(
             jnp.zeros(σ.shape[0], dtype=int), axis=0
@@ -176,6 +187,17 @@ def _assert_good_log_prob_shape(log_prob, n_chains_per_rank, machine):
         )
 
 
+def _modified_sites(σ, σp, n_sites):
+    # indices of the (at most n_sites) degrees of freedom that differ between σ
+    # and σp, padded with the out-of-range index σ.shape[-1].
+    size = σ.shape[-1]
+
+    def _single(changed):
+        return jnp.nonzero(changed, size=n_sites, fill_value=size)[0]
+
+    return jax.vmap(_single)(σ != σp)
+
+
 def _round_n_chains_to_next_multiple(
     n_chains, n_chains_per_whatever, n_devices, whatever_str
 ):
@@ -232,6 +254,12 @@ class MetropolisSampler(Sampler):
     """Chunk size for evaluating wave functions."""
     reset_chains: bool = struct.field(pytree_node=False, default=False)
     """If True, resets the chain state when `reset` is called on every new sampling."""
+    fast_update: bool = struct.field(pytree_node=False, default=False)
+    """If True, the log-amplitude of proposed configurations is computed incrementally
+    from a cache stored in the sampler state, instead of re-evaluating the model."""
+    fast_update_refresh: int = struct.field(pytree_node=False, default=10)
+    """Number of sweeps after which the log-amplitudes and the cache used by
+    `fast_update` are recomputed from scratch."""
 
     def __init__(
         self,
@@ -245,6 +273,8 @@ class MetropolisSampler(Sampler):
         chunk_size: int | None = None,
         machine_pow: int = 2,
         dtype: DType = None,
+        fast_update: bool = False,
+        fast_update_refresh: int = 10,
     ):
         """
         Constructs a Metropolis Sampler.
@@ -268,6 +298,22 @@ class MetropolisSampler(Sampler):
             machine_pow: The power to which the machine should be exponentiated to generate
                 the pdf (default = 2).
             dtype: The dtype of the states sampled (default = np.float64).
+            fast_update: If True, the log-amplitude of the proposed configurations is
+                updated incrementally instead of re-evaluating the model on the full
+                configuration (default = False). This requires the transition rule to
+                define :meth:`~netket.sampler.rules.MetropolisRule.max_modified_sites`
+                and the model to implement the fast-update protocol, that is, the two
+                methods :code:`init_fast_update(x) -> (log_psi, cache)` and
+                :code:`fast_update(x, xp, sites, cache) -> (log_psi_p, cache_p)`,
+                where :code:`sites` contains the indices of the degrees of freedom that
+                differ between :code:`x` and :code:`xp`, padded with the out-of-range
+                index :code:`x.shape[-1]`. See for example
+                :class:`~netket.models.RBM`, :class:`~netket.models.Jastrow` and
+                :class:`~netket.models.Slater2nd`.
+            fast_update_refresh: If `fast_update` is True, the number of sweeps
+                after which the log-amplitudes and the cache of the model are
+                recomputed from scratch, to prevent the accumulation of round-off
+                errors in the incremental updates (default = 10).
         """
 
         # Validate the inputs
@@ -280,6 +326,12 @@ class MetropolisSampler(Sampler):
         if not isinstance(reset_chains, bool):
             raise TypeError("reset_chains must be a boolean.")
 
+        if not isinstance(fast_update, bool):
+            raise TypeError("fast_update must be a boolean.")
+
+        if not isinstance(fast_update_refresh, int) or fast_update_refresh < 1:
+            raise ValueError("fast_update_refresh must be a positive integer.")
+
         if sweep_size is None:
             sweep_size = hilbert.size
 
@@ -320,6 +372,8 @@ class MetropolisSampler(Sampler):
         self.reset_chains = reset_chains
         self.rule = rule
         self.sweep_size = sweep_size
+        self.fast_update = fast_update
+        self.fast_update_refresh = fast_update_refresh
 
     def sample_next(
         self,
@@ -360,9 +414,29 @@ class MetropolisSampler(Sampler):
         output_dtype = jax.eval_shape(machine.apply, parameters, σ).dtype
         log_prob = jnp.full((self.n_batches,), -jnp.inf, dtype=dtype_real(output_dtype))
         log_prob = shard_along_axis(log_prob, axis=0)
+        log_psi = jnp.full((self.n_batches,), -jnp.inf, dtype=output_dtype)
+        log_psi = shard_along_axis(log_psi, axis=0)
+
+        fast_update_cache = None
+        if self.fast_update:
+            self._check_fast_update_support(machine)
+            # The cache is computed in `reset`; here we only allocate it so that
+            # the structure of the state does not change.
+            _, cache_shape = jax.eval_shape(
+                partial(machine.apply, method="init_fast_update"), parameters, σ
+            )
+            fast_update_cache = jax.tree.map(
+                lambda x: shard_along_axis(jnp.zeros(x.shape, x.dtype), axis=0),
+                cache_shape,
+            )
 
         state = MetropolisSamplerState(
-            σ=σ, rng=key_state, rule_state=rule_state, log_prob=log_prob
+            σ=σ,
+            rng=key_state,
+            rule_state=rule_state,
+            log_prob=log_prob,
+            fast_update_cache=fast_update_cache,
+            log_psi=log_psi,
         )
         # If we don't reset the chain at every sampling iteration, then reset it
         # now.
@@ -397,16 +471,25 @@ class MetropolisSampler(Sampler):
             σ = state.σ
 
         # Recompute the log_probability of the current samples
-        apply_machine = apply_chunked(
-            machine.apply, in_axes=(None, 0), chunk_size=self.chunk_size
-        )
-        log_prob_σ = self.machine_pow * apply_machine(parameters, σ).real
+        if self.fast_update:
+            log_psi_σ, fast_update_cache = self._init_fast_update(
+                machine, parameters, σ
+            )
+        else:
+            apply_machine = apply_chunked(
+                machine.apply, in_axes=(None, 0), chunk_size=self.chunk_size
+            )
+            log_psi_σ = apply_machine(parameters, σ)
+            fast_update_cache = None
+        log_prob_σ = self.machine_pow * log_psi_σ.real
 
         rule_state = self.rule.reset(self, machine, parameters, state)
 
         return state.replace(
             σ=σ,
             log_prob=log_prob_σ,
+            log_psi=log_psi_σ,
+            fast_update_cache=fast_update_cache,
             rng=rng,
             rule_state=rule_state,
             n_steps_proc=jnp.zeros_like(state.n_steps_proc),
@@ -423,6 +506,13 @@ class MetropolisSampler(Sampler):
         apply_machine = apply_chunked(
             machine.apply, in_axes=(None, 0), chunk_size=self.chunk_size
         )
+        if self.fast_update:
+            n_modified_sites = self.rule.max_modified_sites()
+            fast_update = apply_chunked(
+                partial(machine.apply, method="fast_update"),
+                in_axes=(None, 0, 0, 0, 0),
+                chunk_size=self.chunk_size,
+            )
 
         def loop_body(i, state):
             # 1 to propagate for next iteration, 1 for uniform rng and n_chains for transition kernel
@@ -438,7 +528,14 @@ class MetropolisSampler(Sampler):
                 self.dtype,
                 f"{self.rule}.transition",
             )
-            proposal_log_prob = self.machine_pow * apply_machine(parameters, σp).real
+            if self.fast_update:
+                sites = _modified_sites(state.σ, σp, n_modified_sites)
+                proposal_log_psi, proposal_cache = fast_update(
+                    parameters, state.σ, σp, sites, state.fast_update_cache
+                )
+            else:
+                proposal_log_psi = apply_machine(parameters, σp)
+            proposal_log_prob = self.machine_pow * proposal_log_psi.real
             _assert_good_log_prob_shape(proposal_log_prob, self.n_batches, machine)
 
             uniform = jax.random.uniform(key2, shape=(self.n_batches,))
@@ -449,11 +546,25 @@ class MetropolisSampler(Sampler):
             else:
                 do_accept = uniform < jnp.exp(proposal_log_prob - state.log_prob)
 
+            if self.fast_update:
+                state = state.replace(
+                    fast_update_cache=jax.tree.map(
+                        lambda new, old: jnp.where(
+                            do_accept.reshape((-1,) + (1,) * (new.ndim - 1)), new, old
+                        ),
+                        proposal_cache,
+                        state.fast_update_cache,
+                    )
+                )
+
             return state.replace(
                 σ=jnp.where(do_accept.reshape(-1, 1), σp, state.σ),
                 log_prob=jax.numpy.where(
                     do_accept.reshape(-1), proposal_log_prob, state.log_prob
                 ),
+                log_psi=jax.numpy.where(
+                    do_accept.reshape(-1), proposal_log_psi, state.log_psi
+                ),
                 rng=new_rng,
                 n_accepted_proc=state.n_accepted_proc + do_accept,
                 n_steps_proc=state.n_steps_proc + self.n_batches,
@@ -461,10 +572,104 @@ class MetropolisSampler(Sampler):
 
         new_state = jax.lax.fori_loop(0, self.sweep_size, loop_body, state)
 
+        if self.fast_update:
+            # the incremental updates accumulate round-off errors, so the cache
+            # is periodically recomputed from scratch
+            n_sweeps = new_state.n_steps_proc // (self.sweep_size * self.n_batches)
+
+            def _refresh(state):
+                log_psi, cache = self._init_fast_update(machine, parameters, state.σ)
+                return state.replace(
+                    log_prob=self.machine_pow * log_psi.real,
+                    log_psi=log_psi,
+                    fast_update_cache=cache,
+                )
+
+            new_state = jax.lax.cond(
+                n_sweeps % self.fast_update_refresh == 0,
+                _refresh,
+                lambda state: state,
+                new_state,
+            )
+
         return new_state, (new_state.σ, new_state.log_prob)
 
+    def _init_fast_update(self, machine, parameters, σ):
+        init_fast_update = apply_chunked(
+            partial(machine.apply, method="init_fast_update"),
+            in_axes=(None, 0),
+            chunk_size=self.chunk_size,
+        )
+        return init_fast_update(parameters, σ)
+
+    def _check_fast_update_support(self, machine):
+        if self.rule.max_modified_sites() is None:
+            raise TypeError(
+                f"The transition rule {self.rule} does not define an upper bound "
+                "on the number of modified sites (`max_modified_sites`), which "
+                "is required when `fast_update=True`."
+            )
+        if not (
+            hasattr(machine, "init_fast_update") and hasattr(machine, "fast_update")
+        ):
+            raise TypeError(
+                f"The model {machine} does not implement the fast-update "
+                "protocol (the methods `init_fast_update` and `fast_update`), "
+                "which is required when `fast_update=True`."
+            )
+
+    def sample(
+        self,
+        machine: Callable | nn.Module,
+        parameters: PyTree,
+        *,
+        state: SamplerState | None = None,
+        chain_length: int = 1,
+        return_log_probabilities: bool = False,
+        return_log_amplitudes: bool = False,
+    ):
+        """
+        Samples `chain_length` batches of samples along the chains.
+
+        Arguments:
+            machine: A Flax module or callable with the forward pass of the log-pdf.
+                If it is a callable, it should have the signature :code:`f(parameters, σ) -> jax.Array`.
+            parameters: The PyTree of parameters of the model.
+            state: The current state of the sampler. If not specified, then initialize and reset it.
+            chain_length: The length of the chains (default = 1).
+            return_log_probabilities: If `True`, the log-probabilities are also returned, which is sometimes
+                useful to avoid re-evaluating the log-pdf when doing importance sampling. Defaults to False.
+            return_log_amplitudes: If `True`, the log-amplitudes :math:`\\log\\psi(\\sigma)`
+                computed along the chains are also returned, so that the model does not
+                need to be evaluated again on the samples. Defaults to False.
+
+        Returns:
+            Returns a tuple of 'samples' and 'state'. If neither `return_log_probabilities`
+            nor `return_log_amplitudes` is set, the samples are just the 3-rank array of
+            samples. Otherwise, the samples are a tuple of the 3-rank array of samples followed
+            by the 2-rank arrays of un-normalized log-probabilities and of log-amplitudes
+            corresponding to each sample, in this order, if requested.
+        """
+        if state is None:
+            state = self.reset(machine, parameters)
+
+        return self._sample_chain(
+            wrap_afun(machine),
+            parameters,
+            state,
+            chain_length,
+            return_log_probabilities=return_log_probabilities,
+            return_log_amplitudes=return_log_amplitudes,
+        )
+
     @partial(
-        jax.jit, static_argnames=("machine", "chain_length", "return_log_probabilities")
+        jax.jit,
+        static_argnames=(
+            "machine",
+            "chain_length",
+            "return_log_probabilities",
+            "return_log_amplitudes",
+        ),
     )
     def _sample_chain(
         self,
@@ -473,6 +678,7 @@ class MetropolisSampler(Sampler):
         state,
         chain_length,
         return_log_probabilities: bool = False,
+        return_log_amplitudes: bool = False,
     ):
         """
         Samples `chain_length` batches of samples along the chains.
@@ -484,13 +690,24 @@ class MetropolisSampler(Sampler):
             parameters: The PyTree of parameters of the model.
             state: The current state of the sampler.
             chain_length: The length of the chains.
+            return_log_probabilities: If `True`, the log-probabilities are also
+                returned.
+            return_log_amplitudes: If `True`, the log-amplitudes computed along
+                the chains are also returned. This is only supported by the
+                implementation of `_sample_next` of this class.
 
         Returns:
-            σ: The next batch of samples.
+            σ: The next batch of samples, followed by the log-probabilities and the
+                log-amplitudes if requested.
             state: The new state of the sampler
         """
-        state, (samples, log_probabilities) = jax.lax.scan(
-            lambda state, _: self._sample_next(machine, parameters, state),
+
+        def _scan_fun(state, _):
+            state, (σ, log_prob) = self._sample_next(machine, parameters, state)
+            return state, (σ, log_prob, self._chain_log_amplitudes(state))
+
+        state, (samples, log_probabilities, log_amplitudes) = jax.lax.scan(
+            _scan_fun,
             state,
             xs=None,
             length=chain_length,
@@ -498,12 +715,24 @@ class MetropolisSampler(Sampler):
         # make it (n_chains, n_samples_per_chain) as expected by netket.stats.statistics
         samples = jnp.swapaxes(samples, 0, 1)
         log_probabilities = jnp.swapaxes(log_probabilities, 0, 1)
+        log_amplitudes = jnp.swapaxes(log_amplitudes, 0, 1)
 
-        if return_log_probabilities:
+        if return_log_probabilities and return_log_amplitudes:
+            return (samples, log_probabilities, log_amplitudes), state
+        elif return_log_probabilities:
             return (samples, log_probabilities), state
+        elif return_log_amplitudes:
+            return (samples, log_amplitudes), state
         else:
             return samples, state
 
+    def _chain_log_amplitudes(self, state: MetropolisSamplerState) -> jax.Array:
+        """
+        Returns the log-amplitudes of the configurations of the chains returned
+        by :meth:`_sample_next`, which are tracked in the sampler state.
+        """
+        return state.log_psi
+
     def __repr__(self):
         return (
             f"{type(self).__name__}("
@@ -514,6 +743,12 @@ class MetropolisSampler(Sampler):
             + f"\n  reset_chains = {self.reset_chains},"
             + f"\n  machine_power = {self.machine_pow},"
             + f"\n  dtype = {self.dtype}"
+            + (
+                f",\n  fast_update = {self.fast_update},"
+                + f"\n  fast_update_refresh = {self.fast_update_refresh}"
+                if self.fast_update
+                else ""
+            )
             + ")"
         )
 
@@ -55,6 +55,11 @@ class ParallelTemperingSamplerState(MetropolisSamplerState):
     """Average variance of the position of :math:`\\beta = 1`."""
     exchange_steps: int = 0
     """Number of exchanges between the different temperatures."""
+    swap_acceptance: jnp.ndarray = None
+    """Average acceptance probability of the swaps between the configurations of
+    adjacent temperatures during the last sweep."""
+    n_adapt_sweeps_left: jnp.ndarray = None
+    """Number of sweeps during which the temperatures will still be adapted."""
 
     def __init__(
         self,
@@ -63,6 +68,8 @@ class ParallelTemperingSamplerState(MetropolisSamplerState):
         rule_state: Any | None,
         beta: jnp.ndarray,
         log_prob: jnp.ndarray | None = None,
+        log_psi: jnp.ndarray | None = None,
+        n_adapt_sweeps: int = 0,
     ):
         n_chains, n_replicas = beta.shape
 
@@ -72,7 +79,11 @@ class ParallelTemperingSamplerState(MetropolisSamplerState):
         self.beta_position = jnp.zeros((n_chains,), dtype=float)
         self.beta_diffusion = jnp.zeros((n_chains,), dtype=float)
         self.exchange_steps = jnp.zeros((), dtype=int)
-        super().__init__(σ, rng=rng, rule_state=rule_state, log_prob=log_prob)
+        self.swap_acceptance = jnp.zeros((n_replicas - 1,), dtype=beta.dtype)
+        self.n_adapt_sweeps_left = jnp.asarray(n_adapt_sweeps, dtype=int)
+        super().__init__(
+            σ, rng=rng, rule_state=rule_state, log_prob=log_prob, log_psi=log_psi
+        )
         self.n_accepted_proc = jnp.zeros(
             n_chains, dtype=int
         )  # correct shape is (n_chains,) and not (n_batches,)
@@ -136,12 +147,23 @@ class ParallelTemperingSampler(MetropolisSampler):
     """
     An internal for the user-specified distribution of betas.
     """
+    n_adapt_sweeps: int = struct.field(pytree_node=False, default=0)
+    """
+    Number of sweeps after every reset of the sampler during which the
+    temperatures are adapted.
+    """
+    adapt_rate: float = struct.field(pytree_node=False, default=0.5)
+    """
+    Rate at which the spacing of the temperatures is adapted.
+    """
 
     def __init__(
         self,
         *args,
         n_replicas: int | None = None,
         betas: str | jax.Array | None = "linear",
+        n_adapt_sweeps: int = 0,
+        adapt_rate: float = 0.5,
         **kwargs,
     ):
         r"""
@@ -172,6 +194,20 @@ class ParallelTemperingSampler(MetropolisSampler):
                     For the explicit list of values, the length must be even and the value β=1 must
                     obligatory be an element of betas, all other temperatures must be in (0,1].
                     (default : "lin", i.e. linear distribution between (0,1]).
+            n_adapt_sweeps: The number of sweeps after every reset of the sampler
+                    during which the temperatures are adapted (default : 0, i.e. the
+                    temperatures are fixed). At the end of every sweep, the gaps
+                    between the logarithms of adjacent β are enlarged where the
+                    swaps between the two temperatures are accepted more often than
+                    on average, and shrunk otherwise, keeping β=1 and the smallest
+                    β fixed. This converges to a ladder with a constant swap rate.
+                    Afterwards, the temperatures are frozen. As the sampler is reset
+                    every time new samples are drawn, this should not exceed the
+                    number of discarded sweeps (`n_discard_per_chain` of the
+                    variational state), so that the ladder is adapted during
+                    thermalization and fixed when generating the samples.
+            adapt_rate: The rate at which the spacing of the temperatures is
+                    adapted (default : 0.5).
             n_chains: The number of Markov Chain to be run in parallel on a single JAX process.
             sweep_size: The number of exchanges that compose a single sweep.
                     If None, sweep_size is equal to the number of degrees of freedom being sampled
@@ -234,9 +270,21 @@ class ParallelTemperingSampler(MetropolisSampler):
                 "n_replicas (or the length of `betas`) must be an even integer > 0."
             )
 
+        if not (isinstance(n_adapt_sweeps, int) and n_adapt_sweeps >= 0):
+            raise ValueError("n_adapt_sweeps must be a non-negative integer.")
+        if not adapt_rate > 0:
+            raise ValueError("adapt_rate must be positive.")
+
+        if kwargs.get("fast_update", False):
+            raise NotImplementedError(
+                "ParallelTemperingSampler does not support `fast_update=True`."
+            )
+
         self.n_replicas = n_replicas
         self._beta_sorted = betas
         self._beta_distribution = beta_distribution
+        self.n_adapt_sweeps = n_adapt_sweeps
+        self.adapt_rate = adapt_rate
 
         super().__init__(*args, **kwargs)
 
@@ -271,6 +319,7 @@ class ParallelTemperingSampler(MetropolisSampler):
             + f"\n  n_chains = {self.n_chains},"
             + f"\n  n_replicas = {self.n_replicas},"
             + f"\n  beta_distribution = {self._beta_distribution},"
+            + f"\n  n_adapt_sweeps = {self.n_adapt_sweeps},"
             + f"\n  sweep_size = {self.sweep_size},"
             + f"\n  reset_chains = {self.reset_chains},"
             + f"\n  machine_power = {self.machine_pow},"
@@ -300,15 +349,19 @@ class ParallelTemperingSampler(MetropolisSampler):
         output_dtype = jax.eval_shape(machine.apply, parameters, σ).dtype
         log_prob = jnp.full((self.n_batches,), -jnp.inf, dtype=dtype_real(output_dtype))
         log_prob = shard_along_axis(log_prob, axis=0)
+        log_psi = jnp.full((self.n_batches,), -jnp.inf, dtype=output_dtype)
+        log_psi = shard_along_axis(log_psi, axis=0)
 
         beta = jnp.tile(self.sorted_betas, (self.n_batches // self.n_replicas, 1))
 
         return ParallelTemperingSamplerState(
             σ=σ,
             log_prob=log_prob,
+            log_psi=log_psi,
             rng=key_state,
             rule_state=rule_state,
             beta=beta,
+            n_adapt_sweeps=self.n_adapt_sweeps,
         )
 
     @partial(jax.jit, static_argnums=1)
@@ -319,6 +372,9 @@ class ParallelTemperingSampler(MetropolisSampler):
             beta_position=jnp.zeros_like(state.beta_position),
             beta_diffusion=jnp.zeros_like(state.beta_diffusion),
             exchange_steps=jnp.zeros_like(state.exchange_steps),
+            n_adapt_sweeps_left=jnp.full_like(
+                state.n_adapt_sweeps_left, self.n_adapt_sweeps
+            ),
             # beta=beta,
             # beta_0_index=jnp.zeros((self.n_chains,), dtype=jnp.int64),
         )
@@ -326,9 +382,8 @@ class ParallelTemperingSampler(MetropolisSampler):
     def _sample_next(
         self, machine, parameters: PyTree, state: ParallelTemperingSamplerState
     ):
-        def loop_body(
-            i, state: ParallelTemperingSamplerState
-        ) -> ParallelTemperingSamplerState:
+        def loop_body(i, carry):
+            state, swap_acceptance = carry
             # 1 to propagate for next iteration, 1 for uniform rng and n_chains for transition kernel
             new_rng, key1, key2, key3, key4 = jax.random.split(state.rng, 5)
 
@@ -338,7 +393,8 @@ class ParallelTemperingSampler(MetropolisSampler):
             σp, log_prob_correction = self.rule.transition(
                 self, machine, parameters, state, key1, state.σ
             )
-            proposal_log_prob = self.machine_pow * machine.apply(parameters, σp).real
+            proposal_log_psi = machine.apply(parameters, σp)
+            proposal_log_prob = self.machine_pow * proposal_log_psi.real
 
             uniform = jax.random.uniform(key2, shape=(self.n_batches,))
             if log_prob_correction is not None:
@@ -360,6 +416,16 @@ class ParallelTemperingSampler(MetropolisSampler):
             new_log_prob = jax.numpy.where(
                 do_accept.reshape(-1), proposal_log_prob, state.log_prob
             )
+            new_log_psi = jax.numpy.where(
+                do_accept.reshape(-1), proposal_log_psi, state.log_psi
+            )
+
+            swap_acceptance = swap_acceptance + _adjacent_swap_acceptance(
+                beta,
+                new_log_prob.reshape(
+                    (self.n_batches // self.n_replicas, self.n_replicas)
+                ),
+            )
 
             ## exchange betas
 
@@ -461,10 +527,11 @@ class ParallelTemperingSampler(MetropolisSampler):
             delta2 = new_beta_0_index - new_beta_position
             new_beta_diffusion = state.beta_diffusion + delta * delta2
 
-            return state.replace(
+            new_state = state.replace(
                 rng=new_rng,
                 σ=new_σ,
                 log_prob=new_log_prob,
+                log_psi=new_log_psi,
                 beta=new_beta,
                 beta_0_index=new_beta_0_index,
                 n_accepted_per_beta=new_n_accepted_per_beta,
@@ -476,8 +543,18 @@ class ParallelTemperingSampler(MetropolisSampler):
                     new_n_accepted_per_beta, new_beta_0_index
                 ),
             )
+            return new_state, swap_acceptance
 
-        new_state = jax.lax.fori_loop(0, self.sweep_size, loop_body, state)
+        swap_acceptance = jnp.zeros((self.n_replicas - 1,), dtype=state.beta.dtype)
+        new_state, swap_acceptance = jax.lax.fori_loop(
+            0, self.sweep_size, loop_body, (state, swap_acceptance)
+        )
+        swap_acceptance = swap_acceptance / (
+            self.sweep_size * (self.n_batches // self.n_replicas)
+        )
+        new_state = new_state.replace(swap_acceptance=swap_acceptance)
+        if self.n_adapt_sweeps > 0:
+            new_state = self._adapt_betas(new_state)
 
         σ_flat = new_state.σ
         σ = σ_flat.reshape((-1, self.n_replicas, σ_flat.shape[-1]))
@@ -492,6 +569,62 @@ class ParallelTemperingSampler(MetropolisSampler):
 
         return new_state, (σ_new, log_prob_new)
 
+    def _chain_log_amplitudes(self, state: ParallelTemperingSamplerState):
+        # select the log-amplitudes of the replicas at β=1
+        log_psi = state.log_psi.reshape((-1, self.n_replicas))
+        log_psi = jnp.take_along_axis(log_psi, state.beta_0_index[:, None], axis=1)
+        return jax.lax.collapse(log_psi, 0, 2)  # remove dummy replica dim
+
+    def _adapt_betas(
+        self, state: ParallelTemperingSamplerState
+    ) -> ParallelTemperingSamplerState:
+        """
+        Updates the temperatures towards a constant swap rate between adjacent
+        temperatures, if the state still has sweeps of adaptation left.
+        """
+        adapt = state.n_adapt_sweeps_left > 0
+
+        # all chains share the same ladder, in a different order
+        rank = jnp.argsort(jnp.argsort(-state.beta, axis=-1), axis=-1)
+        ladder = -jnp.sort(-state.beta[0])
+
+        log_gaps = -jnp.diff(jnp.log(ladder))
+        acceptance = state.swap_acceptance
+        log_gaps = log_gaps * jnp.exp(
+            self.adapt_rate * (acceptance - acceptance.mean())
+        )
+        # keep the largest and smallest beta fixed
+        log_gaps = log_gaps * jnp.log(ladder[0] / ladder[-1]) / log_gaps.sum()
+        log_ladder = jnp.concatenate(
+            [jnp.zeros((1,), dtype=log_gaps.dtype), -jnp.cumsum(log_gaps)]
+        )
+        new_ladder = (ladder[0] * jnp.exp(log_ladder)).at[-1].set(ladder[-1])
+
+        return state.replace(
+            beta=jnp.where(adapt, new_ladder[rank], state.beta),
+            n_adapt_sweeps_left=state.n_adapt_sweeps_left - adapt,
+        )
+
+
+def _adjacent_swap_acceptance(beta, log_prob):
+    """
+    Acceptance probability of swapping the configurations of every pair of
+    adjacent temperatures, summed over the chains.
+
+    Args:
+        beta: The temperatures of the replicas, with shape (n_chains, n_replicas).
+        log_prob: The log-probabilities of the configurations of the replicas.
+    """
+    order = jnp.argsort(-beta, axis=-1)
+    beta_sorted = jnp.take_along_axis(beta, order, axis=-1)
+    log_prob_sorted = jnp.take_along_axis(log_prob, order, axis=-1)
+    log_acceptance = -jnp.diff(beta_sorted, axis=-1) * jnp.diff(
+        log_prob_sorted, axis=-1
+    )
+    # configurations with zero probability before the first move
+    log_acceptance = jnp.nan_to_num(log_acceptance, nan=0.0)
+    return jnp.exp(jnp.minimum(log_acceptance, 0)).sum(axis=0)
+
 
 def ParallelTemperingLocal(hilbert, *args, **kwargs):
     r"""
@@ -84,6 +84,23 @@ class MetropolisRule(struct.Pytree):
         """
         return sampler_state.rule_state
 
+    def max_modified_sites(self) -> int | None:
+        """
+        Returns a static upper bound on the number of degrees of freedom that a
+        single call to :meth:`transition` can modify in every configuration, or
+        `None` if no such bound is known.
+
+        This is used by :class:`~netket.sampler.MetropolisSampler` when
+        `fast_update=True` to extract the modified sites and update the
+        log-amplitude of the model incrementally.
+
+        The default implementation returns `None`.
+
+        Returns:
+            An integer upper bound or `None`.
+        """
+        return None
+
     @abc.abstractmethod
     def transition(
         self,
@@ -152,6 +152,9 @@ class ExchangeRule(MetropolisRule):
 
         return _update_samples(keys, σ, hoppable_clusters)
 
+    def max_modified_sites(self) -> int:
+        return 2
+
     def __repr__(self):
         return f"ExchangeRule(# of clusters: {len(self.clusters)})"
 
@@ -48,5 +48,8 @@ class LocalRule(MetropolisRule):
 
         return σp, None
 
+    def max_modified_sites(self) -> int:
+        return 1
+
     def __repr__(self):
         return "LocalRule()"
@@ -151,5 +151,11 @@ class MultipleRules(MetropolisRule):
 
         return σp, log_prob_corr
 
+    def max_modified_sites(self) -> int | None:
+        n_sites = [rule.max_modified_sites() for rule in self.rules]
+        if any(n is None for n in n_sites):
+            return None
+        return max(n_sites)
+
     def __repr__(self):
         return f"MultipleRules(probabilities={self.probabilities}, rules={self.rules})"
@@ -144,5 +144,11 @@ class TensorRule(MetropolisRule):
         log_prob_corr = sum(log_prob_corr) if len(log_prob_corr) > 0 else None
         return σp, log_prob_corr
 
+    def max_modified_sites(self) -> int | None:
+        n_sites = [rule.max_modified_sites() for rule in self.rules]
+        if any(n is None for n in n_sites):
+            return None
+        return sum(n_sites)
+
     def __repr__(self):
         return f"TensorRule(hilbert={self.hilbert}, rules={self.rules})"
@@ -15,6 +15,7 @@
 from .mpi_stats import subtract_mean, mean, sum, var, total_size
 
 from .mc_stats import statistics, Stats
+from .accumulator import StatsAccumulator
 
 from netket.utils import _hide_submodules
 
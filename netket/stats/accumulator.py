@@ -0,0 +1,274 @@
+# Copyright 2026 The NetKet Authors - All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import jax
+from jax import numpy as jnp
+
+from netket import jax as nkjax
+from netket.utils import config, struct
+from netket.utils.types import DType
+
+from .mc_stats import Stats
+
+
+@struct.dataclass
+class StatsAccumulator:
+    r"""
+    A pytree accumulating the statistics of Markov chain data chunk by chunk,
+    without keeping the data in memory.
+
+    The accumulator is immutable: :meth:`~netket.stats.StatsAccumulator.update`
+    returns a new accumulator including the additional data, and the statistics
+    are obtained with :meth:`~netket.stats.StatsAccumulator.get_stats`. Both
+    methods can be used inside of :func:`jax.jit`.
+
+    Every chunk of data must have shape `(n_chains, chunk_length)`, where the
+    rows are the continuation of the Markov chains of the previous chunks. This
+    can be used, for example, to pool the local estimators computed over several
+    calls to :meth:`~netket.vqs.MCState.sample` to obtain high-precision
+    estimates without keeping all the samples in memory:
+
+    .. code:: python
+
+        acc = nk.stats.StatsAccumulator.empty(vstate.sampler.n_chains)
+        for _ in range(100):
+            vstate.sample()
+            acc = acc.update(vstate.local_estimators(H))
+        print(acc.get_stats())
+
+    The mean and the variance are accumulated exactly with Welford's algorithm.
+    The error of the mean is estimated from the variance of the means of the
+    chains or, if there is a single chain, from the variance of the means of
+    blocks of consecutive samples. At most `max_blocks` blocks are stored for
+    every chain: when they are all filled, consecutive blocks are merged and the
+    size of the blocks is doubled. The blocks are also used to compute the
+    split-:math:`\hat{R}` diagnostic, splitting every chain at the boundary
+    between the first and second half of its blocks.
+
+    .. note::
+
+        :meth:`~netket.vqs.MCState.expect` does not use the accumulator, even when
+        chunking, and computes the statistics with :func:`~netket.stats.statistics`
+        on the full array of local estimators. This array is much smaller than
+        the samples, which are held in memory anyway, and the arguments of the
+        local kernels cannot be split among the samples in general (for example,
+        jax operators).
+    """
+
+    n_samples_per_chain: jax.Array
+    """Number of samples accumulated in every chain."""
+    chain_mean: jax.Array
+    """Running mean of every chain."""
+    chain_m2: jax.Array
+    """Running sum of the squared deviations from the mean of every chain."""
+    block_sums: jax.Array
+    """Sums of the samples in every completed block, with shape `(n_chains, max_blocks)`."""
+    n_blocks: jax.Array
+    """Number of completed blocks."""
+    block_size: jax.Array
+    """Number of samples in every block."""
+    partial_sum: jax.Array
+    """Sum of the samples in the block which is being filled."""
+    partial_size: jax.Array
+    """Number of samples in the block which is being filled."""
+
+    @classmethod
+    def empty(
+        cls, n_chains: int, dtype: DType = float, *, max_blocks: int = 64
+    ) -> "StatsAccumulator":
+        """
+        Constructs an accumulator that does not contain any data.
+
+        Args:
+            n_chains: The number of Markov chains.
+            dtype: The dtype of the data, which can be real or complex.
+            max_blocks: The maximum number of blocks stored for every chain. Must be
+                an even number.
+        """
+        if max_blocks < 2 or max_blocks % 2 != 0:
+            raise ValueError(
+                f"max_blocks must be an even number larger than 0 (got {max_blocks})."
+            )
+        dtype = jnp.dtype(dtype)
+        real_dtype = nkjax.dtype_real(dtype)
+        return cls(
+            n_samples_per_chain=jnp.zeros((), dtype=jnp.int32),
+            chain_mean=jnp.zeros((n_chains,), dtype=dtype),
+            chain_m2=jnp.zeros((n_chains,), dtype=real_dtype),
+            block_sums=jnp.zeros((n_chains, max_blocks), dtype=dtype),
+            n_blocks=jnp.zeros((), dtype=jnp.int32),
+            block_size=jnp.ones((), dtype=jnp.int32),
+            partial_sum=jnp.zeros((n_chains,), dtype=dtype),
+            partial_size=jnp.zeros((), dtype=jnp.int32),
+        )
+
+    @property
+    def n_chains(self) -> int:
+        """The number of Markov chains."""
+        return self.chain_mean.shape[0]
+
+    @property
+    def max_blocks(self) -> int:
+        """The maximum number of blocks stored for every chain."""
+        return self.block_sums.shape[1]
+
+    def update(self, data: jax.Array) -> "StatsAccumulator":
+        """
+        Returns a new accumulator including the additional data.
+
+        Args:
+            data: An array with shape `(n_chains, chunk_length)` containing the
+                continuation of the Markov chains, or `(n_chains,)` for a single
+                sample of every chain.
+        """
+        return _update(self, data)
+
+    def get_stats(self) -> Stats:
+        """
+        Returns the statistics of the data accumulated so far.
+        """
+        return _get_stats(self)
+
+
+@jax.jit
+def _update(acc: StatsAccumulator, data: jax.Array) -> StatsAccumulator:
+    data = jnp.asarray(data, dtype=acc.chain_mean.dtype)
+    if data.ndim == 1:
+        data = data.reshape((-1, 1))
+    if data.ndim != 2 or data.shape[0] != acc.n_chains:
+        raise ValueError(
+            f"Expected data with shape (n_chains={acc.n_chains}, chunk_length), "
+            f"got {data.shape}."
+        )
+
+    # Combine the mean and the sum of squared deviations of the new chunk with
+    # the accumulated ones (Chan et al. parallel variant of Welford's algorithm).
+    real_dtype = acc.chain_m2.dtype
+    n_a = acc.n_samples_per_chain.astype(real_dtype)
+    n_b = data.shape[1]
+    n = n_a + n_b
+    chunk_mean = data.mean(axis=1)
+    chunk_m2 = jnp.sum(jnp.abs(data - chunk_mean[:, None]) ** 2, axis=1)
+    delta = chunk_mean - acc.chain_mean
+    chain_mean = acc.chain_mean + delta * (n_b / n)
+    chain_m2 = acc.chain_m2 + chunk_m2 + jnp.abs(delta) ** 2 * (n_a * n_b / n)
+
+    # Fill the blocks one sample at a time, merging them when they are all full.
+    def _merge_blocks(carry):
+        block_sums, n_blocks, block_size = carry
+        merged = block_sums.reshape(acc.n_chains, -1, 2).sum(axis=-1)
+        block_sums = jnp.concatenate([merged, jnp.zeros_like(merged)], axis=1)
+        return block_sums, n_blocks // 2, block_size * 2
+
+    def _complete_block(carry):
+        block_sums, n_blocks, block_size, partial_sum, partial_size = carry
+        block_sums = block_sums.at[:, n_blocks].set(partial_sum)
+        block_sums, n_blocks, block_size = jax.lax.cond(
+            n_blocks + 1 == acc.max_blocks,
+            _merge_blocks,
+            lambda c: c,
+            (block_sums, n_blocks + 1, block_size),
+        )
+        partial_sum = jnp.zeros_like(partial_sum)
+        return (
+            block_sums,
+            n_blocks,
+            block_size,
+            partial_sum,
+            jnp.zeros_like(partial_size),
+        )
+
+    def _add_sample(carry, x):
+        block_sums, n_blocks, block_size, partial_sum, partial_size = carry
+        carry = (block_sums, n_blocks, block_size, partial_sum + x, partial_size + 1)
+        carry = jax.lax.cond(
+            carry[4] == block_size, _complete_block, lambda c: c, carry
+        )
+        return carry, None
+
+    carry = (
+        acc.block_sums,
+        acc.n_blocks,
+        acc.block_size,
+        acc.partial_sum,
+        acc.partial_size,
+    )
+    carry, _ = jax.lax.scan(_add_sample, carry, data.T)
+    block_sums, n_blocks, block_size, partial_sum, partial_size = carry
+
+    return StatsAccumulator(
+        n_samples_per_chain=acc.n_samples_per_chain + n_b,
+        chain_mean=chain_mean,
+        chain_m2=chain_m2,
+        block_sums=block_sums,
+        n_blocks=n_blocks,
+        block_size=block_size,
+        partial_sum=partial_sum,
+        partial_size=partial_size,
+    )
+
+
+def _masked_var(x, mask):
+    n = jnp.sum(mask, axis=-1)
+    mean = jnp.sum(jnp.where(mask, x, 0), axis=-1) / n
+    return jnp.sum(jnp.where(mask, jnp.abs(x - mean) ** 2, 0), axis=-1) / n
+
+
+@jax.jit
+def _get_stats(acc: StatsAccumulator) -> Stats:
+    n_chains = acc.n_chains
+    N = acc.n_samples_per_chain.astype(acc.chain_m2.dtype)
+
+    mean = acc.chain_mean.mean()
+    variance = (
+        acc.chain_m2.sum() + N * jnp.sum(jnp.abs(acc.chain_mean - mean) ** 2)
+    ) / (n_chains * N)
+
+    block_means = acc.block_sums / acc.block_size
+    block_mask = jnp.arange(acc.max_blocks) < acc.n_blocks
+
+    if n_chains > 1:
+        batch_var = jnp.var(acc.chain_mean)
+        error_of_mean = jnp.sqrt(batch_var / n_chains)
+        tau_corr = 0.5 * (N * batch_var / variance - 1)
+
+        if config.netket_use_plain_rhat:
+            R_hat = jnp.sqrt((N - 1) / N + batch_var / variance)
+        else:
+            # split every chain at the middle of its completed blocks
+            half = acc.n_blocks // 2
+            idx = jnp.arange(acc.max_blocks)
+            first = jnp.sum(jnp.where(idx < half, acc.block_sums, 0), axis=1)
+            second = jnp.sum(
+                jnp.where((idx >= half) & (idx < 2 * half), acc.block_sums, 0), axis=1
+            )
+            half_means = jnp.concatenate([first, second]) / (half * acc.block_size)
+            split_var = jnp.var(half_means)
+            R_hat = jnp.where(
+                half > 0, jnp.sqrt((N - 1) / N + split_var / variance), jnp.nan
+            )
+    else:
+        block_var = _masked_var(block_means[0], block_mask)
+        error_of_mean = jnp.sqrt(block_var / acc.n_blocks)
+        tau_corr = 0.5 * (acc.block_size * block_var / variance - 1)
+        R_hat = jnp.nan
+
+    stat_dtype = nkjax.dtype_real(acc.chain_mean.dtype)
+    return Stats(
+        mean,
+        jnp.asarray(error_of_mean, dtype=stat_dtype),
+        jnp.asarray(variance, dtype=stat_dtype),
+        jnp.asarray(jnp.clip(tau_corr, 0), dtype=stat_dtype),
+        jnp.asarray(R_hat, dtype=stat_dtype),
+    )
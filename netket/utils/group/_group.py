@@ -151,6 +151,18 @@ class FiniteGroup(FiniteSemiGroup):
 
         return product_table
 
+    def product_table_entries(self, idx_g: Array, idx_h: Array) -> Array:
+        r"""
+        Selected entries of :attr:`product_table`.
+
+        :code:`self.product_table_entries(idx_g, idx_h)` is equivalent to
+        :code:`self.product_table[idx_g, idx_h]` for (broadcastable) integer
+        arrays :code:`idx_g` and :code:`idx_h`, but groups with additional
+        structure (e.g. space groups) compute it without constructing the
+        full :math:`|G|\times|G|` table.
+        """
+        return self.product_table[idx_g, idx_h]
+
     @struct.property_cached
     def conjugacy_table(self) -> Array:
         r"""
@@ -277,12 +289,7 @@ class FiniteGroup(FiniteSemiGroup):
         # ensure correct sign (i.e. identity should have a real character)
         table /= _cplx_sign(table[:, 0])[:, np.newaxis]
 
-        # Sort lexicographically, ascending by first column, descending by others
-        sorting_table = np.column_stack((table.real, table.imag))
-        sorting_table[:, 1:] *= -1
-        sorting_table = comparable(sorting_table)
-        _, indices = np.unique(sorting_table, axis=0, return_index=True)
-        table = table[indices]
+        table = table[self._character_order(table)]
 
         # Get rid of annoying nearly-zero entries
         table = prune_zeros(table)
@@ -295,6 +302,17 @@ class FiniteGroup(FiniteSemiGroup):
         else:
             return table
 
+    @staticmethod
+    def _character_order(table: Array) -> Array:
+        """Indices that sort the rows of a character table lexicographically,
+        ascending by the first column (i.e. by dimension) and descending by the
+        others."""
+        sorting_table = np.column_stack((table.real, table.imag))
+        sorting_table[:, 1:] *= -1
+        sorting_table = comparable(sorting_table)
+        _, indices = np.unique(sorting_table, axis=0, return_index=True)
+        return indices
+
     def projective_characters_by_class(
         self, multiplier: Array | None
     ) -> tuple[np.ndarray, np.ndarray]:
@@ -420,6 +438,9 @@ class FiniteGroup(FiniteSemiGroup):
         Assumes that :code:`Identity() == self[0]`, if not, the sign of some
         characters may be flipped. The irreps are sorted by dimension.
         """
+        return self._burnside_character_table()
+
+    def _burnside_character_table(self) -> np.ndarray:
         classes, _, _ = self.conjugacy_classes
         class_sizes = classes.sum(axis=1)
         # Burnside's algorithm hinges on the equation
@@ -515,6 +536,9 @@ class FiniteGroup(FiniteSemiGroup):
 
     @struct.property_cached
     def _irrep_matrices(self) -> list[Array]:
+        return self._dixon_irrep_matrices()
+
+    def _dixon_irrep_matrices(self) -> list[Array]:
         # We use Dixon's algorithm (Math. Comp. 24 (1970), 707) to decompose
         # the regular representation of the group into its irreps.
         # We start with a Hermitian matrix E that commutes with every matrix in
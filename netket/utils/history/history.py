@@ -67,9 +67,14 @@ class History:
 
     If only one time-series is provided, without a key, then its name will
     be `value`.
+
+    Numerical time-series are stored in buffers whose capacity is doubled
+    every time they are full, so that appending a value has an amortized
+    constant cost. The arrays returned when accessing the data are views of
+    the first `len(history)` elements of those buffers.
     """
 
-    __slots__ = ("_value_dict", "_value_name", "_single_value", "_keys")
+    __slots__ = ("_value_dict", "_value_name", "_single_value", "_keys", "_len")
 
     def __init__(
         self,
@@ -189,6 +194,7 @@ class History:
         self._value_name = main_value_name
         self._single_value = single_value
         self._keys = keys
+        self._len = n_elements
 
     @property
     def main_value_name(self) -> str | None:
@@ -197,16 +203,26 @@ class History:
 
     @property
     def iters(self) -> Array:
-        return self._value_dict["iters"]
+        return self._view("iters")
 
     @property
     def values(self) -> Array:
         if self._value_name is None:
             raise ValueError("No main value defined for this history object.")
-        return self._value_dict[self._value_name]
+        return self._view(self._value_name)
 
     def __len__(self) -> int:
-        return len(self.iters)
+        return self._len
+
+    def _view(self, key: str) -> Array | list:
+        """
+        Returns the data stored for `key`, trimming the unused capacity of
+        the buffer if it is an array.
+        """
+        val = self._value_dict[key]
+        if isinstance(val, np.ndarray):
+            return val[: self._len]
+        return val
 
     def __getitem__(self, key) -> Array:
         # if its an int corresponding to an element not inside the dict,
@@ -218,7 +234,7 @@ class History:
         if isinstance(key, slice):
             return self._get_slice(key)
 
-        return self._value_dict[key]
+        return self._view(key)
 
     def _get_slice(self, slce: slice) -> "History":
         """
@@ -265,7 +281,7 @@ class History:
 
         Used for serialization
         """
-        return self._value_dict
+        return {key: self._view(key) for key in self._value_dict}
 
     def __array__(self, *args, **kwargs) -> Array:
         """
@@ -285,7 +301,7 @@ class History:
     def __getattr__(self, attr):
         # Allow users to access fields with . accessor patterns
         if attr in self._value_dict:
-            return self._value_dict[attr]
+            return self._view(attr)
 
         raise AttributeError
 
@@ -406,36 +422,43 @@ def append(self: History, val: History, it: Any):  # noqa: E0102, F811
         self._value_dict[key] = np.concatenate([self[key], val[key]])
 
     self._value_dict["iters"] = np.concatenate([self.iters, val.iters])
+    self._len = len(self._value_dict["iters"])
     return self
 
 
+def _reserve(buffer: np.ndarray, length: int) -> np.ndarray:
+    """
+    Returns a buffer with the same content as `buffer` in its first `length`
+    elements, and room for at least one more element, doubling its capacity
+    if it is full.
+    """
+    if length < len(buffer):
+        return buffer
+    new_buffer = np.empty((max(1, 2 * length),) + buffer.shape[1:], dtype=buffer.dtype)
+    new_buffer[:length] = buffer[:length]
+    return new_buffer
+
+
 @dispatch
 def append(self: History, values: dict, it: Any):  # noqa: E0102, F811
+    n = self._len
     for key, val in values.items():
         _vals = self._value_dict[key]
 
         if isinstance(_vals, list):
             _vals.append(val)
         elif isinstance(_vals, np.ndarray):
-            new_shape = (len(_vals) + 1,) + _vals.shape[1:]
-            # try to resize in place the buffer so that we don't reallocate
-            # and if we fail, resize tby reallocating to a new buffer.
-            try:
-                _vals.resize(new_shape)
-            except ValueError:
-                _vals = np.resize(_vals, new_shape)
-                self._value_dict[key] = _vals
-
-            _vals[-1] = val
+            _vals = _reserve(_vals, n)
+            _vals[n] = val
+            self._value_dict[key] = _vals
         else:
             raise TypeError(f"Unknown accumulator type {type(_vals)} for key {key}.")
 
-    try:
-        self.iters.resize(len(self.iters) + 1)
-    except ValueError:
-        self._value_dict["iters"] = np.resize(self.iters, (len(self.iters) + 1))
+    iters = _reserve(self._value_dict["iters"], n)
+    iters[n] = it
+    self._value_dict["iters"] = iters
 
-    self.iters[-1] = it
+    self._len = n + 1
     return self
 
 
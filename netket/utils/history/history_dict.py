@@ -144,28 +144,46 @@ class HistoryDict:
         """
         Create an HistoryDict from a text-file containing its serialization.
 
+        Files with the `.jsonl` extension are read with
+        :meth:`~netket.utils.history.HistoryDict.from_jsonl_file`.
+
         Args:
             fname: The name of the file to read.
         """
+        if str(fname).endswith(".jsonl"):
+            return cls.from_jsonl_file(fname)
+
         with open(fname) as f:
             data = orjson.loads(f.read())
 
         data = histdict_to_nparray(data)
+        return cls(_reconstruct_histories(data))
 
-        def _recompose(hist_dict):
-            # hist_dict = {k: np.array(v) for k, v in hist_dict.items()}
-            for _, checker, reconstructor in DESERIALIZATION_REGISTRY:
-                if checker(hist_dict):
-                    return reconstructor(hist_dict)
-            raise ValueError("No matching type found for the given dictionary.")
+    @classmethod
+    def from_jsonl_file(cls, fname: str) -> Self:
+        """
+        Create an HistoryDict from a JSON-lines file where every line contains the
+        serialization of a chunk of iterations, such as the files written by
+        :class:`~netket.logging.JsonLinesLog`.
 
-        def _is_leaf(dic):
-            if isinstance(dic, dict):
-                if "iters" in dic:
-                    return True
-            return False
+        The chunks are concatenated along the iterations. Quantities that appear
+        only in some of the chunks are concatenated over the chunks where they
+        are present.
 
-        return cls(jax.tree.map(_recompose, data, is_leaf=_is_leaf))
+        Args:
+            fname: The name of the file to read.
+        """
+        data = None
+        with open(fname, "rb") as f:
+            for line in f:
+                if len(line.strip()) == 0:
+                    continue
+                chunk = histdict_to_nparray(orjson.loads(line))
+                data = _concatenate_chunks(data, chunk)
+
+        if data is None:
+            data = {}
+        return cls(_reconstruct_histories(data))
 
     def _ipython_key_completions_(self):
         return self._data.keys()
@@ -213,6 +231,48 @@ register_historydict_deserialization_fun(
 )
 
 
+def _is_history_leaf(dic):
+    return isinstance(dic, dict) and "iters" in dic
+
+
+def _recompose(hist_dict):
+    for _, checker, reconstructor in DESERIALIZATION_REGISTRY:
+        if checker(hist_dict):
+            return reconstructor(hist_dict)
+    raise ValueError("No matching type found for the given dictionary.")
+
+
+def _reconstruct_histories(data):
+    """
+    Reconstructs the objects (usually History) from their dictionary serialization
+    in a tree of data loaded from a file.
+    """
+    return jax.tree.map(_recompose, data, is_leaf=_is_history_leaf)
+
+
+def _concatenate_chunks(acc, chunk):
+    """
+    Concatenates along the iterations two trees of serialized histories.
+    """
+    if acc is None:
+        return chunk
+    elif chunk is None:
+        return acc
+    elif _is_history_leaf(chunk):
+        return {k: np.concatenate([acc[k], v]) for k, v in chunk.items()}
+    elif isinstance(chunk, dict):
+        result = dict(acc)
+        for k, v in chunk.items():
+            result[k] = _concatenate_chunks(acc.get(k, None), v)
+        return result
+    elif isinstance(chunk, list):
+        n = max(len(acc), len(chunk))
+        acc = acc + [None] * (n - len(acc))
+        chunk = chunk + [None] * (n - len(chunk))
+        return [_concatenate_chunks(a, c) for a, c in zip(acc, chunk)]
+    raise TypeError(f"Cannot concatenate log chunks of type {type(chunk)}.")
+
+
 """
 Json serializer for complex numbers.
 
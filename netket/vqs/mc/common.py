@@ -61,6 +61,52 @@ def get_local_kernel(vstate: Any, Ô: Any):
     """
 
 
+@dispatch
+def get_local_kernel_cached(vstate: Any, Ô: Any, kernel: Any):
+    """
+    Returns a variant of the local kernel `kernel` returned by
+    :func:`get_local_kernel` which reuses the log-amplitudes of the samples
+    cached in the variational state, or `None` if there is no such variant.
+
+    The cached kernel accepts as arguments the tuple `(logpsi_σ, args)`, where
+    `args` are the arguments returned by :func:`get_local_kernel_arguments`.
+
+    Args:
+        vstate: the variational state
+        Ô: the operator
+        kernel: the local kernel returned by :func:`get_local_kernel`
+
+    Returns:
+        A callable or `None`.
+    """
+    return None
+
+
+def get_local_kernel_and_arguments(vstate: Any, Ô: Any, *chunk_size):
+    """
+    Returns the samples, the arguments and the local kernel used to compute
+    the expectation value of the operator O, substituting the kernel returned
+    by :func:`get_local_kernel_cached` when it exists.
+
+    Args:
+        vstate: the variational state
+        Ô: the operator
+        chunk_size: the optional chunk size passed to :func:`get_local_kernel`
+
+    Returns:
+        A Tuple `(sigma, args, kernel)`.
+    """
+    σ, args = get_local_kernel_arguments(vstate, Ô)
+    kernel = get_local_kernel(vstate, Ô, *chunk_size)
+
+    cached_kernel = get_local_kernel_cached(vstate, Ô, kernel)
+    if cached_kernel is None:
+        return σ, args, kernel
+
+    logpsi_σ = vstate._get_samples_log_value().reshape(-1)
+    return σ, (logpsi_σ, args), cached_kernel
+
+
 @jax.jit
 def force_to_grad(Ō_grad, parameters):
     """
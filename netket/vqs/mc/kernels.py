@@ -19,6 +19,8 @@ This module implements some common kernels used by MCState and MCMixedState.
 from collections.abc import Callable
 from functools import partial
 
+import numpy as np
+
 import jax
 import jax.numpy as jnp
 
@@ -60,32 +62,100 @@ def local_value_kernel(logpsi: Callable, pars: PyTree, σ: Array, args: PyTree):
     return jnp.sum(mel * jnp.exp(logpsi(pars, σp) - logpsi(pars, σ)))
 
 
+def local_value_kernel_cached(logpsi: Callable, pars: PyTree, σ: Array, args: PyTree):
+    """
+    local_value kernel for MCState and generic operators, reusing the cached
+    log-amplitudes of the samples (see :func:`cached_log_value`).
+    """
+    logpsi_σ, (σp, mels) = args
+
+    if jnp.ndim(σp) != 3:
+        σp = σp.reshape((σ.shape[0], -1, σ.shape[-1]))
+        mels = mels.reshape(σp.shape[:-1])
+
+    logpsi_σ = cached_log_value(logpsi, pars, σ, logpsi_σ)
+    logpsi_σp = logpsi(pars, σp.reshape(-1, σ.shape[-1])).reshape(σp.shape[:-1])
+    return jnp.sum(mels * jnp.exp(logpsi_σp - jnp.expand_dims(logpsi_σ, -1)), axis=-1)
+
+
 def local_value_kernel_jax(
-    logpsi: Callable, pars: PyTree, σ: Array, O: DiscreteJaxOperator
+    logpsi: Callable,
+    pars: PyTree,
+    σ: Array,
+    O: DiscreteJaxOperator,
+    *,
+    unique_fraction: float | None = None,
 ):
     """
     local_value kernel for MCState for jax-compatible operators
+
+    If `unique_fraction` is specified, the model is only evaluated on the distinct
+    connected configurations (see :func:`local_value_unique`).
     """
     σp, mel = O.get_conn_padded(σ)
+    if unique_fraction is not None:
+        return local_value_unique(
+            logpsi, pars, σ, σp, mel, unique_fraction=unique_fraction
+        )
+
     logpsi_σ = logpsi(pars, σ)
     logpsi_σp = logpsi(pars, σp.reshape(-1, σp.shape[-1])).reshape(σp.shape[:-1])
     return jnp.sum(mel * jnp.exp(logpsi_σp - jnp.expand_dims(logpsi_σ, -1)), axis=-1)
 
 
+def local_value_kernel_jax_cached(
+    logpsi: Callable, pars: PyTree, σ: Array, args: PyTree
+):
+    """
+    local_value kernel for MCState for jax-compatible operators, reusing the
+    cached log-amplitudes of the samples (see :func:`cached_log_value`).
+    """
+    logpsi_σ, O = args
+    σp, mel = O.get_conn_padded(σ)
+
+    logpsi_σ = cached_log_value(logpsi, pars, σ, logpsi_σ)
+    logpsi_σp = logpsi(pars, σp.reshape(-1, σp.shape[-1])).reshape(σp.shape[:-1])
+    return jnp.sum(mel * jnp.exp(logpsi_σp - jnp.expand_dims(logpsi_σ, -1)), axis=-1)
+
+
 def local_value_kernel_jax_conn_chunked(
     logpsi: Callable,
     pars: PyTree,
     σ: Array,
     O: DiscreteJaxOperator,
     chunk_size: int,
+    *,
+    unique_fraction: float | None = None,
 ):
     """
     local_value kernel for MCState for jax-compatible operators
+
+    If `unique_fraction` is specified, the distinct connected configurations are
+    computed separately for every sample, so that they are never sorted over the
+    whole batch (see :func:`local_value_unique`).
     """
-    apply_conn = lambda s: logpsi(pars, s)
-    apply_conn = nkjax.apply_chunked(apply_conn, in_axes=0, chunk_size=chunk_size)
+    if unique_fraction is not None:
+
+        def _logpsi(w, s):
+            return nkjax.apply_chunked(
+                partial(logpsi, w),
+                in_axes=0,
+                chunk_size=chunk_size,
+                axis_0_is_sharded=False,
+            )(s)
+
+        def _local_value(s):
+            σp, mel = O.get_conn_padded(s)
+            return local_value_unique(
+                _logpsi, pars, s, σp, mel, unique_fraction=unique_fraction
+            )
+
+        # chunk_size < max_conn_size, so the samples are processed one at a time
+        return nkjax.apply_chunked(_local_value, in_axes=0, chunk_size=1)(σ)
 
     σp, mel = O.get_conn_padded(σ)
+    apply_conn = lambda s: logpsi(pars, s)
+    apply_conn = nkjax.apply_chunked(apply_conn, in_axes=0, chunk_size=chunk_size)
 
     logpsi_σ = apply_conn(σ)
     logpsi_σp = apply_conn(σp.reshape(-1, σ.shape[-1])).reshape(σp.shape[:-1])
@@ -93,6 +163,88 @@ def local_value_kernel_jax_conn_chunked(
     return jnp.sum(mel * jnp.exp(logpsi_σp - jnp.expand_dims(logpsi_σ, -1)), axis=-1)
 
 
+def local_value_unique(
+    logpsi: Callable,
+    pars: PyTree,
+    σ: Array,
+    σp: Array,
+    mels: Array,
+    *,
+    unique_fraction: float,
+    chunk_size: int | None = None,
+):
+    """
+    Computes the local values from the connected elements `σp, mels` of the
+    samples `σ`, evaluating the model only on the distinct configurations among
+    the samples and the connected configurations with a non-zero matrix element.
+
+    The number of model evaluations is bounded statically by `unique_fraction`
+    times the total number of configurations. If a batch contains more distinct
+    configurations than that, the model is evaluated on all of them instead.
+
+    Args:
+        logpsi: The log-amplitude function.
+        pars: The parameters of the model.
+        σ: The samples, with shape `(n_samples, N)`.
+        σp: The connected configurations, with shape `(n_samples, n_conn, N)`.
+        mels: The matrix elements, with shape `(n_samples, n_conn)`.
+        unique_fraction: The static upper bound on the fraction of distinct
+            configurations, in `(0, 1]`.
+        chunk_size: Optional chunk size used to evaluate the model.
+    """
+    σp_masked, unique, n_unique = unique_connected_configurations(σ, σp, mels)
+    max_unique = max(1, int(np.ceil(unique_fraction * unique.shape[0])))
+
+    if chunk_size is None:
+        apply_fun = logpsi
+    else:
+        apply_fun = lambda pars, s: nkjax.apply_chunked(
+            partial(logpsi, pars), in_axes=0, chunk_size=chunk_size
+        )(s)
+
+    def _logpsi_unique():
+        return logpsi_from_unique(
+            logpsi, pars, unique[:max_unique], σ, σp_masked, chunk_size=chunk_size
+        )
+
+    def _logpsi_all():
+        logpsi_σ = apply_fun(pars, σ)
+        logpsi_σp = apply_fun(pars, σp.reshape(-1, σ.shape[-1]))
+        return logpsi_σ, logpsi_σp.reshape(σp.shape[:-1])
+
+    logpsi_σ, logpsi_σp = jax.lax.cond(
+        n_unique <= max_unique, _logpsi_unique, _logpsi_all
+    )
+    return jnp.sum(mels * jnp.exp(logpsi_σp - jnp.expand_dims(logpsi_σ, -1)), axis=-1)
+
+
+@partial(jax.custom_vjp, nondiff_argnums=(0,))
+def cached_log_value(logpsi: Callable, pars: PyTree, σ: Array, logpsi_σ: Array):
+    """
+    Returns the log-amplitudes `logpsi_σ` of the samples `σ` which were already
+    computed (for example by the sampler), instead of evaluating the model again.
+
+    The derivatives with respect to the parameters are those of `logpsi(pars, σ)`,
+    so that kernels using the cached values can still be differentiated. The model
+    is only evaluated in the backward pass.
+    """
+    return logpsi_σ
+
+
+def _cached_log_value_fwd(logpsi, pars, σ, logpsi_σ):
+    return logpsi_σ, (pars, σ, logpsi_σ)
+
+
+def _cached_log_value_bwd(logpsi, res, g):
+    pars, σ, logpsi_σ = res
+    _, vjp_fun = jax.vjp(lambda w: logpsi(w, σ), pars)
+    (pars_bar,) = vjp_fun(g)
+    return pars_bar, None, jnp.zeros_like(logpsi_σ)
+
+
+cached_log_value.defvjp(_cached_log_value_fwd, _cached_log_value_bwd)
+
+
 def local_value_squared_kernel(logpsi: Callable, pars: PyTree, σ: Array, args: PyTree):
     """
     local_value kernel for MCState and Squared (generic) operators
@@ -100,6 +252,15 @@ def local_value_squared_kernel(logpsi: Callable, pars: PyTree, σ: Array, args:
     return jnp.abs(local_value_kernel(logpsi, pars, σ, args)) ** 2
 
 
+def local_value_squared_kernel_jax(
+    logpsi: Callable, pars: PyTree, σ: Array, O: DiscreteJaxOperator
+):
+    """
+    local_value kernel for MCState and Squared jax-compatible operators
+    """
+    return jnp.abs(local_value_kernel_jax(logpsi, pars, σ, O)) ** 2
+
+
 @batch_discrete_kernel
 def local_value_op_op_cost(logpsi: Callable, pars: PyTree, σ: Array, args: PyTree):
     """
@@ -112,6 +273,74 @@ def local_value_op_op_cost(logpsi: Callable, pars: PyTree, σ: Array, args: PyTr
     return jnp.sum(mel * jnp.exp(logpsi(pars, σ_σp) - logpsi(pars, σ_σ)))
 
 
+## Helpers to evaluate the model only once on every distinct configuration.
+
+
+def unique_connected_configurations(σ: Array, σp: Array, mels: Array):
+    """
+    Computes the distinct configurations among the samples σ and the connected
+    configurations σp with a non-zero matrix element.
+
+    The connected configurations with a zero matrix element (for example padding)
+    are replaced by the sample they originate from, so that they never need to be
+    evaluated.
+
+    Args:
+        σ: The samples, with shape `(n_samples, N)`.
+        σp: The connected configurations, with shape `(n_samples, n_conn, N)`.
+        mels: The matrix elements, with shape `(n_samples, n_conn)`.
+
+    Returns:
+        A tuple `(σp, unique, n_unique)` containing the masked connected
+        configurations, the lexicographically sorted distinct configurations
+        (padded at the end by repeating the last one) and their number.
+    """
+    σp = jnp.where((mels != 0)[..., None], σp.astype(σ.dtype), σ[..., None, :])
+
+    configs = jnp.concatenate([σ, σp.reshape(-1, σ.shape[-1])], axis=0)
+    configs = nkjax.sort(configs)
+    is_first = jnp.concatenate(
+        [jnp.ones((1,), dtype=bool), jnp.any(configs[1:] != configs[:-1], axis=-1)]
+    )
+    n_unique = jnp.sum(is_first)
+    (idx,) = jnp.nonzero(is_first, size=configs.shape[0], fill_value=-1)
+    return σp, configs[idx], n_unique
+
+
+def logpsi_from_unique(
+    logpsi: Callable,
+    pars: PyTree,
+    unique: Array,
+    *σs: Array,
+    chunk_size: int | None = None,
+) -> tuple[Array, ...]:
+    """
+    Evaluates the model once on the (sorted) distinct configurations `unique`, and
+    gathers the resulting log-amplitudes for every row of the arrays `σs`, whose
+    rows must all be contained in `unique`.
+    """
+    if chunk_size is None:
+        logpsi_unique = logpsi(pars, unique)
+    else:
+        logpsi_unique = nkjax.apply_chunked(
+            partial(logpsi, pars), in_axes=0, chunk_size=chunk_size
+        )(unique)
+
+    def _gather(σ):
+        idx = nkjax.searchsorted(unique, σ.reshape(-1, σ.shape[-1]))
+        return logpsi_unique[idx].reshape(σ.shape[:-1])
+
+    return tuple(_gather(σ) for σ in σs)
+
+
+def unique_size_bound(n_unique: int, n_total: int) -> int:
+    """
+    Rounds the number of distinct configurations to the next power of two (capped
+    to the total number of configurations), to limit recompilations.
+    """
+    return min(n_total, 1 << max(int(n_unique) - 1, 0).bit_length())
+
+
 ## Chunked versions of those kernels are defined below.
 
 
@@ -143,6 +372,35 @@ def local_value_kernel_chunked(
     return jnp.sum(mels * jnp.exp(logpsi_σp - logpsi_σ), axis=-1)
 
 
+def local_value_kernel_cached_chunked(
+    logpsi: Callable,
+    pars: PyTree,
+    σ: Array,
+    args: PyTree,
+    *,
+    chunk_size: int | None = None,
+):
+    """
+    local_value kernel for MCState and generic operators, reusing the cached
+    log-amplitudes of the samples (see :func:`cached_log_value`).
+    """
+    logpsi_σ, (σp, mels) = args
+
+    if jnp.ndim(σp) != 3:
+        σp = σp.reshape((σ.shape[0], -1, σ.shape[-1]))
+        mels = mels.reshape(σp.shape[:-1])
+
+    logpsi_chunked = nkjax.vmap_chunked(
+        partial(logpsi, pars), in_axes=0, chunk_size=chunk_size
+    )
+    N = σ.shape[-1]
+
+    logpsi_σ = cached_log_value(logpsi, pars, σ, logpsi_σ)
+    logpsi_σp = logpsi_chunked(σp.reshape((-1, N))).reshape(σp.shape[:-1])
+
+    return jnp.sum(mels * jnp.exp(logpsi_σp - jnp.expand_dims(logpsi_σ, -1)), axis=-1)
+
+
 def local_value_squared_kernel_chunked(
     logpsi: Callable,
     pars: PyTree,
@@ -162,6 +420,25 @@ def local_value_squared_kernel_chunked(
     )
 
 
+def local_value_squared_kernel_jax_chunked(
+    logpsi: Callable,
+    pars: PyTree,
+    σ: Array,
+    O: DiscreteJaxOperator,
+    *,
+    chunk_size: int | None = None,
+):
+    """
+    local_value kernel for MCState and Squared jax-compatible operators
+    """
+    return (
+        jnp.abs(
+            local_value_kernel_jax_chunked(logpsi, pars, σ, O, chunk_size=chunk_size)
+        )
+        ** 2
+    )
+
+
 def local_value_op_op_cost_chunked(
     logpsi: Callable,
     pars: PyTree,
@@ -200,12 +477,15 @@ def local_value_kernel_jax_chunked(
     O: DiscreteJaxOperator,
     *,
     chunk_size: int | None = None,
+    unique_fraction: float | None = None,
 ):
     """
     local_value kernel for MCState and jaxcoompatible operators
     """
     if chunk_size >= O.max_conn_size:
-        local_value_kernel = lambda s: local_value_kernel_jax(logpsi, pars, s, O)
+        local_value_kernel = lambda s: local_value_kernel_jax(
+            logpsi, pars, s, O, unique_fraction=unique_fraction
+        )
         local_value_chunked = nkjax.apply_chunked(
             local_value_kernel,
             in_axes=0,
@@ -213,7 +493,40 @@ def local_value_kernel_jax_chunked(
         )
     else:
         local_value_chunked = lambda s: local_value_kernel_jax_conn_chunked(
-            logpsi, pars, s, O, chunk_size
+            logpsi, pars, s, O, chunk_size, unique_fraction=unique_fraction
         )
 
     return local_value_chunked(σ)
+
+
+def local_value_kernel_jax_cached_chunked(
+    logpsi: Callable,
+    pars: PyTree,
+    σ: Array,
+    args: PyTree,
+    *,
+    chunk_size: int | None = None,
+):
+    """
+    local_value kernel for MCState and jax-compatible operators, reusing the
+    cached log-amplitudes of the samples (see :func:`cached_log_value`).
+    """
+    logpsi_σ, O = args
+
+    if chunk_size >= O.max_conn_size:
+        local_value_chunked = nkjax.apply_chunked(
+            lambda s, l: local_value_kernel_jax_cached(logpsi, pars, s, (l, O)),
+            in_axes=(0, 0),
+            chunk_size=max(1, chunk_size // O.max_conn_size),
+        )
+        return local_value_chunked(σ, logpsi_σ)
+
+    σp, mel = O.get_conn_padded(σ)
+    apply_conn = nkjax.apply_chunked(
+        lambda s: logpsi(pars, s), in_axes=0, chunk_size=chunk_size
+    )
+
+    logpsi_σ = cached_log_value(logpsi, pars, σ, logpsi_σ)
+    logpsi_σp = apply_conn(σp.reshape(-1, σ.shape[-1])).reshape(σp.shape[:-1])
+
+    return jnp.sum(mel * jnp.exp(logpsi_σp - jnp.expand_dims(logpsi_σ, -1)), axis=-1)
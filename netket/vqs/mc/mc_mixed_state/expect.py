@@ -19,6 +19,7 @@ from netket.operator import (
     AbstractSuperOperator,
     Squared,
     DiscreteJaxOperator,
+    LocalLiouvillianJax,
 )
 
 from netket.vqs.mc import (
@@ -92,3 +93,31 @@ def get_local_kernel(  # noqa: F811
     vstate: MCMixedState, Ô: Squared[AbstractSuperOperator]
 ):
     return kernels.local_value_squared_kernel
+
+
+@dispatch
+def get_local_kernel_arguments(  # noqa: F811
+    vstate: MCMixedState, Ô: LocalLiouvillianJax
+):
+    check_hilbert(vstate.hilbert, Ô.hilbert)
+    return vstate.samples, Ô
+
+
+@dispatch
+def get_local_kernel(vstate: MCMixedState, Ô: LocalLiouvillianJax):  # noqa: F811
+    return kernels.local_value_kernel_jax
+
+
+@dispatch
+def get_local_kernel_arguments(  # noqa: F811
+    vstate: MCMixedState, Ô: Squared[LocalLiouvillianJax]
+):
+    check_hilbert(vstate.hilbert, Ô.hilbert)
+    return vstate.samples, Ô.parent
+
+
+@dispatch
+def get_local_kernel(  # noqa: F811
+    vstate: MCMixedState, Ô: Squared[LocalLiouvillianJax]
+):
+    return kernels.local_value_squared_kernel_jax
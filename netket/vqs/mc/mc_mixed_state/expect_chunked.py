@@ -19,6 +19,7 @@ from netket.operator import (
     DiscreteOperator,
     DiscreteJaxOperator,
     Squared,
+    LocalLiouvillianJax,
 )
 
 from netket.vqs.mc import kernels, get_local_kernel
@@ -53,3 +54,17 @@ def get_local_kernel(  # noqa: F811
     vstate: MCMixedState, Ô: DiscreteJaxOperator, chunk_size: int
 ):
     return kernels.local_value_op_op_cost_chunked
+
+
+@dispatch
+def get_local_kernel(  # noqa: F811
+    vstate: MCMixedState, Ô: LocalLiouvillianJax, chunk_size: int
+):
+    return kernels.local_value_kernel_jax_chunked
+
+
+@dispatch
+def get_local_kernel(  # noqa: F811
+    vstate: MCMixedState, Ô: Squared[LocalLiouvillianJax], chunk_size: int
+):
+    return kernels.local_value_squared_kernel_jax_chunked
@@ -26,6 +26,9 @@ from netket.stats import Stats
 from netket.utils.types import PyTree
 from netket.operator import AbstractOperator
 
+# to move up once stabilized
+from netket.operator._abstract_observable import AbstractObservable
+
 from netket.vqs import VariationalMixedState
 
 from netket.vqs.mc import MCState
@@ -204,6 +207,15 @@ class MCMixedState(VariationalMixedState, MCState):
         if self.diagonal is not None:
             self.diagonal.reset()
 
+    def expect_multiple(self, operators: PyTree) -> PyTree:
+        # The connected configurations are not shared with the pure-state
+        # kernels, so we simply estimate every operator independently.
+        return jax.tree_util.tree_map(
+            self.expect,
+            operators,
+            is_leaf=lambda x: isinstance(x, AbstractObservable),
+        )
+
     def expect_and_grad_operator(
         self, Ô: AbstractOperator, is_hermitian=None
     ) -> tuple[Stats, PyTree]:
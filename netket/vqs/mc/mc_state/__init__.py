@@ -21,3 +21,5 @@ from . import expect_forces
 from . import expect_chunked
 from . import expect_grad_chunked
 from . import expect_forces_chunked
+
+from . import expect_multiple
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from collections.abc import Callable
+from typing import Any
 from functools import partial
 
 import jax
@@ -37,6 +38,7 @@ from netket.vqs.mc import (
     get_local_kernel_arguments,
     get_local_kernel,
 )
+from netket.vqs.mc.common import get_local_kernel_cached, get_local_kernel_and_arguments
 
 from .state import MCState
 
@@ -60,7 +62,7 @@ def get_local_kernel_arguments(vstate: MCState, Ô: DiscreteOperator):  # noqa:
     check_hilbert(vstate.hilbert, Ô.hilbert)
 
     σ = vstate.samples
-    σp, mels = Ô.get_conn_padded(σ)
+    σp, mels = vstate._get_conn_padded(Ô)
     return σ, (σp, mels)
 
 
@@ -79,6 +81,11 @@ def get_local_kernel_arguments(vstate: MCState, Ô: DiscreteJaxOperator):  # no
 
 @dispatch
 def get_local_kernel(vstate: MCState, Ô: DiscreteJaxOperator):  # noqa: F811
+    if vstate.unique_connected_fraction is not None:
+        return HashablePartial(
+            kernels.local_value_kernel_jax,
+            unique_fraction=vstate.unique_connected_fraction,
+        )
     return kernels.local_value_kernel_jax
 
 
@@ -96,6 +103,24 @@ def get_local_kernel(vstate: MCState, Ô: ContinuousOperator):  # noqa: F811
     )
 
 
+# The local kernels of discrete operators have variants reusing the log-amplitudes
+# of the samples cached in the state. They are only substituted for the default
+# kernels, so that custom dispatch rules are not affected.
+_CACHED_LOCAL_KERNELS = {
+    kernels.local_value_kernel: kernels.local_value_kernel_cached,
+    kernels.local_value_kernel_jax: kernels.local_value_kernel_jax_cached,
+    kernels.local_value_kernel_chunked: kernels.local_value_kernel_cached_chunked,
+    kernels.local_value_kernel_jax_chunked: kernels.local_value_kernel_jax_cached_chunked,
+}
+
+
+@dispatch
+def get_local_kernel_cached(  # noqa: F811
+    vstate: MCState, Ô: DiscreteOperator, kernel: Any
+):
+    return _CACHED_LOCAL_KERNELS.get(kernel)
+
+
 ## sum operators
 
 
@@ -129,8 +154,7 @@ def get_local_kernel_sum(vs: MCState, O: SumGenericOperator):
 def expect(
     vstate: MCState, Ô: AbstractOperator, chunk_size: None
 ) -> Stats:  # noqa: F811
-    σ, args = get_local_kernel_arguments(vstate, Ô)
-    local_estimator_fun = get_local_kernel(vstate, Ô)
+    σ, args, local_estimator_fun = get_local_kernel_and_arguments(vstate, Ô)
 
     return _expect(
         local_estimator_fun,
@@ -40,8 +40,8 @@ from netket.vqs import expect
 from netket.vqs.mc import (
     kernels,
     get_local_kernel,
-    get_local_kernel_arguments,
 )
+from netket.vqs.mc.common import get_local_kernel_and_arguments
 
 from .state import MCState
 
@@ -56,6 +56,11 @@ def get_local_kernel(vstate: MCState, Ô: Squared, chunk_size: int):  # noqa: F
 def get_local_kernel(  # noqa: F811
     vstate: MCState, Ô: DiscreteJaxOperator, chunk_size: int
 ):  # noqa: F811
+    if vstate.unique_connected_fraction is not None:
+        return nkjax.HashablePartial(
+            kernels.local_value_kernel_jax_chunked,
+            unique_fraction=vstate.unique_connected_fraction,
+        )
     return kernels.local_value_kernel_jax_chunked
 
 
@@ -103,9 +108,7 @@ def expect_fallback(
 def expect_mcstate_operator_chunked(
     vstate: MCState, Ô: AbstractOperator, chunk_size: int
 ) -> Stats:  # noqa: F811
-    σ, args = get_local_kernel_arguments(vstate, Ô)
-
-    local_estimator_fun = get_local_kernel(vstate, Ô, chunk_size)
+    σ, args, local_estimator_fun = get_local_kernel_and_arguments(vstate, Ô, chunk_size)
 
     return _expect_chunking(
         chunk_size,
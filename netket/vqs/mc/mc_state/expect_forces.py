@@ -28,10 +28,7 @@ from netket.operator import (
     AbstractOperator,
 )
 
-from netket.vqs.mc import (
-    get_local_kernel_arguments,
-    get_local_kernel,
-)
+from netket.vqs.mc.common import get_local_kernel_and_arguments
 
 from .state import MCState
 
@@ -44,9 +41,7 @@ def expect_and_forces(  # noqa: F811
     *,
     mutable: CollectionFilter = False,
 ) -> tuple[Stats, PyTree]:
-    σ, args = get_local_kernel_arguments(vstate, Ô)
-
-    local_estimator_fun = get_local_kernel(vstate, Ô)
+    σ, args, local_estimator_fun = get_local_kernel_and_arguments(vstate, Ô)
 
     Ō, Ō_grad, new_model_state = forces_expect_hermitian(
         local_estimator_fun,
@@ -28,10 +28,7 @@ from netket.stats import Stats, statistics
 from netket.utils.types import PyTree
 
 from netket.vqs import expect_and_forces
-from netket.vqs.mc import (
-    get_local_kernel,
-    get_local_kernel_arguments,
-)
+from netket.vqs.mc.common import get_local_kernel_and_arguments
 
 from .state import MCState
 
@@ -73,9 +70,7 @@ def expect_and_forces_impl(  # noqa: F811
     *,
     mutable: CollectionFilter = False,
 ) -> tuple[Stats, PyTree]:
-    σ, args = get_local_kernel_arguments(vstate, Ô)
-
-    local_estimator_fun = get_local_kernel(vstate, Ô, chunk_size)
+    σ, args, local_estimator_fun = get_local_kernel_and_arguments(vstate, Ô, chunk_size)
 
     Ō, Ō_grad, new_model_state = forces_expect_hermitian_chunked(
         chunk_size,
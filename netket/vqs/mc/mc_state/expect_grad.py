@@ -32,7 +32,7 @@ from netket.operator import (
 
 from netket.vqs import expect_and_grad, expect_and_forces
 
-from ..common import force_to_grad, get_local_kernel_arguments, get_local_kernel
+from ..common import force_to_grad, get_local_kernel_and_arguments
 
 from .state import MCState
 
@@ -102,9 +102,7 @@ def expect_and_grad_nonhermitian(
             """
         )
 
-    σ, args = get_local_kernel_arguments(vstate, Ô)
-
-    local_estimator_fun = get_local_kernel(vstate, Ô)
+    σ, args, local_estimator_fun = get_local_kernel_and_arguments(vstate, Ô)
 
     Ō, Ō_grad, new_model_state = _grad_expect_nonherm_kernel(
         local_estimator_fun,
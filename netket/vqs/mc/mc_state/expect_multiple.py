@@ -0,0 +1,203 @@
+# Copyright 2026 The NetKet Authors - All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Callable
+from functools import partial
+
+import jax
+from jax import numpy as jnp
+
+from netket import jax as nkjax
+from netket.stats import statistics
+from netket.utils.types import PyTree
+from netket.operator import DiscreteOperator, DiscreteJaxOperator
+
+# to move up once stabilized
+from netket.operator._abstract_observable import AbstractObservable
+
+from netket.vqs.mc import kernels, check_hilbert
+
+from .state import MCState
+
+
+def expect_multiple(vstate: MCState, operators: PyTree, chunk_size: int | None):
+    """
+    Estimates the expectation values of a pytree of operators, evaluating the
+    model only once on the union of the distinct connected configurations of
+    all discrete operators, computed over chunks of samples if `chunk_size` is
+    not None.
+
+    Operators which are not :class:`~netket.operator.DiscreteOperator` are
+    estimated independently with :meth:`~netket.vqs.MCState.expect`.
+    """
+    ops, treedef = jax.tree_util.tree_flatten(
+        operators, is_leaf=lambda x: isinstance(x, AbstractObservable)
+    )
+
+    results = [None for _ in ops]
+    fused_ids = []
+    for i, O in enumerate(ops):
+        if isinstance(O, DiscreteOperator):
+            check_hilbert(vstate.hilbert, O.hilbert)
+            fused_ids.append(i)
+        else:
+            results[i] = vstate.expect(O)
+
+    if len(fused_ids) > 0:
+        σ = vstate.samples
+        n_chains = σ.shape[0]
+        σ = σ.reshape(-1, σ.shape[-1])
+
+        # Numba operators must compute the connected elements on the host (or
+        # reuse those prefetched while sampling), while jax operators are passed
+        # to the jitted function directly.
+        jax_ops = tuple(
+            ops[i] for i in fused_ids if isinstance(ops[i], DiscreteJaxOperator)
+        )
+        numba_conns = tuple(
+            vstate._get_conn_padded(ops[i])
+            for i in fused_ids
+            if not isinstance(ops[i], DiscreteJaxOperator)
+        )
+        is_jax = tuple(isinstance(ops[i], DiscreteJaxOperator) for i in fused_ids)
+
+        _, mels_shapes = jax.eval_shape(
+            partial(_connected_elements, is_jax), σ, jax_ops, numba_conns
+        )
+        n_conns = tuple(m.shape[-1] for m in mels_shapes)
+
+        # The connected configurations are built and deduplicated over chunks of
+        # samples, so that about `chunk_size` configurations are handled at once.
+        n_configs = 1 + sum(n_conns)
+        if chunk_size is None:
+            samples_chunk_size = None
+        else:
+            samples_chunk_size = max(1, chunk_size // n_configs)
+
+        n_unique = _max_unique_connected_configurations(
+            is_jax, samples_chunk_size, σ, jax_ops, numba_conns
+        )
+        max_unique = kernels.unique_size_bound(n_unique, σ.shape[0] * n_configs)
+
+        O_locs = _local_estimators(
+            vstate._apply_fun,
+            is_jax,
+            n_conns,
+            max_unique,
+            samples_chunk_size,
+            chunk_size,
+            vstate.parameters,
+            vstate.model_state,
+            σ,
+            jax_ops,
+            numba_conns,
+        )
+        for i, O_loc in zip(fused_ids, O_locs):
+            results[i] = statistics(O_loc.reshape((n_chains, -1)))
+
+    return jax.tree_util.tree_unflatten(treedef, results)
+
+
+def _connected_elements(is_jax, σ, jax_ops, numba_conns):
+    jax_ops = iter(jax_ops)
+    numba_conns = iter(numba_conns)
+
+    σps, mels = [], []
+    for op_is_jax in is_jax:
+        if op_is_jax:
+            σp_i, mels_i = next(jax_ops).get_conn_padded(σ)
+        else:
+            σp_i, mels_i = next(numba_conns)
+            σp_i = σp_i.reshape(σ.shape[0], -1, σ.shape[-1])
+            mels_i = mels_i.reshape(σp_i.shape[:-1])
+        σps.append(σp_i.astype(σ.dtype))
+        mels.append(mels_i)
+    return σps, mels
+
+
+def _numba_axis(numba_conns):
+    # an empty tree cannot be split in chunks
+    return 0 if len(numba_conns) > 0 else None
+
+
+def _unique_connected_configurations(is_jax, σ, jax_ops, numba_conns):
+    σps, mels = _connected_elements(is_jax, σ, jax_ops, numba_conns)
+    σp = jnp.concatenate(σps, axis=1)
+    mels = jnp.concatenate(mels, axis=1)
+
+    σp, unique, n_unique = kernels.unique_connected_configurations(σ, σp, mels)
+    return σp, mels, unique, n_unique
+
+
+@partial(jax.jit, static_argnums=(0, 1))
+def _max_unique_connected_configurations(
+    is_jax, samples_chunk_size, σ, jax_ops, numba_conns
+):
+    """
+    The largest number of distinct configurations in a chunk of samples.
+    """
+
+    def _n_unique(σ, numba_conns):
+        _, _, _, n_unique = _unique_connected_configurations(
+            is_jax, σ, jax_ops, numba_conns
+        )
+        return jnp.full(σ.shape[0], n_unique)
+
+    n_unique = nkjax.apply_chunked(
+        _n_unique, in_axes=(0, _numba_axis(numba_conns)), chunk_size=samples_chunk_size
+    )(σ, numba_conns)
+    return jnp.max(n_unique)
+
+
+@partial(jax.jit, static_argnums=(0, 1, 2, 3, 4, 5))
+def _local_estimators(
+    model_apply_fun: Callable,
+    is_jax: tuple[bool, ...],
+    n_conns: tuple[int, ...],
+    max_unique: int,
+    samples_chunk_size: int | None,
+    chunk_size: int | None,
+    parameters: PyTree,
+    model_state: PyTree,
+    σ: jnp.ndarray,
+    jax_ops: tuple[DiscreteJaxOperator, ...],
+    numba_conns: tuple[tuple[jnp.ndarray, jnp.ndarray], ...],
+):
+    def logpsi(w, σ):
+        return nkjax.apply_chunked(
+            lambda σ: model_apply_fun({"params": w, **model_state}, σ),
+            chunk_size=chunk_size,
+            axis_0_is_sharded=False,
+        )(σ)
+
+    def _O_locs(σ, numba_conns):
+        σp, mels, unique, _ = _unique_connected_configurations(
+            is_jax, σ, jax_ops, numba_conns
+        )
+        logpsi_σ, logpsi_σp = kernels.logpsi_from_unique(
+            logpsi, parameters, unique[:max_unique], σ, σp
+        )
+        O_locs = mels * jnp.exp(logpsi_σp - jnp.expand_dims(logpsi_σ, -1))
+
+        O_loc = []
+        start = 0
+        for n_conn in n_conns:
+            O_loc.append(jnp.sum(O_locs[:, start : start + n_conn], axis=-1))
+            start += n_conn
+        return jnp.stack(O_loc, axis=-1)
+
+    O_locs = nkjax.apply_chunked(
+        _O_locs, in_axes=(0, _numba_axis(numba_conns)), chunk_size=samples_chunk_size
+    )(σ, numba_conns)
+    return tuple(O_locs[:, i] for i in range(len(n_conns)))
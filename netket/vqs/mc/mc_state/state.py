@@ -13,8 +13,9 @@
 # limitations under the License.
 
 import warnings
-from functools import partial
-from collections.abc import Callable
+from functools import partial, cache
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import numpy as np
 
@@ -29,8 +30,13 @@ from netket import nn as nknn
 from netket import config
 from netket.hilbert import DiscreteHilbert
 from netket.stats import Stats
-from netket.operator import AbstractOperator, Squared
-from netket.sampler import Sampler, SamplerState
+from netket.operator import (
+    AbstractOperator,
+    Squared,
+    DiscreteOperator,
+    DiscreteJaxOperator,
+)
+from netket.sampler import Sampler, SamplerState, MetropolisSampler
 from netket.utils import (
     model_frameworks,
     wrap_afun,
@@ -130,6 +136,14 @@ class MCState(VariationalState):
     """Number of samples discarded at the beginning of every Markov chain."""
     _chunk_size: int | None = None
     """The chunk size used in the evaluation of the model."""
+    _unique_connected_fraction: float | None = None
+    """The upper bound on the fraction of distinct connected configurations used
+    to evaluate local estimators of jax operators, or None to disable it."""
+    _prefetch_operators: tuple[DiscreteOperator, ...] = ()
+    """Numba operators whose connected elements are computed on host threads
+    while sampling."""
+    _prefetch_n_chunks: int = 4
+    """Number of segments in which the chains are sampled when prefetching."""
 
     #####################
     #   Model related   #
@@ -160,6 +174,11 @@ class MCState(VariationalState):
     #############
     _samples: jax.Array | None = None
     """Cached samples obtained with the last sampling."""
+    _samples_log_value: jax.Array | None = None
+    """Cached log-amplitudes of the samples obtained with the last sampling."""
+    _prefetched_conn: tuple[tuple[DiscreteOperator, Future], ...] = ()
+    """Connected elements of the cached samples for the operators in
+    `_prefetch_operators`, being computed on host threads."""
 
     def __init__(
         self,
@@ -170,6 +189,7 @@ class MCState(VariationalState):
         n_samples_per_rank: int | None = None,
         n_discard_per_chain: int | None = None,
         chunk_size: int | None = None,
+        unique_connected_fraction: float | None = None,
         variables: PyTree | None = None,
         init_fun: NNInitFunc | None = None,
         apply_fun: Callable | None = None,
@@ -207,6 +227,10 @@ class MCState(VariationalState):
             chunk_size: (Defaults to `None`) If specified, calculations are split into chunks where the neural network
                 is evaluated at most on :code:`chunk_size` samples at once. This does not change the mathematical results,
                 but will trade a higher computational cost for lower memory cost.
+            unique_connected_fraction: (Defaults to `None`) If specified, local estimators of
+                :class:`~netket.operator.DiscreteJaxOperator` evaluate the model only once on every
+                distinct connected configuration. See
+                :attr:`~netket.vqs.MCState.unique_connected_fraction`.
         """
         super().__init__(sampler.hilbert)
 
@@ -303,6 +327,7 @@ class MCState(VariationalState):
         self.n_discard_per_chain = n_discard_per_chain  # type: ignore[assignment]
 
         self.chunk_size = chunk_size
+        self.unique_connected_fraction = unique_connected_fraction
 
     def init(self, seed=None, dtype=None):
         """
@@ -509,12 +534,119 @@ class MCState(VariationalState):
 
         self._chunk_size = chunk_size
 
+    @property
+    def unique_connected_fraction(self) -> float | None:
+        """
+        Upper bound on the fraction of distinct configurations among the samples
+        and their connected configurations, used when computing the local
+        estimators of :class:`~netket.operator.DiscreteJaxOperator`.
+
+        If set, the configurations with a non-zero matrix element are deduplicated
+        with a sort and the model is evaluated only on the distinct ones, before
+        gathering the log-amplitudes back. This is advantageous for operators whose
+        connected configurations overlap significantly across samples, such as
+        diagonal-heavy Hamiltonians or peaked distributions, when evaluating the
+        model dominates the cost of sorting.
+
+        The number of model evaluations is fixed at compile time to this fraction
+        of the total number of configurations. If a batch of samples contains more
+        distinct configurations than that, all configurations are evaluated, so
+        the result never depends on this setting.
+
+        Set to `None` (the default) to disable deduplication.
+        """
+        return self._unique_connected_fraction
+
+    @unique_connected_fraction.setter
+    def unique_connected_fraction(self, fraction: float | None):
+        if fraction is None:
+            self._unique_connected_fraction = None
+            return
+
+        if not isinstance(fraction, (int, float)) or not 0 < fraction <= 1:
+            raise ValueError(
+                "The fraction of unique connected configurations must be a number "
+                f"in (0, 1] (got {fraction} instead)."
+            )
+
+        self._unique_connected_fraction = float(fraction)
+
+    @property
+    def prefetch_operators(self) -> tuple[DiscreteOperator, ...]:
+        """
+        Operators not implemented in Jax (such as
+        :class:`~netket.operator.LocalOperatorNumba`,
+        :class:`~netket.operator.PauliStringsNumba` or
+        :class:`~netket.operator.FermionOperator2ndNumba`) whose connected
+        elements are computed on the host while the samples are generated.
+
+        When this is set, :meth:`sample` generates the Markov chains in
+        :attr:`prefetch_n_chunks` consecutive segments. As Jax dispatches the
+        sampling asynchronously, the connected elements of every segment are
+        computed with Numba by a pool of host threads while the device samples
+        the next segment, and are then used by :meth:`expect`,
+        :meth:`expect_and_grad` and :meth:`local_estimators` on the same samples.
+        This hides most of the cost of computing the connected elements on the
+        host for operators that cannot be converted to a
+        :class:`~netket.operator.DiscreteJaxOperator`.
+
+        Other operators are not affected. Defaults to no operator.
+        """
+        return self._prefetch_operators
+
+    @prefetch_operators.setter
+    def prefetch_operators(
+        self, operators: DiscreteOperator | Iterable[DiscreteOperator] | None
+    ):
+        if operators is None:
+            operators = ()
+        elif isinstance(operators, AbstractOperator):
+            operators = (operators,)
+        operators = tuple(operators)
+
+        for op in operators:
+            if not isinstance(op, DiscreteOperator) or isinstance(
+                op, DiscreteJaxOperator
+            ):
+                raise TypeError(
+                    "Only discrete operators not implemented in Jax can be "
+                    f"prefetched, but got an operator of type {type(op)}. "
+                    "The connected elements of Jax operators are already "
+                    "computed on the device."
+                )
+
+        self._prefetch_operators = operators
+        self._prefetched_conn = ()
+
+    @property
+    def prefetch_n_chunks(self) -> int:
+        """
+        Number of consecutive segments in which the Markov chains are sampled when
+        :attr:`prefetch_operators` is set (default: 4).
+
+        The connected elements of the last segment cannot be overlapped with
+        sampling, so more segments hide more of the host cost, at the price of
+        launching more sampling calls.
+        """
+        return self._prefetch_n_chunks
+
+    @prefetch_n_chunks.setter
+    def prefetch_n_chunks(self, n_chunks: int):
+        if not isinstance(n_chunks, int) or n_chunks < 1:
+            raise ValueError(
+                "The number of prefetching chunks must be a positive integer "
+                f"(got {n_chunks} instead)."
+            )
+        self._prefetch_n_chunks = n_chunks
+
     def reset(self):
         """
         Resets the sampled states. This method is called automatically every time
         that the parameters/state is updated.
         """
         self._samples = None
+        self._samples_log_value = None
+        self._prefetched_conn = ()
 
     @timing.timed
     def sample(
@@ -568,14 +700,83 @@ class MCState(VariationalState):
                 # This won't actually block unless we are really timing
                 timer.block_until_ready(_)
 
-        self._samples, self.sampler_state = self.sampler.sample(
-            self._sampler_model,
-            self._sampler_variables,
-            state=self.sampler_state,
-            chain_length=chain_length,
-        )
+        if self.prefetch_operators:
+            self._sample_and_prefetch(chain_length)
+        else:
+            self._samples, self._samples_log_value = self._sample_chain(chain_length)
+            self._prefetched_conn = ()
         return self._samples
 
+    def _sample_chain(self, chain_length: int) -> tuple[jax.Array, jax.Array | None]:
+        """
+        Samples `chain_length` configurations along the chains starting from the
+        current sampler state, which is updated.
+
+        Returns the samples and, if the sampler keeps track of them, their
+        log-amplitudes (otherwise None).
+        """
+        if _sampler_tracks_log_amplitudes(self.sampler):
+            # Keep the log-amplitudes computed along the chains, to avoid
+            # evaluating the model on the samples again in the local estimators.
+            (samples, samples_log_value), self.sampler_state = self.sampler.sample(
+                self._sampler_model,
+                self._sampler_variables,
+                state=self.sampler_state,
+                chain_length=chain_length,
+                return_log_amplitudes=True,
+            )
+        else:
+            samples, self.sampler_state = self.sampler.sample(
+                self._sampler_model,
+                self._sampler_variables,
+                state=self.sampler_state,
+                chain_length=chain_length,
+            )
+            samples_log_value = None
+        return samples, samples_log_value
+
+    def _sample_and_prefetch(self, chain_length: int):
+        """
+        Samples the chains in segments, computing the connected elements of the
+        :attr:`prefetch_operators` for every segment on host threads while the
+        following segments are sampled.
+        """
+        n_chunks = min(self.prefetch_n_chunks, chain_length)
+        lengths = [len(x) for x in np.array_split(np.arange(chain_length), n_chunks)]
+        pool = _host_thread_pool()
+
+        samples, samples_log_value = [], []
+        chunk_futures = {id(op): [] for op in self.prefetch_operators}
+        for length in lengths:
+            σ, log_value = self._sample_chain(length)
+            samples.append(σ)
+            samples_log_value.append(log_value)
+            # Sampling is dispatched asynchronously, so the threads wait for the
+            # samples of this segment while the next one is dispatched.
+            for op in self.prefetch_operators:
+                chunk_futures[id(op)].append(pool.submit(_get_conn_padded_host, op, σ))
+
+        self._prefetched_conn = tuple(
+            (op, pool.submit(_concatenate_conn, chunk_futures[id(op)]))
+            for op in self.prefetch_operators
+        )
+        self._samples = jnp.concatenate(samples, axis=1)
+        if samples_log_value[0] is None:
+            self._samples_log_value = None
+        else:
+            self._samples_log_value = jnp.concatenate(samples_log_value, axis=1)
+
+    def _get_conn_padded(self, op: DiscreteOperator) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the connected elements of `op` for the cached samples, using those
+        computed while sampling if `op` is in :attr:`prefetch_operators`.
+        """
+        σ = self.samples
+        for prefetched_op, future in self._prefetched_conn:
+            if prefetched_op is op:
+                return future.result()
+        return op.get_conn_padded(σ)
+
     @property
     def samples(self) -> jax.Array:
         """
@@ -592,6 +793,21 @@ class MCState(VariationalState):
             self.sample()
         return self._samples  # type: ignore[return-value]
 
+    def _get_samples_log_value(self) -> jax.Array:
+        """
+        Returns the log-amplitudes of the cached samples, with shape
+        `samples.shape[:-1]`.
+
+        They are the ones computed by the sampler if it keeps track of them, and
+        are otherwise computed (only once) from the model.
+        """
+        samples = self.samples
+        if self._samples_log_value is None:
+            self._samples_log_value = _log_value_samples(
+                self._apply_fun, self.chunk_size, self.variables, samples
+            )
+        return self._samples_log_value
+
     def log_value(self, σ: jnp.ndarray) -> jnp.ndarray:
         r"""
         Evaluate the variational state for a batch of states and returns
@@ -655,6 +871,32 @@ class MCState(VariationalState):
         """
         return expect(self, O, self.chunk_size)
 
+    @timing.timed
+    def expect_multiple(self, operators: PyTree) -> PyTree:
+        r"""Estimates the quantum expectation values of several operators at once.
+
+        This is equivalent to calling :meth:`~MCState.expect` on every operator,
+        but the connected configurations of all discrete operators are
+        deduplicated and the model is evaluated only once on their union. This is
+        considerably cheaper when estimating many observables, such as
+        correlation functions, on the same samples.
+
+        If :attr:`~MCState.chunk_size` is set, the connected configurations are
+        built and deduplicated over chunks of samples, such that about
+        `chunk_size` configurations are handled at once, and only the
+        configurations within the same chunk are shared.
+
+        Args:
+            operators: A pytree (e.g. a list or a dictionary) of operators.
+
+        Returns:
+            A pytree with the same structure as `operators`, containing the
+            estimates of the corresponding expectation values as leaves.
+        """
+        from .expect_multiple import expect_multiple
+
+        return expect_multiple(self, operators, self.chunk_size)
+
     # override to use chunks
     @timing.timed
     def expect_and_grad(
@@ -790,6 +1032,66 @@ class MCState(VariationalState):
         )
 
 
+def _sampler_tracks_log_amplitudes(sampler: Sampler) -> bool:
+    # Only the standard Metropolis update keeps track of the log-amplitudes of
+    # the configurations along the chains.
+    # Samplers overriding `sample` are sampled through their own implementation.
+    return (
+        isinstance(sampler, MetropolisSampler)
+        and type(sampler).sample is MetropolisSampler.sample
+        and type(sampler)._sample_next is MetropolisSampler._sample_next
+        and type(sampler)._sample_chain is MetropolisSampler._sample_chain
+    )
+
+
+@cache
+def _host_thread_pool() -> ThreadPoolExecutor:
+    # The Numba kernels computing the connected elements release the GIL, so
+    # they run concurrently with the main thread.
+    return ThreadPoolExecutor(thread_name_prefix="netket_get_conn")
+
+
+def _get_conn_padded_host(op: DiscreteOperator, σ: jax.Array):
+    # blocks (without holding the GIL) until the samples are computed
+    σ = np.asarray(σ)
+    σp, mels = op.get_conn_padded(σ)
+    return σ, σp, mels
+
+
+def _concatenate_conn(futures: list[Future]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenates the connected elements of consecutive segments of the chains,
+    padding them to the same number of connected elements with zero matrix
+    elements.
+    """
+    chunks = [future.result() for future in futures]
+    n_conn = max(mels.shape[-1] for _, _, mels in chunks)
+
+    σp_all, mels_all = [], []
+    for σ, σp, mels in chunks:
+        n_pad = n_conn - mels.shape[-1]
+        if n_pad > 0:
+            σ_pad = np.broadcast_to(
+                σ[..., None, :], (*σ.shape[:-1], n_pad, σ.shape[-1])
+            )
+            σp = np.concatenate([σp, σ_pad.astype(σp.dtype)], axis=-2)
+            mels_pad = np.zeros((*mels.shape[:-1], n_pad), dtype=mels.dtype)
+            mels = np.concatenate([mels, mels_pad], axis=-1)
+        σp_all.append(σp)
+        mels_all.append(mels)
+
+    return np.concatenate(σp_all, axis=1), np.concatenate(mels_all, axis=1)
+
+
+@partial(jax.jit, static_argnames=("apply_fun", "chunk_size"))
+def _log_value_samples(apply_fun, chunk_size, variables, samples):
+    log_value = nkjax.apply_chunked(
+        partial(apply_fun, variables), in_axes=0, chunk_size=chunk_size
+    )
+    σ = samples.reshape(-1, samples.shape[-1])
+    return log_value(σ).reshape(samples.shape[:-1])
+
+
 @partial(jax.jit, static_argnames=("kernel", "apply_fun", "shape"))
 def _local_estimators_kernel(kernel, apply_fun, shape, variables, samples, extra_args):
     O_loc = kernel(apply_fun, variables, samples, extra_args)
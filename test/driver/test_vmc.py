@@ -174,6 +174,42 @@ def test_vmc_gradient(dtype):
     same_derivatives(grad_approx, grad_exact, abs_eps=err, rel_eps=1.0e-3)
 
 
+@pytest.mark.parametrize(
+    "dtype, mode",
+    [
+        (np.float64, "real"),
+        (np.complex128, "complex"),
+        (np.complex128, "holomorphic"),
+    ],
+)
+@pytest.mark.parametrize("diag_scale", [None, 0.01])
+def test_vmc_gradient_from_qgt(dtype, mode, diag_scale):
+    ha, sx, vs, sampler, driver = _setup_vmc(dtype=dtype, sr=False)
+    vs.n_samples = 1000
+
+    _, grad = vs.expect_and_grad(ha)
+    qgt = nk.optimizer.qgt.QGTJacobianDense(vs, mode=mode, diag_scale=diag_scale)
+    grad_qgt = qgt.gradient(vs.local_estimators(ha))
+
+    jax.tree_util.tree_map(
+        lambda x, y: np.testing.assert_allclose(x, y, rtol=1e-8, atol=1e-12),
+        grad_qgt,
+        grad,
+    )
+
+    # The driver must give the same update as the standard path
+    driver.preconditioner = nk.optimizer.SR(
+        qgt=nk.optimizer.qgt.QGTJacobianDense, mode=mode, diag_scale=diag_scale
+    )
+    dp = driver._forward_and_backward()
+    dp_ref = driver.preconditioner(vs, driver._loss_grad, driver.step_count)
+    jax.tree_util.tree_map(
+        lambda x, y: np.testing.assert_allclose(x, y, rtol=1e-6, atol=1e-10),
+        dp,
+        dp_ref,
+    )
+
+
 def test_no_preconditioner_api():
     ha, sx, ma, sampler, driver = _setup_vmc(sr=True)
 
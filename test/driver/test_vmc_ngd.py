@@ -437,3 +437,164 @@ def test_SRt_chunked(use_ntk, onthefly, model, momentum, proj_reg):
         energy_chunked = logger_chunked.data["Energy"]["Mean"]
 
         np.testing.assert_allclose(energy, energy_chunked, atol=1e-10)
+
+
+@skipif_distributed
+@pytest.mark.parametrize("use_ntk, onthefly", ntk_onthefly_vals)
+def test_SR_fused(use_ntk, onthefly):
+    """
+    VMC_SR must give the same dynamics when fusing several steps in a single dispatch
+    """
+    n_iters = 6
+    step_size = 3
+
+    H, opt, vstate = _setup()
+    gs = nkx.driver.VMC_SR(
+        H,
+        opt,
+        variational_state=vstate,
+        diag_shift=optax.linear_schedule(0.1, 0.01, n_iters),
+        use_ntk=use_ntk,
+        on_the_fly=onthefly,
+    )
+    logger = nk.logging.RuntimeLog()
+    gs.run(n_iter=n_iters, out=logger)
+
+    _, _, vstate_fused = _setup()
+    gs_fused = nkx.driver.VMC_SR(
+        H,
+        opt,
+        variational_state=vstate_fused,
+        diag_shift=optax.linear_schedule(0.1, 0.01, n_iters),
+        use_ntk=use_ntk,
+        on_the_fly=onthefly,
+        fused=True,
+    )
+    logger_fused = nk.logging.RuntimeLog()
+    gs_fused.run(n_iter=n_iters, out=logger_fused, step_size=step_size)
+
+    assert gs_fused.step_count == n_iters
+    jax.tree_util.tree_map(
+        lambda x, y: np.testing.assert_allclose(x, y, rtol=1e-8, atol=1e-12),
+        vstate.parameters,
+        vstate_fused.parameters,
+    )
+
+    # the same steps are logged as in the standard mode
+    energy = logger.data["Energy"]["Mean"]
+    np.testing.assert_allclose(
+        logger_fused.data["Energy"]["Mean"], energy[::step_size], rtol=1e-8
+    )
+    np.testing.assert_array_equal(
+        logger_fused.data["Energy"].iters, np.arange(0, n_iters, step_size)
+    )
+
+    # the steps preceding every logged step, padded with NaN before the first one
+    energy_fused = np.asarray(logger_fused.data["Energy_fused"]["Mean"])
+    assert energy_fused.shape == (n_iters // step_size, step_size)
+    assert np.all(np.isnan(energy_fused[0, :-1]))
+    np.testing.assert_allclose(
+        np.ravel(energy_fused)[step_size - 1 :],
+        energy[: n_iters - step_size + 1],
+        rtol=1e-8,
+    )
+
+    # the last block is shortened if the number of steps is not a multiple of it
+    logger_fused = nk.logging.RuntimeLog()
+    gs_fused.run(n_iter=step_size + 1, out=logger_fused, step_size=step_size)
+    assert gs_fused.step_count == n_iters + step_size + 1
+    np.testing.assert_array_equal(
+        logger_fused.data["Energy"].iters, [n_iters, n_iters + step_size]
+    )
+    energy_fused = np.asarray(logger_fused.data["Energy_fused"]["Mean"])
+    assert energy_fused.shape == (2, step_size)
+    np.testing.assert_allclose(
+        energy_fused[:, -1], logger_fused.data["Energy"]["Mean"], rtol=1e-8
+    )
+
+
+def test_SR_fused_requires_jax_sampler():
+    H, opt, _ = _setup()
+    sampler = nk.sampler.MetropolisLocalNumpy(H.hilbert)
+    vstate = nk.vqs.MCState(sampler, RBMModPhase(), n_samples=64)
+    with pytest.raises(TypeError):
+        nkx.driver.VMC_SR(H, opt, variational_state=vstate, diag_shift=0.1, fused=True)
+
+
+@skipif_distributed
+@pytest.mark.parametrize("use_ntk", [True, False])
+def test_SR_jacobian_dtype(use_ntk):
+    """
+    Storing the jacobian in single precision must give close results to double precision
+    """
+    H, opt, vstate = _setup()
+    gs = nkx.driver.VMC_SR(
+        H, opt, variational_state=vstate, diag_shift=0.1, use_ntk=use_ntk
+    )
+    sampler_state = vstate.sampler_state
+    dp = gs._forward_and_backward()
+
+    # Use the same samples
+    vstate.sampler_state = sampler_state
+
+    gs_mixed = nkx.driver.VMC_SR(
+        H,
+        opt,
+        variational_state=vstate,
+        diag_shift=0.1,
+        use_ntk=use_ntk,
+        jacobian_dtype=jnp.float32,
+    )
+    assert not gs_mixed.on_the_fly
+    dp_mixed = gs_mixed._forward_and_backward()
+
+    jax.tree_util.tree_map(
+        lambda x, y: np.testing.assert_allclose(x, y, rtol=1e-4, atol=1e-6),
+        dp_mixed,
+        dp,
+    )
+
+    with pytest.raises(ValueError):
+        nkx.driver.VMC_SR(
+            H,
+            opt,
+            variational_state=vstate,
+            diag_shift=0.1,
+            use_ntk=True,
+            on_the_fly=True,
+            jacobian_dtype=jnp.float32,
+        )
+
+
+@skipif_distributed
+@pytest.mark.parametrize("use_ntk", [True, False])
+def test_SR_nystrom(use_ntk):
+    """
+    The matrix-free Nyström solver must be exact if the rank is larger than the
+    size of the system.
+    """
+    H, opt, vstate = _setup()
+    gs = nkx.driver.VMC_SR(
+        H, opt, variational_state=vstate, diag_shift=0.1, use_ntk=use_ntk
+    )
+    sampler_state = vstate.sampler_state
+    dp = gs._forward_and_backward()
+
+    # Use the same samples
+    vstate.sampler_state = sampler_state
+
+    gs_nystrom = nkx.driver.VMC_SR(
+        H,
+        opt,
+        variational_state=vstate,
+        diag_shift=0.1,
+        use_ntk=use_ntk,
+        linear_solver_fn=nk.optimizer.solver.nystrom(rank=2048),
+    )
+    dp_nystrom = gs_nystrom._forward_and_backward()
+
+    jax.tree_util.tree_map(
+        lambda x, y: np.testing.assert_allclose(x, y, rtol=1e-5, atol=1e-7),
+        dp_nystrom,
+        dp,
+    )
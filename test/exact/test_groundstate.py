@@ -95,3 +95,119 @@ def test_ed_restricted():
     # state in the constrained Hilbert space
     idx_nonzero = np.abs(v2[:, 0]) > 1e-4
     assert overlap(v1[:, 0], v2[:, 0][idx_nonzero]) == approx(1.0)
+
+
+@pytest.mark.parametrize(
+    "ha", [pytest.param(op, id=name) for name, op in operators.items()]
+)
+def test_symmetric_ed_translations(ha):
+    G = g.translation_group()
+    H = ha.to_sparse()
+    w_full = nk.exact.full_ed(ha)
+
+    ws = []
+    for chi in G.character_table():
+        w, v = nk.exact.symmetric_lanczos_ed(ha, G, chi, k=3, compute_eigenvectors=True)
+        assert v.shape == (hi.n_states, 3)
+        np.testing.assert_allclose(v.conj().T @ v, np.eye(3), atol=1e-10)
+        np.testing.assert_allclose(
+            np.einsum("ij,ij->j", v.conj(), H @ v).real, w, atol=1e-10
+        )
+        # the eigenvectors transform according to the character
+        for i, perm in enumerate(G.to_array()):
+            x = hi.all_states()
+            Tv = np.zeros_like(v)
+            Tv[hi.states_to_numbers(x[:, perm])] = v
+            np.testing.assert_allclose(Tv, chi[i] * v, atol=1e-10)
+        ws.append(w)
+
+    assert np.sort(np.concatenate(ws))[:3] == approx(w_full[:3])
+
+
+def test_symmetric_ed_space_group():
+    graph = nk.graph.Square(4)
+    hilb = nk.hilbert.Spin(s=0.5, N=graph.n_nodes, total_sz=0)
+    ha = nk.operator.Heisenberg(hilb, graph=graph)
+    G = graph.space_group()
+
+    w0 = nk.exact.lanczos_ed(ha, k=1)
+    w = nk.exact.symmetric_lanczos_ed(ha, G, k=1)
+    assert w == approx(w0)
+
+    # characters of an irrep with dimension larger than one
+    chi = G.character_table()[-1]
+    assert chi[0] > 1
+    with pytest.raises(ValueError, match="one-dimensional"):
+        nk.exact.symmetric_lanczos_ed(ha, G, chi)
+
+
+def test_symmetric_ed_all_blocks():
+    graph = nk.graph.Chain(10)
+    hilb = nk.hilbert.Spin(s=0.5, N=graph.n_nodes)
+    ha = nk.operator.Heisenberg(hilb, graph=graph)
+    G = graph.translation_group()
+
+    # all the magnetization sectors are included by default
+    w = nk.exact.symmetric_lanczos_ed(ha, G, k=1)
+    assert w == approx(nk.exact.lanczos_ed(ha, k=1))
+
+    # an initial state restricts the diagonalization to its magnetization sector
+    x0 = np.ones(graph.n_nodes)
+    x0[::2] = -1
+    x0[1] = -1
+    w_sz = nk.exact.symmetric_lanczos_ed(ha, G, k=1, initial_state=x0)
+    hilb_sz = nk.hilbert.Spin(s=0.5, N=graph.n_nodes, total_sz=-1)
+    ha_sz = nk.operator.Heisenberg(hilb_sz, graph=graph)
+    assert w_sz == approx(nk.exact.symmetric_lanczos_ed(ha_sz, G, k=1))
+    assert w_sz[0] > w[0] + 1
+
+
+def test_symmetric_ed_not_indexable():
+    graph = nk.graph.Chain(40)
+    hilb = nk.hilbert.Spin(s=0.5, N=graph.n_nodes)
+    assert not hilb.is_indexable
+    ha = nk.operator.Heisenberg(hilb, graph=graph)
+    G = graph.translation_group()
+
+    # the one-magnon states have energy E(k) = N - 4 - 4 cos(k), as the Marshall
+    # sign rule shifts the momentum by π
+    x0 = np.ones(graph.n_nodes)
+    x0[0] = -1
+    chi = np.exp(1j * np.pi * np.arange(graph.n_nodes))
+    w = nk.exact.symmetric_lanczos_ed(ha, G, k=1, initial_state=x0)
+    assert w == approx([32.0])
+    w = nk.exact.symmetric_lanczos_ed(ha, G, chi, k=1, initial_state=x0)
+    assert w == approx([40.0])
+
+    with pytest.raises(ValueError, match="indexable"):
+        nk.exact.symmetric_lanczos_ed(ha, G, compute_eigenvectors=True)
+    with pytest.raises(ValueError, match="initial_state"):
+        nk.exact.symmetric_lanczos_ed(ha, G)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 100])
+@pytest.mark.parametrize(
+    "ha", [pytest.param(op, id=name) for name, op in operators.items()]
+)
+def test_ed_jax(ha, chunk_size):
+    w_full = nk.exact.full_ed(ha)
+
+    w, v = nk.exact.lanczos_ed_jax(
+        ha, k=3, compute_eigenvectors=True, chunk_size=chunk_size
+    )
+    assert w.shape == (3,)
+    assert v.shape == (hi.n_states, 3)
+    assert w == approx(w_full[:3], rel=1e-10, abs=1e-10)
+
+    v = np.asarray(v)
+    np.testing.assert_allclose(v.conj().T @ v, np.eye(3), atol=1e-10)
+    np.testing.assert_allclose(ha.to_sparse() @ v, v * np.asarray(w), atol=1e-8)
+
+    w = nk.exact.lanczos_ed_jax(ha, k=3, n_krylov=8, max_restarts=500)
+    assert w == approx(w_full[:3], rel=1e-10, abs=1e-10)
+
+    with pytest.warns(UserWarning, match="did not converge"):
+        nk.exact.lanczos_ed_jax(ha, k=3, n_krylov=8, max_restarts=0)
+
+    with pytest.raises(ValueError, match="Krylov"):
+        nk.exact.lanczos_ed_jax(ha, k=3, n_krylov=3)
@@ -94,3 +94,32 @@ def test_exact_ss_iterative(liouvillian, sparse, rho0):
     mat = np.abs(Lop @ dm_ss.reshape(-1))
     np.testing.assert_allclose(mat, 0.0, rtol=1e-5, atol=1e-5)
     np.testing.assert_allclose(dm_ss.trace() - 1, 0.0, rtol=1e-5, atol=1e-5)
+
+
+@pytest.mark.parametrize("solver", ["gmres", "bicgstab"])
+@pytest.mark.parametrize("chunk_size", [None, 5])
+def test_exact_ss_iterative_jax(liouvillian, solver, chunk_size):
+    lind = liouvillian
+
+    dm_ss = nk.exact.steady_state(
+        lind,
+        method="iterative_jax",
+        solver=solver,
+        chunk_size=chunk_size,
+        tol=1e-10,
+        maxiter=1000,
+    )
+    dm_ss = np.asarray(dm_ss)
+    Lop = lind.to_linear_operator()
+
+    mat = np.abs(Lop @ dm_ss.reshape(-1))
+    np.testing.assert_allclose(mat, 0.0, rtol=1e-5, atol=1e-5)
+    np.testing.assert_allclose(dm_ss.trace() - 1, 0.0, rtol=1e-5, atol=1e-5)
+
+    dm_ss_jax = nk.exact.steady_state(
+        lind.to_jax_operator(), method="iterative_jax", solver=solver, tol=1e-10
+    )
+    np.testing.assert_allclose(dm_ss_jax, dm_ss, atol=1e-5)
+
+    with pytest.raises(ValueError):
+        nk.exact.steady_state(lind, method="iterative_jax", solver="cg")
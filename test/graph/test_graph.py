@@ -34,6 +34,7 @@ from netket.graph import (
 )
 from netket.graph import _lattice
 from netket.utils import group
+from netket.utils.struct.fields import _cache_name, Uninitialized
 
 from .. import common
 
@@ -308,6 +309,97 @@ def test_space_group_pt(i, name):
     np.testing.assert_equal(tg.product_table, tgp.product_table)
 
 
+@pytest.mark.parametrize("i,name", list(enumerate(symmetric_graph_names)))
+def test_space_group_structured(i, name):
+    graph = symmetric_graphs[i]
+
+    # Structured products, inverses and classes must match PermutationGroup
+    sg = graph.space_group()
+    sgp = group.PermutationGroup(sg.elems, degree=sg.degree)
+    np.testing.assert_equal(sg.inverse, sgp.inverse)
+
+    rng = np.random.default_rng(0)
+    idx_g = rng.integers(len(sg), size=50)
+    idx_h = rng.integers(len(sg), size=50)
+    np.testing.assert_equal(
+        sg.product_table_entries(idx_g, idx_h), sgp.product_table[idx_g, idx_h]
+    )
+
+    tg = graph.translation_group()
+    tgp = group.PermutationGroup(tg.elems, degree=tg.degree)
+    idx_g = rng.integers(len(tg), size=50)
+    idx_h = rng.integers(len(tg), size=50)
+    np.testing.assert_equal(
+        tg.product_table_entries(idx_g, idx_h), tgp.product_table[idx_g, idx_h]
+    )
+
+    # pyrochlore is too large for the dense conjugacy table
+    if name != "pyrochlore":
+        for x, y in zip(sg.conjugacy_classes, sgp.conjugacy_classes):
+            np.testing.assert_equal(x, y)
+
+
+@pytest.mark.parametrize("i,name", list(enumerate(symmetric_graph_names)))
+def test_space_group_irreps_structured(i, name):
+    graph = symmetric_graphs[i]
+    # fresh copy, as the space group of the graph is cached across tests
+    sg = graph.space_group()
+    sg = nk.graph.space_group.SpaceGroup(graph, sg._point_group)
+
+    # irreps are induced from the translation group without the full product table
+    irreps = sg.irrep_matrices()
+    characters = sg.character_table()
+    assert getattr(sg, _cache_name("product_table")) is Uninitialized
+    assert sum(irrep.shape[-1] ** 2 for irrep in irreps) == len(sg)
+
+    rng = np.random.default_rng(0)
+    idx_g = rng.integers(len(sg), size=50)
+    idx_h = rng.integers(len(sg), size=50)
+    idx_gh = sg.product_table_entries(sg.inverse[idx_g], idx_h)
+    for irrep, chi in zip(irreps, characters):
+        np.testing.assert_allclose(np.trace(irrep, axis1=1, axis2=2), chi, atol=1e-8)
+        np.testing.assert_allclose(
+            irrep[idx_gh], irrep[idx_g] @ irrep[idx_h], atol=1e-8
+        )
+
+    # pyrochlore is too large for the dense conjugacy table
+    if name != "pyrochlore":
+        sgp = group.PermutationGroup(sg.elems, degree=sg.degree)
+        np.testing.assert_allclose(characters, sgp.character_table(), atol=1e-8)
+
+
+@pytest.mark.filterwarnings("ignore:You are attempting to define a lattice")
+@pytest.mark.parametrize(
+    "graph",
+    [
+        pytest.param(nk.graph.Grid([4, 2]), id="rectangle"),
+        pytest.param(nk.graph.Hypercube(2, n_dim=3), id="cube"),
+    ],
+)
+def test_space_group_irreps_not_faithful(graph):
+    # periodic axes of length 2 make different symmetries equal permutations
+    sg = graph.space_group()
+    n_distinct = len(np.unique(sg.to_array(), axis=0))
+    assert n_distinct < len(sg)
+
+    classes, _, _ = sg.conjugacy_classes
+    characters = sg.character_table_by_class
+    irreps = sg.irrep_matrices()
+    assert characters.shape == (len(classes), len(classes))
+    # these are the irreps of the group of distinct permutations
+    assert sum(irrep.shape[-1] ** 2 for irrep in irreps) == n_distinct
+
+    # orthogonality of the characters
+    class_sizes = classes.sum(axis=1)
+    np.testing.assert_allclose(
+        (characters * class_sizes) @ characters.conj().T / len(sg),
+        np.eye(len(classes)),
+        atol=1e-8,
+    )
+    for irrep, chi in zip(irreps, sg.character_table()):
+        np.testing.assert_allclose(np.trace(irrep, axis1=1, axis2=2), chi, atol=1e-8)
+
+
 @pytest.mark.parametrize(
     "i,name", [(i, symmetric_graph_names[i]) for i in nonsymmorphic_ix]
 )
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import itertools
-from math import prod
+from math import comb, prod
 from functools import partial
 import netket as nk
 import numpy as np
@@ -637,6 +637,41 @@ def test_no_particles():
         _ = Fock(n_max=3, n_particles=-1, N=4)
 
 
+@pytest.mark.parametrize(
+    "hi",
+    [
+        pytest.param(Spin(0.5, 10, total_sz=2), id="spin-1/2"),
+        pytest.param(Spin(1, 6, total_sz=-1), id="spin-1"),
+        pytest.param(Fock(n_max=2, N=5, n_particles=4), id="fock"),
+        pytest.param(
+            nk.hilbert.SpinOrbitalFermions(4, s=1 / 2, n_fermions_per_spin=(2, 1)),
+            id="fermions",
+        ),
+    ],
+)
+def test_sum_constrained_index(hi):
+    local_states = np.sort(np.asarray(hi.local_states))
+    bare_states = np.array(list(itertools.product(local_states, repeat=hi.size)))
+    states = bare_states[np.asarray(hi.constraint(bare_states))]
+
+    assert hi.n_states == states.shape[0]
+    np.testing.assert_array_equal(hi.all_states(), states)
+    np.testing.assert_array_equal(hi.states_to_numbers(states), np.arange(hi.n_states))
+
+
+def test_sum_constrained_index_large():
+    # the index does not store all the states, so it can be used for
+    # spaces whose unconstrained space is not indexable
+    hi = Spin(0.5, 32, total_sz=0)
+    assert hi.is_indexable
+    assert hi.n_states == comb(32, 16)
+
+    states = hi.random_state(jax.random.key(0), 16)
+    numbers = hi.states_to_numbers(states)
+    assert np.all((numbers >= 0) & (numbers < hi.n_states))
+    np.testing.assert_array_equal(hi.numbers_to_states(numbers), states)
+
+
 def test_tensor_no_recursion():
     # Issue https://github.com/netket/netket/issues/1101
     hi = nk.hilbert.Fock(3) * nk.hilbert.Spin(0.5, 2, total_sz=0.0)
@@ -45,3 +45,23 @@ def test_logdet():
     ldc = logdet_cmplx(A.astype(jnp.complex128))
     assert ldc.dtype == jnp.complex128
     np.testing.assert_allclose(ld, ldc)
+
+
+@pytest.mark.parametrize("low_dtype", [jnp.float32, jnp.bfloat16])
+def test_matmul_mixed_precision(low_dtype):
+    from netket.jax._math import matmul_mixed_precision
+
+    k1, k2 = jax.random.split(jax.random.PRNGKey(0))
+    A = jax.random.normal(k1, (20, 7)).astype(low_dtype)
+    v = jax.random.normal(k2, (7,), dtype=jnp.float64)
+
+    res = matmul_mixed_precision(A, v)
+    assert res.dtype == jnp.float64
+    expected = A.astype(jnp.float64) @ v
+    # The vector is split in two terms of lower precision, recovering most of
+    # its accuracy.
+    tol = 1e-12 if low_dtype == jnp.float32 else 1e-3
+    np.testing.assert_allclose(res, expected, rtol=tol, atol=tol)
+
+    res = matmul_mixed_precision(v[None, :], A.T)
+    np.testing.assert_allclose(res[0], expected, rtol=tol, atol=tol)
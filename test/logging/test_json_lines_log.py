@@ -0,0 +1,84 @@
+import numpy as np
+
+import jax
+from jax import numpy as jnp
+
+import netket as nk
+
+from .. import common
+
+
+def _log_step(log, i, e):
+    item = {
+        "energy": e,
+        "vals": {
+            "scalar": float(i),
+            "vector": jnp.array([1.0, i]),
+            "complex_matrix": jnp.array([[1.0j * i], [1.0]]),
+        },
+    }
+    # a quantity which is logged only starting from the middle of the run
+    if i >= 5:
+        item["late"] = 2.0 * i
+    log(i, item)
+
+
+@common.skipif_distributed
+def test_json_lines_log(tmp_path):
+    hi = nk.hilbert.Spin(0.5, 4)
+    vstate = nk.vqs.MCState(nk.sampler.MetropolisLocal(hi), nk.models.RBM(alpha=1))
+    e = vstate.expect(nk.operator.spin.sigmax(hi, 0))
+
+    prefix = str(tmp_path / "out")
+    log = nk.logging.JsonLinesLog(prefix, write_every=3, autoflush_cost=0.0)
+    log_ref = nk.logging.RuntimeLog()
+
+    n_steps = 10
+    for i in range(n_steps):
+        _log_step(log, i, e)
+        _log_step(log_ref, i, e)
+    log.flush()
+    # flushing again without new data does not write anything
+    log.flush()
+
+    with open(prefix + ".jsonl", "rb") as f:
+        lines = f.readlines()
+    assert 1 < len(lines) < n_steps
+
+    data = nk.logging.JsonLinesLog.load(prefix + ".jsonl")
+    data_ref = log_ref.data
+
+    assert set(data.keys()) == set(data_ref.keys())
+    np.testing.assert_allclose(data["energy"].iters, np.arange(n_steps))
+    np.testing.assert_allclose(data["energy"].Mean, data_ref["energy"].Mean)
+    assert data["energy"].main_value_name == "Mean"
+    np.testing.assert_allclose(data["vals"]["scalar"].values, np.arange(n_steps))
+    assert data["vals"]["vector"].values.shape == (n_steps, 2)
+    np.testing.assert_allclose(
+        data["vals"]["complex_matrix"].values,
+        data_ref["vals"]["complex_matrix"].values,
+    )
+    np.testing.assert_allclose(data["late"].iters, np.arange(5, n_steps))
+    np.testing.assert_allclose(data["late"].values, 2.0 * np.arange(5, n_steps))
+
+    # HistoryDict.from_file recognizes the format from the extension
+    data2 = nk.utils.history.HistoryDict.from_file(prefix + ".jsonl")
+    jax.tree.map(
+        np.testing.assert_allclose,
+        data2["vals"]["vector"].to_dict(),
+        data["vals"]["vector"].to_dict(),
+    )
+
+
+@common.skipif_distributed
+def test_json_lines_log_overwrite(tmp_path):
+    prefix = str(tmp_path / "out")
+    for _ in range(2):
+        log = nk.logging.JsonLinesLog(prefix)
+        for i in range(4):
+            log(i, {"value": float(i)})
+        log.flush()
+
+    data = nk.logging.JsonLinesLog.load(prefix + ".jsonl")
+    np.testing.assert_allclose(data["value"].iters, np.arange(4))
+    assert repr(log).startswith("JsonLinesLog")
@@ -21,6 +21,11 @@ import numpy as np
 from jax.nn.initializers import uniform
 from netket.utils.group import PermutationGroup
 from netket.errors import SymmModuleInvalidInputShape
+from netket.nn.symmetric_linear import (
+    DenseEquivariantFFT,
+    DenseEquivariantIrrep,
+    DenseSymmFFT,
+)
 
 import pytest
 
@@ -92,6 +97,28 @@ def test_DenseSymm_matrixInput(mode):
     assert hash(ma_masked) == hash(ma_masked2)
 
 
+def test_DenseEquivariantFFT_point_group_rows():
+    g = nk.graph.Square(3)
+    space_group = g.space_group()
+    n_point = len(space_group.point_group)
+    x = np.random.default_rng(0).normal(size=(2, 3, len(space_group)))
+
+    def apply(product_table):
+        ma = DenseEquivariantFFT(
+            product_table=nk.utils.HashableArray(product_table),
+            shape=(3, 3),
+            features=2,
+        )
+        pars = ma.init(nk.jax.PRNGKey(0), x)
+        return ma.apply(pars, x)
+
+    # only the point-group rows of the product table are needed
+    np.testing.assert_allclose(
+        apply(space_group.product_table),
+        apply(space_group.product_table[:n_point]),
+    )
+
+
 @pytest.mark.parametrize("symmetries", ["trans", "space_group"])
 @pytest.mark.parametrize("use_bias", [True, False])
 @pytest.mark.parametrize("mode", ["fft", "matrix"])
@@ -225,6 +252,30 @@ def test_DenseEquivariant_creation(mode):
         )
 
 
+def test_space_group_defaults_to_fft():
+    g = nk.graph.Square(3)
+    space_group = g.space_group()
+    x = np.random.default_rng(0).normal(size=(2, 3, len(space_group)))
+
+    ma = nk.nn.DenseEquivariant(symmetries=space_group, features=2)
+    assert isinstance(ma, DenseEquivariantFFT)
+    assert ma.shape == (3, 3)
+    ma_irreps = nk.nn.DenseEquivariant(
+        symmetries=space_group, mode="irreps", features=2
+    )
+    pars = ma_irreps.init(nk.jax.PRNGKey(0), x)
+    np.testing.assert_allclose(
+        ma.apply(pars, x), ma_irreps.apply(pars, x), rtol=1e-6, atol=1e-10
+    )
+
+    ma = nk.nn.DenseSymm(symmetries=space_group, features=2)
+    assert isinstance(ma, DenseSymmFFT)
+
+    # translations alone still use the irrep projection
+    ma = nk.nn.DenseEquivariant(symmetries=g.translation_group(), features=2)
+    assert isinstance(ma, DenseEquivariantIrrep)
+
+
 @pytest.mark.parametrize("symmetries", ["trans", "space_group"])
 @pytest.mark.parametrize("use_bias", [True, False])
 @pytest.mark.parametrize("lattice", [nk.graph.Chain, nk.graph.Square])
@@ -1,3 +1,5 @@
+import itertools
+
 import numpy as np
 
 import jax
@@ -111,6 +113,104 @@ def test_kinetic_energy():
     np.testing.assert_equal("KineticEnergy(m=20.0)", repr(kin1))
 
 
+@pytest.mark.parametrize("laplacian", ["forward", "hessian", "hutchinson"])
+def test_kinetic_energy_laplacian(laplacian):
+    x = jnp.array([[1.0, 2.0, 3.0], [0.5, -2.0, 1.0]])
+    kin = netket.operator.KineticEnergy(hilb, mass=20.0, laplacian=laplacian)
+
+    # the Hessian of separable models is diagonal, so Hutchinson is exact
+    energy = kin._expect_kernel(model3, 1.0 + 1.0j, x)
+    np.testing.assert_allclose(energy, kinexact2(1.0 + 1.0j, x) / kin.mass)
+
+    # the Hessian of this model is 2 everywhere, so the Laplacian is 2 D
+    model = lambda p, x: jnp.sum(x) ** 2
+    exact = -0.5 * (3 * (2 * jnp.sum(x, axis=-1)) ** 2 + 6.0) / kin.mass
+    if laplacian == "hutchinson":
+        kin = netket.operator.KineticEnergy(
+            hilb, mass=20.0, laplacian=laplacian, n_probes=100000
+        )
+        np.testing.assert_allclose(kin._expect_kernel(model, 0.0, x), exact, rtol=0.01)
+    else:
+        np.testing.assert_allclose(kin._expect_kernel(model, 0.0, x), exact)
+
+
+def test_kinetic_energy_laplacian_errors():
+    with pytest.raises(ValueError, match="Unknown laplacian"):
+        netket.operator.KineticEnergy(hilb, mass=1.0, laplacian="jet")
+    with pytest.raises(ValueError):
+        netket.operator.KineticEnergy(
+            hilb, mass=1.0, laplacian="hutchinson", n_probes=0
+        )
+
+    assert netket.operator.KineticEnergy(
+        hilb, mass=1.0, laplacian="hessian"
+    ) != netket.operator.KineticEnergy(hilb, mass=1.0)
+
+
+def test_pair_potential_cell_list():
+    hi = nkx.hilbert.Particle(N=40, geometry=nkx.geometry.Cell(d=3, L=6.0, pbc=True))
+    x = jax.random.uniform(jax.random.PRNGKey(0), (4, 120), minval=0.0, maxval=6.0)
+    charges = jnp.linspace(-1.0, 1.0, 40)
+    v = lambda r: jnp.exp(-r) / r
+
+    op = netket.operator.PairPotential(
+        hi, v, charges=charges, cutoff=1.5, max_per_cell=4
+    )
+    assert op._n_cells == (4, 4, 4)
+
+    r = hi.geometry.distance(x.reshape(4, 40, 1, 3), x.reshape(4, 1, 40, 3))
+    i, j = np.triu_indices(40, 1)
+    r = r[:, i, j]
+    exact = jnp.sum(jnp.where(r < 1.5, charges[i] * charges[j] * v(r), 0), axis=-1)
+    np.testing.assert_allclose(op._expect_kernel(model1, None, x), exact, atol=1e-5)
+
+    # the samples with too many particles in a cell fall back to all pairs
+    for max_per_cell in (1, 2):
+        op = netket.operator.PairPotential(
+            hi, v, charges=charges, cutoff=1.5, max_per_cell=max_per_cell
+        )
+        np.testing.assert_allclose(op._expect_kernel(model1, None, x), exact, atol=1e-5)
+
+    # by default, the cell list is only used if it is cheaper than all pairs
+    assert netket.operator.PairPotential(hi, v, cutoff=1.5)._n_cells is None
+    hi_large = nkx.hilbert.Particle(
+        N=4096, geometry=nkx.geometry.Cell(d=3, L=24.0, pbc=True)
+    )
+    op = netket.operator.PairPotential(hi_large, v, cutoff=1.5)
+    assert op._n_cells == (16, 16, 16)
+    assert op._max_per_cell == 10
+
+    with pytest.raises(ValueError):
+        netket.operator.PairPotential(hi, v, cutoff=4.0)
+
+
+def test_pair_potential_ewald():
+    # rock salt structure with lattice spacing 1
+    hi = nkx.hilbert.Particle(N=8, geometry=nkx.geometry.Cell(d=3, L=2.0, pbc=True))
+    pos = np.array(list(itertools.product((0.0, 1.0), repeat=3)))
+    charges = (-1.0) ** np.sum(pos, axis=-1)
+    x = jnp.asarray(pos.reshape(1, -1))
+
+    madelung = 1.747564594633
+    for alpha in (3.5, 4.5):
+        op = netket.operator.PairPotential(
+            hi, "coulomb", charges=charges, ewald_alpha=alpha
+        )
+        np.testing.assert_allclose(
+            op._expect_kernel(model1, None, x), [-4 * madelung], rtol=1e-4
+        )
+
+    with pytest.raises(NotImplementedError):
+        netket.operator.PairPotential(hilb2, "coulomb")
+
+    # partially periodic boxes would need a different Ewald summation
+    hi = nkx.hilbert.Particle(
+        N=2, geometry=nkx.geometry.Cell(d=3, L=2.0, pbc=(True, True, False))
+    )
+    with pytest.raises(NotImplementedError):
+        netket.operator.PairPotential(hi, "coulomb")
+
+
 def test_sumoperator():
     x = jnp.array([[1.0, 2.0, 3.0], [1.0, 2.0, 3.0]])
     potenergy = pottot._expect_kernel(model2, 0.0, x)
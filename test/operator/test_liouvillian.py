@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import jax
+
 import netket as nk
 import numpy as np
 from scipy import sparse
@@ -151,3 +153,29 @@ def test_dtype(dtype):
         assert sigmap.dtype == sigma.dtype
         # TODO: fix this test
         # assert mels.dtype == lind.dtype
+
+
+def test_liouvillian_jax():
+    lind_jax = lind.to_jax_operator()
+    assert isinstance(lind_jax, nk.operator.LocalLiouvillianJax)
+    assert lind_jax.dtype == lind.dtype
+    assert lind_jax.hilbert == lind.hilbert
+
+    np.testing.assert_allclose(lind_jax.to_dense(), lind.to_dense())
+
+    # connected elements computed inside of jit
+    sigma = lind.hilbert.all_states()[::7]
+    sigmap, mels = jax.jit(lambda op, x: op.get_conn_padded(x))(lind_jax, sigma)
+    assert sigmap.shape == (sigma.shape[0], lind_jax.max_conn_size, lind.hilbert.size)
+    assert mels.shape == (sigma.shape[0], lind_jax.max_conn_size)
+
+    # matrix elements agree with the numba implementation, up to duplicates
+    idx = lind.hilbert.states_to_numbers(sigma)
+    rows = np.zeros((sigma.shape[0], lind.hilbert.n_states), dtype=mels.dtype)
+    for i in range(sigma.shape[0]):
+        np.add.at(rows[i], lind.hilbert.states_to_numbers(sigmap[i]), mels[i])
+    np.testing.assert_allclose(rows, lind.to_dense()[idx], atol=1e-12)
+
+    lind_numba = lind_jax.to_numba_operator()
+    assert isinstance(lind_numba, nk.operator.LocalLiouvillian)
+    np.testing.assert_allclose(lind_numba.to_dense(), lind.to_dense())
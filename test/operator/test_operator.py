@@ -577,6 +577,52 @@ def test_matmul_sparse_vector(op):
     np.testing.assert_array_equal(Ov_dense, Ov_sparse)
 
 
+@pytest.mark.parametrize(
+    "op",
+    [pytest.param(op, id=name) for name, op in op_finite_size.items()],
+)
+def test_to_sparse_chunked(op):
+    A = op.to_sparse()
+    chunk_size = max(1, op.hilbert.n_states // 7)
+    A_chunked = op.to_sparse(chunk_size=chunk_size)
+
+    assert isinstance(A_chunked, scipy.sparse.csr_matrix)
+    assert A_chunked.shape == A.shape
+    assert A_chunked.nnz == A.nnz
+    np.testing.assert_array_equal(A_chunked.indptr, A.indptr)
+    np.testing.assert_array_equal(A_chunked.todense(), A.todense())
+
+
+def test_to_sparse_n_workers():
+    g = nk.graph.Chain(8)
+    hi = nk.hilbert.Spin(0.5, g.n_nodes)
+    op = nk.operator.Heisenberg(hi, g)
+    A = op.to_sparse()
+
+    A_workers = op.to_sparse(chunk_size=37, n_workers=2)
+    assert isinstance(A_workers, scipy.sparse.csr_matrix)
+    np.testing.assert_array_equal(A_workers.indptr, A.indptr)
+    np.testing.assert_array_equal(A_workers.todense(), A.todense())
+
+
+def test_to_sparse_map_bounded():
+    from concurrent.futures import ThreadPoolExecutor
+    from netket.operator._discrete_operator import _map_bounded
+
+    submitted = []
+
+    def square(i):
+        submitted.append(i)
+        return i**2
+
+    with ThreadPoolExecutor(2) as executor:
+        results = _map_bounded(executor, square, ((i,) for i in range(10)), 3)
+        assert next(results) == 0
+        # only the consumed task and max_pending tasks ahead of it are submitted
+        assert len(submitted) <= 4
+        assert list(results) == [i**2 for i in range(1, 10)]
+
+
 @pytest.mark.parametrize(
     "op",
     [
@@ -36,6 +36,9 @@ QGT_objects = {}
 
 QGT_objects["OnTheFly"] = partial(qgt.QGTOnTheFly, diag_shift=0.01)
 QGT_objects["OnTheFly"] = partial(qgt.QGTOnTheFly, diag_shift=0.01, holomorphic=True)
+QGT_objects["OnTheFly(diag_scale=0.01, diag_shift=0.01)"] = partial(
+    qgt.QGTOnTheFly, diag_scale=0.01, diag_shift=0.01, holomorphic=True
+)
 
 QGT_objects["JacobianPyTree"] = partial(qgt.QGTJacobianPyTree, diag_shift=0.01)
 QGT_objects["JacobianPyTree(mode=holomorphic)"] = partial(
@@ -353,3 +356,129 @@ def test_qgt_onthefly_correct_chunking_selection():
         vstate.chunk_size = vstate.n_samples // (2 * len(jax.devices()))
         QGT = nk.optimizer.qgt.QGTOnTheFly(vstate)
         assert QGT._mat_vec.func is not _mat_vec
+
+
+@common.skipif_mpi
+@pytest.mark.parametrize(
+    "chunk_size", [pytest.param(x, id=f"chunk={x}") for x in [None, 16]]
+)
+@pytest.mark.parametrize("diag_scale", [None, 0.1])
+def test_qgt_onthefly_diagonal_preconditioner(vstate, chunk_size, diag_scale):
+    is_holo = nk.jax.is_complex_dtype(vstate.model.param_dtype)
+    S = qgt.QGTOnTheFly(
+        vstate,
+        diag_shift=0.01,
+        diag_scale=diag_scale,
+        holomorphic=is_holo,
+        preconditioner="diagonal",
+    )
+
+    rtol, atol = dense_tol[nk.jax.dtype_real(vstate.model.param_dtype)]
+    diagonal, _ = nk.jax.tree_ravel(S._preconditioner.diagonal)
+    np.testing.assert_allclose(
+        diagonal, jnp.diag(S.to_dense()).real, rtol=rtol, atol=atol
+    )
+
+    if diag_scale is not None:
+        S_ref = qgt.QGTJacobianDense(
+            vstate, diag_shift=0.01, diag_scale=diag_scale, holomorphic=is_holo
+        )
+        np.testing.assert_allclose(S.to_dense(), S_ref.to_dense(), rtol=rtol, atol=atol)
+
+
+@pytest.mark.parametrize("preconditioner", ["diagonal", "nystrom"])
+@pytest.mark.parametrize(
+    "chunk_size", [pytest.param(x, id=f"chunk={x}") for x in [None, 16]]
+)
+def test_qgt_onthefly_preconditioned_solve(vstate, preconditioner, chunk_size):
+    S = qgt.QGTOnTheFly(
+        vstate,
+        diag_shift=0.01,
+        preconditioner=preconditioner,
+        preconditioner_rank=8,
+    )
+
+    solver = partial(jax.scipy.sparse.linalg.cg, tol=1e-8)
+    x, _ = S.solve(solver, vstate.parameters)
+
+    rtol, atol = solvers_tol[
+        solvers["gmres"], nk.jax.dtype_real(vstate.model.param_dtype)
+    ]
+    jax.tree_util.tree_map(
+        partial(testing.assert_allclose, rtol=rtol, atol=atol),
+        S @ x,
+        vstate.parameters,
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [None])
+def test_sr_preconditioner_refresh(vstate):
+    sr = nk.optimizer.SR(
+        qgt.QGTOnTheFly,
+        preconditioner="nystrom",
+        preconditioner_rank=8,
+        preconditioner_refresh=2,
+    )
+
+    S1 = sr.lhs_constructor(vstate)
+    S2 = sr.lhs_constructor(vstate)
+    S3 = sr.lhs_constructor(vstate)
+    assert S2._preconditioner is S1._preconditioner
+    assert S3._preconditioner is not S1._preconditioner
+
+    with pytest.raises(ValueError, match="Unknown preconditioner"):
+        qgt.QGTOnTheFly(vstate, preconditioner="wrong")
+
+
+@common.skipif_mpi
+@pytest.mark.parametrize(
+    "chunk_size", [pytest.param(x, id=f"chunk={x}") for x in [None, 16]]
+)
+def test_qgt_block_diagonal(vstate, chunk_size):
+    is_holo = nk.jax.is_complex_dtype(vstate.model.param_dtype)
+    rtol, atol = dense_tol[nk.jax.dtype_real(vstate.model.param_dtype)]
+
+    S_full = qgt.QGTJacobianPyTree(vstate, diag_shift=0.01, holomorphic=is_holo)
+    S_full_dense = S_full.to_dense()
+
+    # A single block must be equivalent to the full QGT
+    S = qgt.QGTBlockDiagonal(
+        vstate, diag_shift=0.01, holomorphic=is_holo, groups=lambda path, x: 0
+    )
+    assert len(S.blocks) == 1
+    np.testing.assert_allclose(S.to_dense(), S_full_dense, rtol=rtol, atol=atol)
+
+    # Every leaf in its own block
+    S = qgt.QGTBlockDiagonal(
+        vstate, diag_shift=0.01, holomorphic=is_holo, groups="leaf"
+    )
+    leaves = jax.tree_util.tree_leaves(vstate.parameters)
+    assert len(S.blocks) == len(leaves)
+    block_ids = np.concatenate([np.full(x.size, i) for i, x in enumerate(leaves)])
+    mask = block_ids[:, None] == block_ids[None, :]
+    np.testing.assert_allclose(
+        S.to_dense(), np.where(mask, S_full_dense, 0), rtol=rtol, atol=atol
+    )
+
+    x, info = S.solve(nk.optimizer.solver.cholesky, vstate.parameters)
+    assert len(info) == len(leaves)
+    jax.tree_util.tree_map(
+        partial(testing.assert_allclose, rtol=rtol, atol=atol),
+        S @ x,
+        vstate.parameters,
+    )
+
+
+def test_qgt_block_diagonal_groups():
+    hi = nk.hilbert.Spin(1 / 2, 4)
+    vstate = nk.vqs.MCState(
+        nk.sampler.MetropolisLocal(hi),
+        nk.models.RBM(alpha=1, param_dtype=float),
+        n_samples=64,
+    )
+    S = qgt.QGTBlockDiagonal(vstate, diag_shift=0.01)
+    # {"Dense": {"kernel", "bias"}} and {"visible_bias"}
+    assert len(S.blocks) == 2
+
+    with pytest.raises(ValueError, match="Unknown grouping"):
+        qgt.QGTBlockDiagonal(vstate, groups="wrong")
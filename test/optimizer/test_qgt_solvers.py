@@ -24,6 +24,8 @@ from jax.nn.initializers import normal
 
 import netket as nk
 from netket.optimizer import qgt
+from netket.utils import HashablePartial
+from netket._src.ngd.matrix_free import is_matrix_free_solver
 
 from .. import common  # noqa: F401
 
@@ -195,3 +197,53 @@ def test_solver_rcond_deprecation(solver_func):
 
     # Check that the solution is correct
     np.testing.assert_allclose(A @ x_new, b, rtol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "dtype", [pytest.param(dtype, id=name) for name, dtype in dtypes.items()]
+)
+def test_solver_nystrom(dtype):
+    # A low rank PSD matrix, for which the Nyström approximation is exact
+    O = jax.random.normal(jax.random.key(1), (20, 6), dtype=dtype)
+    K = O @ O.conj().T
+    b = jax.random.normal(jax.random.key(2), (20,), dtype=dtype)
+    diag_shift = 1e-2
+    A = K + diag_shift * np.eye(20)
+    x_exact = np.linalg.solve(A, b)
+
+    x, info = nk.optimizer.solver.nystrom(K, b, rank=8, diag_shift=diag_shift)
+    np.testing.assert_allclose(x, x_exact, rtol=1e-6, atol=1e-8)
+    assert info["eigenvalues"].shape == (8,)
+
+    # Without the exact shift, the tail is approximated by the smallest eigenvalue,
+    # and the solution is only approximate because the rank of A is larger than 8
+    def relative_error(x):
+        return np.linalg.norm(x - x_exact) / np.linalg.norm(x_exact)
+
+    x, _ = nk.optimizer.solver.nystrom(A, b, rank=8)
+    assert relative_error(x) < 1e-3
+
+    solver_partial = nk.optimizer.solver.nystrom(rank=8)
+    assert isinstance(solver_partial, partial)
+    x, _ = solver_partial(A, b)
+    assert relative_error(x) < 1e-3
+
+    # The solver is recognized as matrix-free also when wrapped
+    assert is_matrix_free_solver(nk.optimizer.solver.nystrom)
+    assert is_matrix_free_solver(solver_partial)
+    assert is_matrix_free_solver(HashablePartial(nk.optimizer.solver.nystrom, rank=8))
+    assert not is_matrix_free_solver(nk.optimizer.solver.cholesky)
+
+
+def test_solver_nystrom_qgt(vstate):
+    is_holo = nk.jax.is_complex_dtype(vstate.model.param_dtype)
+    S = qgt.QGTJacobianDense(vstate, holomorphic=is_holo, diag_shift=0.01)
+    n_params = nk.jax.tree_size(vstate.parameters)
+
+    x, _ = S.solve(nk.optimizer.solver.nystrom(rank=n_params), vstate.parameters)
+    x_exact, _ = S.solve(nk.optimizer.solver.cholesky, vstate.parameters)
+    jax.tree_util.tree_map(
+        lambda a, b: np.testing.assert_allclose(a, b, rtol=1e-5, atol=1e-8),
+        x,
+        x_exact,
+    )
@@ -206,3 +206,40 @@ def test_multiplerules_pt(model_and_weights):
         chain_length=10,
     )
     assert samples.shape == (sa.n_batches // sa.n_replicas, 10, hi.size)
+
+
+def test_adaptive_betas(model_and_weights):
+    g = nk.graph.Hypercube(length=4, n_dim=1)
+    hi = nk.hilbert.Spin(s=0.5, N=g.n_nodes)
+
+    for kwargs in [{"n_adapt_sweeps": -1}, {"n_adapt_sweeps": 1, "adapt_rate": 0}]:
+        with pytest.raises(ValueError):
+            nk.sampler.ParallelTemperingLocal(hi, n_replicas=4, **kwargs)
+
+    sa = nk.sampler.ParallelTemperingLocal(
+        hi, n_replicas=8, betas="log", n_adapt_sweeps=5
+    )
+    ma, w = model_and_weights(hi, sa)
+
+    sampler_state = sa.init_state(ma, w, seed=SAMPLER_SEED)
+    sampler_state = sa.reset(ma, w, state=sampler_state)
+    assert sampler_state.n_adapt_sweeps_left == 5
+
+    # the temperatures are adapted during the first sweeps after the reset
+    _, sampler_state = sa.sample(ma, w, state=sampler_state, chain_length=5)
+    assert sampler_state.n_adapt_sweeps_left == 0
+    assert sampler_state.swap_acceptance.shape == (7,)
+    assert jnp.all(
+        (sampler_state.swap_acceptance >= 0) & (sampler_state.swap_acceptance <= 1)
+    )
+
+    ladder = -jnp.sort(-sampler_state.beta, axis=-1)
+    np.testing.assert_allclose(ladder, jnp.broadcast_to(ladder[0], ladder.shape))
+    np.testing.assert_allclose(ladder[0, 0], 1.0)
+    np.testing.assert_allclose(ladder[0, -1], sa.sorted_betas[-1])
+    assert jnp.all(jnp.diff(ladder[0]) < 0)
+    assert not np.allclose(ladder[0], sa.sorted_betas)
+
+    # and then frozen
+    _, sampler_state_frozen = sa.sample(ma, w, state=sampler_state, chain_length=5)
+    np.testing.assert_allclose(-jnp.sort(-sampler_state_frozen.beta, axis=-1), ladder)
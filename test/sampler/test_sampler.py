@@ -72,6 +72,10 @@ samplers["Metropolis(Local): Spin-chunked"] = nk.sampler.MetropolisLocal(
     hi, chunk_size=8
 )
 
+samplers["Metropolis(Local,fast_update): Spin"] = nk.sampler.MetropolisLocal(
+    hi, fast_update=True
+)
+
 samplers["MetropolisNumpy(Local): Spin"] = nk.sampler.MetropolisLocalNumpy(hi)
 samplers["MetropolisNumpy(Local): Spin-chunked"] = nk.sampler.MetropolisLocalNumpy(
     hi, chunk_size=8
@@ -91,6 +95,9 @@ samplers["MetropolisPT(Local): Fock"] = nk.sampler.ParallelTemperingLocal(
 samplers["Metropolis(Exchange): Fock-1particle"] = nk.sampler.MetropolisExchange(
     hib, graph=g
 )
+samplers["Metropolis(Exchange,fast_update): Fock-1particle"] = (
+    nk.sampler.MetropolisExchange(hib, graph=g, fast_update=True)
+)
 
 if not config.netket_experimental_sharding:
     samplers["Metropolis(Hamiltonian,numba operator): Spin"] = (
@@ -359,6 +366,28 @@ def test_return_log_probabilities(sampler, model_and_weights):
     np.testing.assert_allclose(log_probs, log_probs_computed)
 
 
+@pytest.mark.parametrize(
+    "sampler_type",
+    [nk.sampler.MetropolisLocal, nk.sampler.ParallelTemperingLocal],
+)
+def test_return_log_amplitudes(sampler_type):
+    hi = nk.hilbert.Spin(0.5, 4)
+    sampler = sampler_type(hi, n_chains=4)
+    ma = nk.models.RBM(alpha=1, param_dtype=complex)
+    w = ma.init(jax.random.PRNGKey(0), hi.all_states())
+
+    (samples, log_probs, log_amps), _ = sampler.sample(
+        ma,
+        w,
+        chain_length=3,
+        return_log_probabilities=True,
+        return_log_amplitudes=True,
+    )
+    assert log_amps.shape == samples.shape[:-1]
+    np.testing.assert_allclose(log_amps, ma.apply(w, samples), rtol=1e-6)
+    np.testing.assert_allclose(log_probs, sampler.machine_pow * log_amps.real)
+
+
 def findrng(rng):
     if hasattr(rng, "_bit_generator"):
         return rng._bit_generator.state["state"]
@@ -794,3 +823,97 @@ def test_chunking_invariant(model_and_weights, sampler_type):
     )
 
     np.testing.assert_allclose(samples, samples_ch)
+
+
+@pytest.mark.parametrize(
+    "model, sampler",
+    [
+        pytest.param(
+            nk.models.RBM(alpha=2, param_dtype=complex),
+            nk.sampler.MetropolisLocal(hi_spin1, fast_update=True),
+            id="RBM-Local",
+        ),
+        pytest.param(
+            nk.models.Jastrow(),
+            nk.sampler.MetropolisExchange(hi_spin1, graph=g, fast_update=True),
+            id="Jastrow-Exchange",
+        ),
+        pytest.param(
+            nk.models.Slater2nd(hi_fermion_spin, param_dtype=complex),
+            nk.sampler.MetropolisFermionHop(hi_fermion_spin, graph=g, fast_update=True),
+            id="Slater2nd-FermionHop",
+        ),
+        pytest.param(
+            nk.models.Slater2nd(hi_fermion_spin, generalized=True, restricted=False),
+            nk.sampler.MetropolisFermionHop(hi_fermion_spin, graph=g, fast_update=True),
+            id="Slater2nd(generalized)-FermionHop",
+        ),
+    ],
+)
+def test_fast_update(model, sampler):
+    hilb = sampler.hilbert
+    w = model.init(jax.random.PRNGKey(WEIGHT_SEED), hilb.all_states()[:1])
+
+    sampler_state = sampler.init_state(model, w, seed=SAMPLER_SEED)
+    sampler_state = sampler.reset(model, w, state=sampler_state)
+    (samples, log_probs), sampler_state = sampler.sample(
+        model,
+        w,
+        state=sampler_state,
+        chain_length=20,
+        return_log_probabilities=True,
+    )
+    assert sampler_state.acceptance > 0
+
+    # the incrementally updated log-probabilities match the full evaluation
+    np.testing.assert_allclose(
+        log_probs,
+        sampler.machine_pow * model.apply(w, samples).real,
+        atol=1e-8,
+    )
+
+    # the cache of the last configuration matches the freshly computed one
+    log_psi, _ = model.apply(w, sampler_state.σ, method="init_fast_update")
+    log_psi_cached, _ = model.apply(
+        w,
+        sampler_state.σ,
+        sampler_state.σ,
+        jnp.full((sampler_state.σ.shape[0], 1), hilb.size),
+        sampler_state.fast_update_cache,
+        method="fast_update",
+    )
+    np.testing.assert_allclose(
+        np.exp(log_psi_cached - log_psi), np.ones_like(log_psi), atol=1e-8
+    )
+
+    # the cache is recomputed from scratch after every sweep
+    sampler = sampler.replace(fast_update_refresh=1)
+    sampler_state = sampler.reset(model, w, state=sampler_state)
+    _, sampler_state = sampler.sample(model, w, state=sampler_state, chain_length=3)
+    log_psi, cache = model.apply(w, sampler_state.σ, method="init_fast_update")
+    np.testing.assert_array_equal(sampler_state.log_psi, log_psi)
+    jax.tree.map(np.testing.assert_array_equal, sampler_state.fast_update_cache, cache)
+
+
+def test_fast_update_throwing():
+    hi = nk.hilbert.Spin(s=0.5, N=g.n_nodes)
+    ha = nk.operator.IsingJax(hilbert=hi, graph=g, h=1.0)
+    ma = nk.models.RBM()
+    w = ma.init(jax.random.PRNGKey(WEIGHT_SEED), jnp.zeros((1, hi.size)))
+
+    with pytest.raises(TypeError, match="fast_update"):
+        nk.sampler.MetropolisLocal(hi, fast_update=1)
+    with pytest.raises(ValueError, match="fast_update_refresh"):
+        nk.sampler.MetropolisLocal(hi, fast_update=True, fast_update_refresh=0)
+
+    # the rule does not bound the number of modified sites
+    sa = nk.sampler.MetropolisHamiltonian(hi, ha, fast_update=True)
+    with pytest.raises(TypeError, match="max_modified_sites"):
+        sa.init_state(ma, w)
+
+    # the model does not implement the protocol
+    sa = nk.sampler.MetropolisLocal(hi, fast_update=True)
+    ma = nk.models.MLP(hidden_dims=(2,))
+    w = ma.init(jax.random.PRNGKey(WEIGHT_SEED), jnp.zeros((1, hi.size)))
+    with pytest.raises(TypeError, match="init_fast_update"):
+        sa.init_state(ma, w)
@@ -248,3 +248,59 @@ def test_R_hat():
     # stuck -> bad  R_hat:
     x[1, 100:] = 1.0
     assert statistics(x).R_hat > 1.01
+
+
+@common.skipif_mpi
+@pytest.mark.parametrize("n_chunks", [1, 8])
+def test_stats_accumulator(n_chunks):
+    rng = np.random.default_rng(1234)
+    n_chains, chain_length = 16, 256
+    x = rng.normal(size=(n_chains, chain_length))
+
+    acc = nk.stats.StatsAccumulator.empty(n_chains)
+    update = jax.jit(lambda acc, x: acc.update(x))
+    for chunk in np.split(x, n_chunks, axis=1):
+        acc = update(acc, chunk)
+    stats = acc.get_stats()
+
+    np.testing.assert_allclose(stats.mean, x.mean())
+    np.testing.assert_allclose(stats.variance, x.var())
+    np.testing.assert_allclose(
+        stats.error_of_mean, np.sqrt(x.mean(axis=1).var() / n_chains)
+    )
+    # the chains are split exactly in the middle
+    np.testing.assert_allclose(stats.R_hat, statistics(x).R_hat)
+    assert acc.n_samples_per_chain == chain_length
+    assert acc.n_blocks <= acc.max_blocks
+
+    # single chain: error estimated from the block means
+    acc = nk.stats.StatsAccumulator.empty(1, max_blocks=8)
+    for chunk in np.split(x[:1], n_chunks, axis=1):
+        acc = acc.update(chunk)
+    stats = acc.get_stats()
+    np.testing.assert_allclose(stats.mean, x[0].mean())
+    np.testing.assert_allclose(stats.variance, x[0].var())
+    block_means = x[0, : acc.n_blocks * acc.block_size].reshape(acc.n_blocks, -1)
+    block_means = block_means.mean(axis=1)
+    np.testing.assert_allclose(
+        stats.error_of_mean, np.sqrt(block_means.var() / acc.n_blocks)
+    )
+
+
+@common.skipif_mpi
+def test_stats_accumulator_complex():
+    rng = np.random.default_rng(1234)
+    x = rng.normal(size=(4, 100)) + 1j * rng.normal(size=(4, 100))
+
+    acc = nk.stats.StatsAccumulator.empty(4, complex)
+    for i in range(x.shape[1]):
+        acc = acc.update(x[:, i])
+    stats = acc.get_stats()
+
+    np.testing.assert_allclose(stats.mean, x.mean())
+    np.testing.assert_allclose(stats.variance, x.var())
+
+    with pytest.raises(ValueError):
+        acc.update(x[:2])
+    with pytest.raises(ValueError):
+        nk.stats.StatsAccumulator.empty(4, max_blocks=3)
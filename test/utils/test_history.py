@@ -120,6 +120,30 @@ def test_append():
     repr(a2)
 
 
+def test_append_amortized():
+    hist = nk.utils.History({"a": 0.0, "b": np.zeros(2)}, iters=0)
+    iters_buffers = set()
+
+    n_steps = 100
+    for i in range(1, n_steps):
+        hist.append({"a": float(i), "b": np.full(2, i)}, it=i)
+        iters_buffers.add(id(hist._value_dict["iters"]))
+
+    assert len(hist) == n_steps
+    np.testing.assert_equal(hist.iters, np.arange(n_steps))
+    np.testing.assert_equal(hist["a"], np.arange(n_steps))
+    assert hist["b"].shape == (n_steps, 2)
+    np.testing.assert_equal(hist.to_dict()["b"][:, 1], np.arange(n_steps))
+    # the capacity is doubled, so the buffer is reallocated only log(n) times
+    assert len(iters_buffers) <= 8
+
+    # appending does not modify the arrays previously returned
+    a = hist["a"]
+    hist.append({"a": -1.0, "b": np.zeros(2)}, it=n_steps)
+    assert len(a) == n_steps
+    assert hist["a"][-1] == -1.0
+
+
 def test_construct_from_dict():
     tree = nk.utils.History(create_mock_data_iter(0))
     a2 = nk.utils.History(create_mock_data_iter(1), iters=1)
@@ -13,12 +13,14 @@
 # limitations under the License.
 
 from functools import partial
+from unittest.mock import patch
 import copy
 
 import pytest
 from pytest import approx, raises
 
 import jax
+import jax.numpy as jnp
 import numpy as np
 
 import netket as nk
@@ -477,6 +479,156 @@ def test_local_estimators(vstate, operator):
     inner_test()
 
 
+@common.skipif_mpi
+@pytest.mark.parametrize("chunk_size", [None, 4])
+def test_expect_multiple(vstate, chunk_size):
+    def assert_stats_equal(st1, st2):
+        np.testing.assert_allclose(st1.mean, st2.mean)
+        np.testing.assert_allclose(st1.variance, st2.variance)
+        np.testing.assert_allclose(st1.error_of_mean, st2.error_of_mean)
+
+    vstate.chunk_size = chunk_size
+    observables = {
+        "ops": operators,
+        "zz": [
+            nk.operator.spin.sigmaz(hi, 0) @ nk.operator.spin.sigmaz(hi, i)
+            for i in range(L)
+        ],
+    }
+    is_op = lambda x: isinstance(x, nk.operator.AbstractOperator)
+
+    stats = vstate.expect_multiple(observables)
+    stats_ref = jax.tree_util.tree_map(vstate.expect, observables, is_leaf=is_op)
+
+    assert jax.tree_util.tree_structure(
+        stats, is_leaf=lambda x: isinstance(x, nk.stats.Stats)
+    ) == jax.tree_util.tree_structure(
+        stats_ref, is_leaf=lambda x: isinstance(x, nk.stats.Stats)
+    )
+    for st1, st2 in zip(
+        jax.tree_util.tree_leaves(
+            stats, is_leaf=lambda x: isinstance(x, nk.stats.Stats)
+        ),
+        jax.tree_util.tree_leaves(
+            stats_ref, is_leaf=lambda x: isinstance(x, nk.stats.Stats)
+        ),
+    ):
+        assert_stats_equal(st1, st2)
+
+
+@common.skipif_mpi
+@pytest.mark.parametrize("chunk_size", [None, 4, 8])
+@pytest.mark.parametrize("fraction", [0.01, 1.0])
+def test_unique_connected_fraction(vstate, chunk_size, fraction):
+    op = operators["operator:(IsingJax)"]
+    vstate.chunk_size = chunk_size
+
+    O_ref, O_grad_ref = vstate.expect_and_grad(op)
+    O_loc_ref = vstate.local_estimators(op)
+
+    vstate.unique_connected_fraction = fraction
+    O, O_grad = vstate.expect_and_grad(op)
+    O_loc = vstate.local_estimators(op)
+
+    np.testing.assert_allclose(O_loc, O_loc_ref, rtol=1e-10)
+    np.testing.assert_allclose(O.mean, O_ref.mean, rtol=1e-10)
+    jax.tree_util.tree_map(
+        partial(np.testing.assert_allclose, rtol=1e-8, atol=1e-12),
+        O_grad,
+        O_grad_ref,
+    )
+
+    with pytest.raises(ValueError):
+        vstate.unique_connected_fraction = 1.5
+
+
+@common.skipif_mpi
+@pytest.mark.parametrize("chunk_size", [None, 4])
+def test_cached_log_value(chunk_size):
+    ma = nk.models.RBM(alpha=1, param_dtype=complex)
+    sa = nk.sampler.MetropolisLocal(hilbert=hi, n_chains=16)
+    vs = nk.vqs.MCState(sa, ma, n_samples=512, seed=SEED, sampler_seed=SEED)
+    vs.chunk_size = chunk_size
+
+    op = operators["operator:(IsingJax)"]
+    O_loc = vs.local_estimators(op)
+    σ = vs.samples
+    np.testing.assert_allclose(
+        vs._get_samples_log_value(),
+        vs.log_value(σ.reshape(-1, hi.size)).reshape(σ.shape[:-1]),
+        rtol=1e-10,
+    )
+
+    σ = σ.reshape(-1, hi.size)
+    σp, mels = op.get_conn_padded(σ)
+    O_loc_ref = jnp.sum(
+        mels * jnp.exp(vs.log_value(σp) - vs.log_value(σ)[:, None]), axis=-1
+    )
+    np.testing.assert_allclose(O_loc.reshape(-1), O_loc_ref, rtol=1e-10)
+
+    # The gradient of non-hermitian operators differentiates the local kernel
+    op = nk.operator.spin.sigmap(hi, 0).to_jax_operator()
+    _, O_grad = vs.expect_and_grad(op)
+    vs._samples_log_value = None
+    vs.unique_connected_fraction = 1.0
+    _, O_grad_ref = vs.expect_and_grad(op)
+    jax.tree_util.tree_map(
+        partial(np.testing.assert_allclose, rtol=1e-8, atol=1e-12),
+        O_grad,
+        O_grad_ref,
+    )
+
+
+@common.skipif_sharding
+@pytest.mark.parametrize("chunk_size", [None, 4])
+def test_prefetch_connected_elements(chunk_size):
+    ma = nk.models.RBM(alpha=1, param_dtype=complex)
+    sa = nk.sampler.MetropolisLocal(hilbert=hi, n_chains=16)
+    vs = nk.vqs.MCState(sa, ma, n_samples=512, seed=SEED, sampler_seed=SEED)
+    vs.chunk_size = chunk_size
+
+    op = operators["operator:(Hermitian Complex)"]
+    # the number of connected configurations depends on the samples, so the
+    # segments might need to be padded
+    op_nh = operators["operator:(Non Hermitian)"]
+    vs.prefetch_operators = [op, op_nh]
+    # uneven segments
+    vs.prefetch_n_chunks = 3
+    vs.sample()
+    assert vs.samples.shape == (16, 32, hi.size)
+    assert len(vs._prefetched_conn) == 2
+
+    O_loc = vs.local_estimators(op_nh)
+    O, O_grad = vs.expect_and_grad(op)
+
+    # expect_multiple must not recompute the prefetched connected elements
+    for _, future in vs._prefetched_conn:
+        future.result()
+    with patch.object(type(op), "get_conn_padded", side_effect=AssertionError):
+        O_multiple = vs.expect_multiple([op, op_nh])
+
+    # the same samples without prefetching
+    vs.prefetch_operators = None
+    O_loc_ref = vs.local_estimators(op_nh)
+    O_ref, O_grad_ref = vs.expect_and_grad(op)
+    O_multiple_ref = vs.expect_multiple([op, op_nh])
+
+    np.testing.assert_allclose(O_loc, O_loc_ref, rtol=1e-10)
+    np.testing.assert_allclose(O.mean, O_ref.mean, rtol=1e-10)
+    for O_i, O_i_ref in zip(O_multiple, O_multiple_ref):
+        np.testing.assert_allclose(O_i.mean, O_i_ref.mean, rtol=1e-10)
+    jax.tree_util.tree_map(
+        partial(np.testing.assert_allclose, rtol=1e-8, atol=1e-12),
+        O_grad,
+        O_grad_ref,
+    )
+
+    with pytest.raises(TypeError):
+        vs.prefetch_operators = op.to_jax_operator()
+    with pytest.raises(ValueError):
+        vs.prefetch_n_chunks = 0
+
+
 # Have a different test because the above is marked as xfail.
 # This only checks that the code runs.
 def test_expect_grad_nonhermitian_works(vstate):
@@ -61,6 +61,8 @@ jump_ops = [nk.operator.spin.sigmam(hi, i) for i in range(L)]
 
 liouv = nk.operator.LocalLiouvillian(ha.to_local_operator(), jump_ops)
 LdagL = liouv.H @ liouv
+liouv_jax = liouv.to_jax_operator()
+LdagL_jax = liouv_jax.H @ liouv_jax
 
 # operators["operator:(Lind)"] = liouv
 operators["operator:(Lind^2)"] = LdagL
@@ -68,6 +70,7 @@ operators["operator:H"] = ha
 operators["operator:sigmam"] = jump_ops[0]
 
 superoperators["superop:(Lind^2)"] = LdagL
+superoperators["superop:(Lind^2)Jax"] = LdagL_jax
 
 
 @pytest.fixture(params=[pytest.param(ma, id=name) for name, ma in machines.items()])